@@ -12,6 +12,7 @@ from supervision.annotators.core import (
     BoxCornerAnnotator,
     CircleAnnotator,
     ColorAnnotator,
+    CompositeAnnotator,
     DotAnnotator,
     EllipseAnnotator,
     HaloAnnotator,
@@ -31,14 +32,23 @@ from supervision.dataset.core import (
     DetectionDataset,
 )
 from supervision.detection.annotate import BoxAnnotator
+from supervision.detection.batch import DetectionsBatch
 from supervision.detection.core import Detections
 from supervision.detection.line_counter import LineZone, LineZoneAnnotator
+from supervision.detection.mask import CompressedMask, CroppedMask
+from supervision.detection.tools.detections_builder import DetectionsBuilder
+from supervision.detection.tools.detections_file import (
+    DetectionsReader,
+    DetectionsSink,
+)
 from supervision.detection.tools.inference_slicer import InferenceSlicer
 from supervision.detection.tools.polygon_zone import PolygonZone, PolygonZoneAnnotator
 from supervision.detection.utils import (
     box_iou_batch,
+    box_iou_batch_sparse,
     calculate_masks_centroids,
     filter_polygons_by_area,
+    mask_non_max_suppression,
     mask_to_polygons,
     mask_to_xyxy,
     move_boxes,
@@ -62,13 +72,32 @@ from supervision.geometry.core import Point, Position, Rect
 from supervision.geometry.utils import get_polygon_center
 from supervision.metrics.detection import ConfusionMatrix, MeanAveragePrecision
 from supervision.tracker.byte_tracker.core import ByteTrack
+from supervision.utils.dtype import (
+    DTypePolicy,
+    dtype_policy,
+    get_dtype_policy,
+    set_dtype_policy,
+)
 from supervision.utils.file import list_files_with_extensions
 from supervision.utils.image import ImageSink, crop_image
 from supervision.utils.notebook import plot_image, plot_images_grid
+from supervision.utils.profiler import Profiler, ProfileReport, StageStats
+from supervision.utils.tracing import Tracer, disable_tracing, enable_tracing, tracing
 from supervision.utils.video import (
+    FFmpegVideoSink,
     FPSMonitor,
+    LatestFrameReader,
+    MultiSourceVideoReader,
+    ScaledFrame,
+    ScaleTransform,
     VideoInfo,
+    VideoKeyframeIndex,
     VideoSink,
+    VideoSourceStats,
+    get_video_frames_at,
+    get_video_frames_batch_generator,
     get_video_frames_generator,
+    get_video_scaled_frames_generator,
     process_video,
+    process_video_in_segments,
 )
@@ -1,16 +1,135 @@
 from math import sqrt
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
 from supervision.annotators.base import BaseAnnotator
-from supervision.annotators.utils import ColorLookup, Trace, resolve_color
+from supervision.annotators.utils import (
+    ColorLookup,
+    Trace,
+    resolve_color,
+    resolve_color_indices,
+)
 from supervision.detection.core import Detections
+from supervision.detection.mask import BaseMask
 from supervision.detection.utils import clip_boxes, mask_to_polygons
 from supervision.draw.color import Color, ColorPalette
 from supervision.draw.utils import draw_polygon
 from supervision.geometry.core import Position
+from supervision.utils.tracing import traced
+
+
+def _area_descending_order(detections: Detections) -> np.ndarray:
+    """
+    Returns the indices of the detections sorted by decreasing area, cached on
+    `detections` so that all mask annotators share one sort.
+    """
+    return detections._get_cached(
+        "area_descending_order", lambda: np.flip(np.argsort(detections.area))
+    )
+
+
+def _boxes_bounding_box(
+    xyxy: np.ndarray, resolution_wh: Tuple[int, int]
+) -> Tuple[int, int, int, int]:
+    """
+    Returns the `[x1, y1, x2, y2)` region of the image touched by filled
+    `cv2.rectangle` calls with the given integer corners.
+    """
+    if len(xyxy) == 0:
+        return 0, 0, 0, 0
+    top_left = np.minimum(xyxy[:, :2], xyxy[:, 2:]).min(axis=0)
+    bottom_right = np.maximum(xyxy[:, :2], xyxy[:, 2:]).max(axis=0) + 1
+    x1, y1 = np.clip(top_left, 0, resolution_wh)
+    x2, y2 = np.clip(bottom_right, 0, resolution_wh)
+    return int(x1), int(y1), int(x2), int(y2)
+
+
+def _masks_bounding_box(mask: Union[np.ndarray, BaseMask]) -> Tuple[int, int, int, int]:
+    """
+    Returns the `[x1, y1, x2, y2)` region containing all pixels of all masks.
+    """
+    if isinstance(mask, BaseMask):
+        x1, y1, x2, y2 = mask.shape[2], mask.shape[1], 0, 0
+        for index in range(len(mask)):
+            crop, (x, y) = mask.crop(index)
+            if crop.any():
+                x1, y1 = min(x1, x), min(y1, y)
+                x2, y2 = max(x2, x + crop.shape[1]), max(y2, y + crop.shape[0])
+        return x1, y1, x2, y2
+
+    union = np.any(mask, axis=0)
+    rows, columns = np.flatnonzero(union.any(axis=1)), np.flatnonzero(union.any(axis=0))
+    if len(rows) == 0:
+        return 0, 0, 0, 0
+    return int(columns[0]), int(rows[0]), int(columns[-1]) + 1, int(rows[-1]) + 1
+
+
+class _Overlay(NamedTuple):
+    """
+    The layer a blending annotator paints over the region of the scene at `(x, y)`
+    before blending it with the scene, and the pixels it painted.
+    """
+
+    x: int
+    y: int
+    layer: np.ndarray
+    touched: Optional[np.ndarray]
+
+
+def _blend_overlays(
+    scene: np.ndarray, overlays: List[_Overlay], opacity: float
+) -> np.ndarray:
+    """
+    Blends into `scene`, in place, the overlays of consecutive annotators with the
+    same opacity, painted over the same scene. The result is identical to blending
+    them one after another: pixels painted by a single overlay are blended once in
+    a merged layer, only pixels painted by several overlays are blended repeatedly.
+    """
+    if len(overlays) == 1:
+        x, y, layer, _ = overlays[0]
+        region = scene[y : y + layer.shape[0], x : x + layer.shape[1]]
+        region[:] = cv2.addWeighted(layer, opacity, region, 1 - opacity, 0)
+        return scene
+
+    x1 = min(overlay.x for overlay in overlays)
+    y1 = min(overlay.y for overlay in overlays)
+    x2 = max(overlay.x + overlay.layer.shape[1] for overlay in overlays)
+    y2 = max(overlay.y + overlay.layer.shape[0] for overlay in overlays)
+    region = scene[y1:y2, x1:x2]
+    merged = region.copy()
+    counts = np.zeros(region.shape[:2], dtype=np.int32)
+    for x, y, layer, touched in overlays:
+        window = np.s_[
+            y - y1 : y - y1 + layer.shape[0], x - x1 : x - x1 + layer.shape[1]
+        ]
+        merged[window][touched] = layer[touched]
+        counts[window] += touched
+    blended = cv2.addWeighted(merged, opacity, region, 1 - opacity, 0)
+
+    ys, xs = np.nonzero(counts > 1)
+    if len(ys) > 0:
+        values = region[ys, xs]
+        for x, y, layer, touched in overlays:
+            rows, columns = ys - (y - y1), xs - (x - x1)
+            inside = (
+                (rows >= 0)
+                & (rows < layer.shape[0])
+                & (columns >= 0)
+                & (columns < layer.shape[1])
+            )
+            hit = np.flatnonzero(inside)
+            hit = hit[touched[rows[hit], columns[hit]]]
+            if len(hit) == 0:
+                continue
+            values[hit] = cv2.addWeighted(
+                layer[rows[hit], columns[hit]], opacity, values[hit], 1 - opacity, 0
+            )
+        blended[ys, xs] = values
+
+    region[:] = blended
+    return scene
 
 
 class BoundingBoxAnnotator(BaseAnnotator):
@@ -36,6 +155,7 @@ class BoundingBoxAnnotator(BaseAnnotator):
         self.thickness: int = thickness
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -78,8 +198,8 @@ class BoundingBoxAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             cv2.rectangle(
                 img=scene,
@@ -118,6 +238,7 @@ class MaskAnnotator(BaseAnnotator):
         self.opacity = opacity
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -156,22 +277,56 @@ class MaskAnnotator(BaseAnnotator):
         if detections.mask is None:
             return scene
 
-        colored_mask = np.array(scene, copy=True, dtype=np.uint8)
+        result = np.array(scene, copy=True, dtype=np.uint8)
+        overlay = self._overlay(
+            scene=result,
+            detections=detections,
+            custom_color_lookup=custom_color_lookup,
+        )
+        if overlay is None:
+            return result
+        return _blend_overlays(scene=result, overlays=[overlay], opacity=self.opacity)
 
-        for detection_idx in np.flip(np.argsort(detections.area)):
+    def _overlay(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        custom_color_lookup: Optional[np.ndarray] = None,
+        with_touched: bool = False,
+    ) -> Optional[_Overlay]:
+        if detections.mask is None:
+            return None
+        x1, y1, x2, y2 = _masks_bounding_box(detections.mask)
+        if x1 >= x2 or y1 >= y2:
+            return None
+
+        # pixels outside of all masks are left unchanged by the blend, so only the
+        # region containing the masks is painted
+        colored_mask = scene[y1:y2, x1:x2].copy()
+        touched = np.zeros(colored_mask.shape[:2], dtype=bool) if with_touched else None
+        for detection_idx in _area_descending_order(detections):
             color = resolve_color(
                 color=self.color,
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
-            mask = detections.mask[detection_idx]
-            colored_mask[mask] = color.as_bgr()
-
-        scene = cv2.addWeighted(colored_mask, self.opacity, scene, 1 - self.opacity, 0)
-        return scene.astype(np.uint8)
+            if isinstance(detections.mask, BaseMask):
+                crop, (x, y) = detections.mask.crop(detection_idx)
+                window = np.s_[
+                    y - y1 : y - y1 + crop.shape[0], x - x1 : x - x1 + crop.shape[1]
+                ]
+                colored_mask[window][crop] = color.as_bgr()
+                if touched is not None:
+                    touched[window] |= crop
+            else:
+                mask = detections.mask[detection_idx][y1:y2, x1:x2]
+                colored_mask[mask] = color.as_bgr()
+                if touched is not None:
+                    touched |= mask
+        return _Overlay(x=x1, y=y1, layer=colored_mask, touched=touched)
 
 
 class PolygonAnnotator(BaseAnnotator):
@@ -201,6 +356,7 @@ class PolygonAnnotator(BaseAnnotator):
         self.thickness: int = thickness
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -246,8 +402,8 @@ class PolygonAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             for polygon in mask_to_polygons(mask=mask):
                 scene = draw_polygon(
@@ -283,6 +439,7 @@ class ColorAnnotator(BaseAnnotator):
         self.color_lookup: ColorLookup = color_lookup
         self.opacity = opacity
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -318,28 +475,56 @@ class ColorAnnotator(BaseAnnotator):
         ![box-mask-annotator-example](https://media.roboflow.com/
         supervision-annotator-examples/box-mask-annotator-example-purple.png)
         """
-        mask_image = scene.copy()
+        overlay = self._overlay(
+            scene=scene,
+            detections=detections,
+            custom_color_lookup=custom_color_lookup,
+        )
+        if overlay is None:
+            return scene
+        return _blend_overlays(scene=scene, overlays=[overlay], opacity=self.opacity)
+
+    def _overlay(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        custom_color_lookup: Optional[np.ndarray] = None,
+        with_touched: bool = False,
+    ) -> Optional[_Overlay]:
+        x1, y1, x2, y2 = _boxes_bounding_box(
+            xyxy=detections.xyxy.astype(int), resolution_wh=scene.shape[1::-1]
+        )
+        if x1 >= x2 or y1 >= y2:
+            return None
+
+        # pixels outside of all boxes are left unchanged by the blend, so only the
+        # region containing the boxes is painted
+        mask_image = scene[y1:y2, x1:x2].copy()
+        touched = (
+            np.zeros(mask_image.shape[:2], dtype=np.uint8) if with_touched else None
+        )
         for detection_idx in range(len(detections)):
-            x1, y1, x2, y2 = detections.xyxy[detection_idx].astype(int)
+            box_x1, box_y1, box_x2, box_y2 = detections.xyxy[detection_idx].astype(int)
             color = resolve_color(
                 color=self.color,
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
-            cv2.rectangle(
-                img=scene,
-                pt1=(x1, y1),
-                pt2=(x2, y2),
-                color=color.as_bgr(),
-                thickness=-1,
+            corners = dict(
+                pt1=(box_x1 - x1, box_y1 - y1), pt2=(box_x2 - x1, box_y2 - y1)
             )
-        scene = cv2.addWeighted(
-            scene, self.opacity, mask_image, 1 - self.opacity, gamma=0
+            cv2.rectangle(img=mask_image, color=color.as_bgr(), thickness=-1, **corners)
+            if touched is not None:
+                cv2.rectangle(img=touched, color=1, thickness=-1, **corners)
+        return _Overlay(
+            x=x1,
+            y=y1,
+            layer=mask_image,
+            touched=None if touched is None else touched.view(bool),
         )
-        return scene
 
 
 class HaloAnnotator(BaseAnnotator):
@@ -373,6 +558,7 @@ class HaloAnnotator(BaseAnnotator):
         self.color_lookup: ColorLookup = color_lookup
         self.kernel_size: int = kernel_size
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -415,23 +601,31 @@ class HaloAnnotator(BaseAnnotator):
             scene.shape[0], scene.shape[1]
         )
 
-        for detection_idx in np.flip(np.argsort(detections.area)):
+        for detection_idx in _area_descending_order(detections):
             color = resolve_color(
                 color=self.color,
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
-            mask = detections.mask[detection_idx]
-            fmask = np.logical_or(fmask, mask)
             color_bgr = color.as_bgr()
-            colored_mask[mask] = color_bgr
+            if isinstance(detections.mask, BaseMask):
+                crop, (x, y) = detections.mask.crop(detection_idx)
+                region = np.s_[y : y + crop.shape[0], x : x + crop.shape[1]]
+                fmask[region] |= crop
+                colored_mask[region][crop] = color_bgr
+            else:
+                mask = detections.mask[detection_idx]
+                fmask = np.logical_or(fmask, mask)
+                colored_mask[mask] = color_bgr
 
         colored_mask = cv2.blur(colored_mask, (self.kernel_size, self.kernel_size))
         colored_mask[fmask] = [0, 0, 0]
         gray = cv2.cvtColor(colored_mask, cv2.COLOR_BGR2GRAY)
+        if gray.max() == 0:
+            return scene
         alpha = self.opacity * gray / gray.max()
         alpha_mask = alpha[:, :, np.newaxis]
         scene = np.uint8(scene * (1 - alpha_mask) + colored_mask * self.opacity)
@@ -467,6 +661,7 @@ class EllipseAnnotator(BaseAnnotator):
         self.end_angle: int = end_angle
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -509,8 +704,8 @@ class EllipseAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             center = (int((x1 + x2) / 2), y2)
             width = x2 - x1
@@ -554,6 +749,7 @@ class BoxCornerAnnotator(BaseAnnotator):
         self.corner_length: int = corner_length
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -596,8 +792,8 @@ class BoxCornerAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             corners = [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]
 
@@ -638,6 +834,7 @@ class CircleAnnotator(BaseAnnotator):
         self.thickness: int = thickness
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -683,8 +880,8 @@ class CircleAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             cv2.circle(
                 img=scene,
@@ -724,6 +921,7 @@ class DotAnnotator(BaseAnnotator):
         self.position: Position = position
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -766,8 +964,8 @@ class DotAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             center = (int(xy[detection_idx, 0]), int(xy[detection_idx, 1]))
             cv2.circle(scene, center, self.radius, color.as_bgr(), -1)
@@ -849,6 +1047,7 @@ class LabelAnnotator:
                 center_y + text_h,
             )
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -896,8 +1095,8 @@ class LabelAnnotator:
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             text = (
                 f"{detections.class_id[detection_idx]}"
@@ -953,6 +1152,7 @@ class BlurAnnotator(BaseAnnotator):
         """
         self.kernel_size: int = kernel_size
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -1034,6 +1234,7 @@ class TraceAnnotator:
         self.thickness = thickness
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -1089,8 +1290,8 @@ class TraceAnnotator:
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             xy = self.trace.get(tracker_id=tracker_id)
             if len(xy) > 1:
@@ -1138,6 +1339,7 @@ class HeatMapAnnotator:
         self.top_hue = top_hue
         self.low_hue = low_hue
 
+    @traced
     def annotate(self, scene: np.ndarray, detections: Detections) -> np.ndarray:
         """
         Annotates the scene with a heatmap based on the provided detections.
@@ -1210,6 +1412,7 @@ class PixelateAnnotator(BaseAnnotator):
         """
         self.pixel_size: int = pixel_size
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -1294,6 +1497,7 @@ class TriangleAnnotator(BaseAnnotator):
         self.position: Position = position
         self.color_lookup: ColorLookup = color_lookup
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
@@ -1336,8 +1540,8 @@ class TriangleAnnotator(BaseAnnotator):
                 detections=detections,
                 detection_idx=detection_idx,
                 color_lookup=self.color_lookup
-                if custom_color_lookup is None
-                else custom_color_lookup,
+                    if custom_color_lookup is None
+                    else custom_color_lookup,
             )
             tip_x, tip_y = int(xy[detection_idx, 0]), int(xy[detection_idx, 1])
             vertices = np.array(
@@ -1352,3 +1556,125 @@ class TriangleAnnotator(BaseAnnotator):
             cv2.fillPoly(scene, [vertices], color.as_bgr())
 
         return scene
+
+
+class CompositeAnnotator:
+    """
+    Applies several annotators to the same scene, in order, sharing the work they
+    have in common. The color indices of every `ColorLookup` strategy and the
+    drawing order of masks are computed once per frame. Consecutive
+    `MaskAnnotator` and `ColorAnnotator` instances with the same opacity paint
+    into one layer that is blended with the scene in a single pass.
+
+    The result is identical to calling the annotators one after another.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> annotator = sv.CompositeAnnotator(
+        ...     annotators=[
+        ...         sv.MaskAnnotator(),
+        ...         sv.ColorAnnotator(),
+        ...         sv.BoundingBoxAnnotator(),
+        ...         sv.LabelAnnotator(),
+        ...     ]
+        ... )
+        >>> annotated_frame = annotator.annotate(
+        ...     scene=image.copy(),
+        ...     detections=detections,
+        ...     labels=labels
+        ... )
+        ```
+    """
+
+    def __init__(self, annotators: List[Any]):
+        """
+        Args:
+            annotators (List[Any]): The annotators to apply, in drawing order.
+        """
+        self.annotators = annotators
+
+    @traced
+    def annotate(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        labels: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """
+        Annotates the scene with all annotators.
+
+        Args:
+            scene (np.ndarray): The image where the annotations will be drawn.
+            detections (Detections): Object detections to annotate.
+            labels (Optional[List[str]]): Labels passed to every `LabelAnnotator`.
+
+        Returns:
+            np.ndarray: The annotated image.
+        """
+        blended: List[Union[MaskAnnotator, ColorAnnotator]] = []
+        for annotator in self.annotators:
+            if blended and (
+                not isinstance(annotator, (MaskAnnotator, ColorAnnotator))
+                or annotator.opacity != blended[0].opacity
+            ):
+                scene = self._blend(scene=scene, detections=detections, run=blended)
+                blended = []
+            if isinstance(annotator, (MaskAnnotator, ColorAnnotator)):
+                blended.append(annotator)
+                continue
+
+            kwargs = self._color_lookup_kwargs(annotator, detections)
+            if isinstance(annotator, LabelAnnotator):
+                kwargs["labels"] = labels
+            scene = annotator.annotate(scene=scene, detections=detections, **kwargs)
+        if blended:
+            scene = self._blend(scene=scene, detections=detections, run=blended)
+        return scene
+
+    @staticmethod
+    def _color_lookup_kwargs(annotator: Any, detections: Detections) -> dict:
+        color_lookup = getattr(annotator, "color_lookup", None)
+        if isinstance(color_lookup, ColorLookup) and len(detections) > 0:
+            return {
+                "custom_color_lookup": resolve_color_indices(
+                    detections=detections, color_lookup=color_lookup
+                )
+            }
+        return {}
+
+    def _blend(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        run: List[Union[MaskAnnotator, ColorAnnotator]],
+    ) -> np.ndarray:
+        """
+        Applies consecutive annotators with the same opacity, painting all of them
+        over the scene as it was before the first one and blending once.
+        """
+        if len(run) == 1:
+            return run[0].annotate(
+                scene=scene,
+                detections=detections,
+                **self._color_lookup_kwargs(run[0], detections),
+            )
+
+        if detections.mask is not None and any(
+            isinstance(annotator, MaskAnnotator) for annotator in run
+        ):
+            scene = np.array(scene, copy=True, dtype=np.uint8)
+        overlays = [
+            annotator._overlay(
+                scene=scene,
+                detections=detections,
+                with_touched=True,
+                **self._color_lookup_kwargs(annotator, detections),
+            )
+            for annotator in run
+        ]
+        overlays = [overlay for overlay in overlays if overlay is not None]
+        if not overlays:
+            return scene
+        return _blend_overlays(scene=scene, overlays=overlays, opacity=run[0].opacity)
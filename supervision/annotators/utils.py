@@ -37,30 +37,47 @@ def resolve_color_idx(
             f"Detection index {detection_idx}"
             f"is out of bounds for detections of length {len(detections)}"
         )
+    return resolve_color_indices(detections=detections, color_lookup=color_lookup)[
+        detection_idx
+    ]
 
+
+def resolve_color_indices(
+    detections: Detections,
+    color_lookup: Union[ColorLookup, np.ndarray] = ColorLookup.CLASS,
+) -> np.ndarray:
+    """
+    Resolves the color index of every detection at once. The result for a
+    `ColorLookup` strategy is cached on `detections`, so all annotators sharing the
+    same detections resolve it only once.
+    """
     if isinstance(color_lookup, np.ndarray):
         if len(color_lookup) != len(detections):
             raise ValueError(
                 f"Length of color lookup {len(color_lookup)}"
                 f"does not match length of detections {len(detections)}"
             )
-        return color_lookup[detection_idx]
-    elif color_lookup == ColorLookup.INDEX:
-        return detection_idx
-    elif color_lookup == ColorLookup.CLASS:
-        if detections.class_id is None:
-            raise ValueError(
-                "Could not resolve color by class because"
-                "Detections do not have class_id"
-            )
-        return detections.class_id[detection_idx]
-    elif color_lookup == ColorLookup.TRACK:
-        if detections.tracker_id is None:
-            raise ValueError(
-                "Could not resolve color by track because"
-                "Detections do not have tracker_id"
-            )
-        return detections.tracker_id[detection_idx]
+        return color_lookup
+
+    def calculate() -> np.ndarray:
+        if color_lookup == ColorLookup.INDEX:
+            return np.arange(len(detections))
+        elif color_lookup == ColorLookup.CLASS:
+            if detections.class_id is None:
+                raise ValueError(
+                    "Could not resolve color by class because"
+                    "Detections do not have class_id"
+                )
+            return np.array(detections.class_id)
+        elif color_lookup == ColorLookup.TRACK:
+            if detections.tracker_id is None:
+                raise ValueError(
+                    "Could not resolve color by track because"
+                    "Detections do not have tracker_id"
+                )
+            return np.array(detections.tracker_id)
+
+    return detections._get_cached(("color_indices", color_lookup), calculate)
 
 
 def get_color_by_index(color: Union[Color, ColorPalette], idx: int) -> Color:
@@ -267,6 +267,7 @@ class DetectionDataset(BaseDataset):
         annotations_directory_path: str,
         data_yaml_path: str,
         force_masks: bool = False,
+        crop_masks: bool = False,
     ) -> DetectionDataset:
         """
         Creates a Dataset instance from YOLO formatted data.
@@ -281,6 +282,9 @@ class DetectionDataset(BaseDataset):
             force_masks (bool, optional): If True, forces
                 masks to be loaded for all annotations,
                 regardless of whether they are present.
+            crop_masks (bool, optional): If True, masks are stored as
+                a `CroppedMask` aligned to the object boxes instead of
+                full-resolution planes.
 
         Returns:
             DetectionDataset: A DetectionDataset instance
@@ -314,6 +318,7 @@ class DetectionDataset(BaseDataset):
             annotations_directory_path=annotations_directory_path,
             data_yaml_path=data_yaml_path,
             force_masks=force_masks,
+            crop_masks=crop_masks,
         )
         return DetectionDataset(classes=classes, images=images, annotations=annotations)
 
@@ -376,6 +381,7 @@ class DetectionDataset(BaseDataset):
         images_directory_path: str,
         annotations_path: str,
         force_masks: bool = False,
+        crop_masks: bool = False,
     ) -> DetectionDataset:
         """
         Creates a Dataset instance from COCO formatted data.
@@ -387,6 +393,9 @@ class DetectionDataset(BaseDataset):
             force_masks (bool, optional): If True,
                 forces masks to be loaded for all annotations,
                 regardless of whether they are present.
+            crop_masks (bool, optional): If True, masks are stored as
+                a `CroppedMask` aligned to the object boxes instead of
+                full-resolution planes.
 
         Returns:
             DetectionDataset: A DetectionDataset instance containing
@@ -418,6 +427,7 @@ class DetectionDataset(BaseDataset):
             images_directory_path=images_directory_path,
             annotations_path=annotations_path,
             force_masks=force_masks,
+            crop_masks=crop_masks,
         )
         return DetectionDataset(classes=classes, images=images, annotations=annotations)
 
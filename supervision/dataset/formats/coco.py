@@ -1,7 +1,7 @@
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import cv2
 import numpy as np
@@ -11,6 +11,7 @@ from supervision.dataset.utils import (
     map_detections_class_id,
 )
 from supervision.detection.core import Detections
+from supervision.detection.mask import CroppedMask
 from supervision.detection.utils import polygon_to_mask
 from supervision.utils.file import read_json_file, save_json_file
 
@@ -58,8 +59,10 @@ def group_coco_annotations_by_image_id(
 
 
 def _polygons_to_masks(
-    polygons: List[np.ndarray], resolution_wh: Tuple[int, int]
-) -> np.ndarray:
+    polygons: List[np.ndarray], resolution_wh: Tuple[int, int], crop_masks: bool = False
+) -> Union[np.ndarray, CroppedMask]:
+    if crop_masks:
+        return CroppedMask.from_polygons(polygons=polygons, resolution_wh=resolution_wh)
     return np.array(
         [
             polygon_to_mask(polygon=polygon, resolution_wh=resolution_wh)
@@ -70,7 +73,10 @@ def _polygons_to_masks(
 
 
 def coco_annotations_to_detections(
-    image_annotations: List[dict], resolution_wh: Tuple[int, int], with_masks: bool
+    image_annotations: List[dict],
+    resolution_wh: Tuple[int, int],
+    with_masks: bool,
+    crop_masks: bool = False,
 ) -> Detections:
     if not image_annotations:
         return Detections.empty()
@@ -89,7 +95,9 @@ def coco_annotations_to_detections(
             )
             for image_annotation in image_annotations
         ]
-        mask = _polygons_to_masks(polygons=polygons, resolution_wh=resolution_wh)
+        mask = _polygons_to_masks(
+            polygons=polygons, resolution_wh=resolution_wh, crop_masks=crop_masks
+        )
         return Detections(
             class_id=np.asarray(class_ids, dtype=int), xyxy=xyxy, mask=mask
         )
@@ -136,6 +144,7 @@ def load_coco_annotations(
     images_directory_path: str,
     annotations_path: str,
     force_masks: bool = False,
+    crop_masks: bool = False,
 ) -> Tuple[List[str], Dict[str, np.ndarray], Dict[str, Detections]]:
     coco_data = read_json_file(file_path=annotations_path)
     classes = coco_categories_to_classes(coco_categories=coco_data["categories"])
@@ -164,6 +173,7 @@ def load_coco_annotations(
             image_annotations=image_annotations,
             resolution_wh=(image_width, image_height),
             with_masks=force_masks,
+            crop_masks=crop_masks,
         )
         annotation = map_detections_class_id(
             source_to_target_mapping=class_index_mapping,
@@ -1,12 +1,13 @@
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
 from supervision.dataset.utils import approximate_mask_with_polygons
 from supervision.detection.core import Detections
+from supervision.detection.mask import CroppedMask
 from supervision.detection.utils import polygon_to_mask, polygon_to_xyxy
 from supervision.utils.file import (
     list_files_with_extensions,
@@ -41,8 +42,10 @@ def _parse_polygon(values: List[str]) -> np.ndarray:
 
 
 def _polygons_to_masks(
-    polygons: List[np.ndarray], resolution_wh: Tuple[int, int]
-) -> np.ndarray:
+    polygons: List[np.ndarray], resolution_wh: Tuple[int, int], crop_masks: bool = False
+) -> Union[np.ndarray, CroppedMask]:
+    if crop_masks:
+        return CroppedMask.from_polygons(polygons=polygons, resolution_wh=resolution_wh)
     return np.array(
         [
             polygon_to_mask(polygon=polygon, resolution_wh=resolution_wh)
@@ -70,7 +73,10 @@ def _image_name_to_annotation_name(image_name: str) -> str:
 
 
 def yolo_annotations_to_detections(
-    lines: List[str], resolution_wh: Tuple[int, int], with_masks: bool
+    lines: List[str],
+    resolution_wh: Tuple[int, int],
+    with_masks: bool,
+    crop_masks: bool = False,
 ) -> Detections:
     if len(lines) == 0:
         return Detections.empty()
@@ -101,7 +107,9 @@ def yolo_annotations_to_detections(
     polygons = [
         (polygon * np.array(resolution_wh)).astype(int) for polygon in relative_polygon
     ]
-    mask = _polygons_to_masks(polygons=polygons, resolution_wh=resolution_wh)
+    mask = _polygons_to_masks(
+        polygons=polygons, resolution_wh=resolution_wh, crop_masks=crop_masks
+    )
     return Detections(class_id=class_id, xyxy=xyxy, mask=mask)
 
 
@@ -110,6 +118,7 @@ def load_yolo_annotations(
     annotations_directory_path: str,
     data_yaml_path: str,
     force_masks: bool = False,
+    crop_masks: bool = False,
 ) -> Tuple[List[str], Dict[str, np.ndarray], Dict[str, Detections]]:
     """
     Loads YOLO annotations and returns class names, images,
@@ -123,6 +132,8 @@ def load_yolo_annotations(
             YAML file containing class information.
         force_masks (bool, optional): If True, forces masks to be loaded
             for all annotations, regardless of whether they are present.
+        crop_masks (bool, optional): If True, masks are stored as a `CroppedMask`
+            aligned to the object boxes instead of full-resolution planes.
 
     Returns:
         Tuple[List[str], Dict[str, np.ndarray], Dict[str, Detections]]:
@@ -156,7 +167,10 @@ def load_yolo_annotations(
         with_masks = _with_mask(lines=lines)
         with_masks = force_masks if force_masks else with_masks
         annotation = yolo_annotations_to_detections(
-            lines=lines, resolution_wh=resolution_wh, with_masks=with_masks
+            lines=lines,
+            resolution_wh=resolution_wh,
+            with_masks=with_masks,
+            crop_masks=crop_masks,
         )
 
         images[image_path] = image
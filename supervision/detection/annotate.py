@@ -5,6 +5,7 @@ import numpy as np
 
 from supervision.detection.core import Detections
 from supervision.draw.color import Color, ColorPalette
+from supervision.utils.tracing import traced
 
 
 class BoxAnnotator:
@@ -40,6 +41,7 @@ class BoxAnnotator:
         self.text_thickness: int = text_thickness
         self.text_padding: int = text_padding
 
+    @traced
     def annotate(
         self,
         scene: np.ndarray,
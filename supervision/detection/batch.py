@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List, Union
+
+import numpy as np
+
+from supervision.detection.core import Detections
+from supervision.detection.utils import _box_iou_pairs, non_max_suppression
+from supervision.geometry.core import Position
+from supervision.utils.tracing import traced
+
+
+@dataclass
+class DetectionsBatch:
+    """
+    Data class containing the detections of many video frames, stored as a single
+    flat `Detections` object plus frame offsets.
+
+    Detections of frame `i` occupy rows `offsets[i]:offsets[i + 1]` of `detections`.
+    Operations such as NMS, anchor calculation, zone triggering or IoU matching run
+    once across the whole batch, and per-frame `Detections` views are created only
+    when a frame is accessed.
+
+    Attributes:
+        detections (Detections): The detections of all frames, concatenated.
+        offsets (np.ndarray): An array of shape `(B + 1,)` containing the row
+            offsets of the `B` frames within `detections`.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> results = model(frames)
+        >>> batch = sv.DetectionsBatch.from_detections_list(
+        ...     [sv.Detections.from_ultralytics(result) for result in results]
+        ... )
+        >>> batch = batch.with_nms(threshold=0.5)
+
+        >>> for detections in batch:
+        ...     ...
+        ```
+    """
+
+    detections: Detections
+    offsets: np.ndarray
+
+    def __post_init__(self):
+        self.offsets = np.asarray(self.offsets, dtype=np.int64)
+        if (
+            self.offsets.ndim != 1
+            or len(self.offsets) == 0
+            or self.offsets[0] != 0
+            or self.offsets[-1] != len(self.detections)
+            or np.any(np.diff(self.offsets) < 0)
+        ):
+            raise ValueError(
+                "offsets must be a non-decreasing 1d np.ndarray starting at 0 and "
+                f"ending at {len(self.detections)}, the number of detections."
+            )
+
+    @classmethod
+    def from_detections_list(cls, detections_list: List[Detections]) -> DetectionsBatch:
+        """
+        Creates a DetectionsBatch from a list of per-frame Detections objects.
+
+        Args:
+            detections_list (List[Detections]): The detections of consecutive frames.
+
+        Returns:
+            DetectionsBatch: A batch with one frame per element of `detections_list`.
+        """
+        counts = [len(detections) for detections in detections_list]
+        return cls(
+            detections=Detections.merge(detections_list),
+            offsets=np.concatenate([[0], np.cumsum(counts, dtype=np.int64)]),
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of frames in the batch.
+        """
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[Detections]:
+        """
+        Iterates over the frames of the batch, yielding a Detections view per frame.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: DetectionsBatch) -> bool:
+        return (
+            np.array_equal(self.offsets, other.offsets)
+            and self.detections == other.detections
+        )
+
+    def __getitem__(
+        self, index: Union[int, np.ndarray]
+    ) -> Union[Detections, DetectionsBatch]:
+        """
+        Get the detections of a single frame or a filtered batch.
+
+        Args:
+            index (Union[int, np.ndarray]): A frame index, or a boolean array of
+                shape `(N,)` selecting detections across the whole batch.
+
+        Returns:
+            (Union[Detections, DetectionsBatch]): The detections of the frame
+                if `index` is an int, otherwise a batch with the same number of
+                frames containing only the selected detections.
+
+        Example:
+            ```python
+            >>> import supervision as sv
+
+            >>> batch = sv.DetectionsBatch(...)
+
+            >>> first_frame_detections = batch[0]
+
+            >>> high_confidence_batch = batch[batch.detections.confidence > 0.5]
+            ```
+        """
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Frame index {index} out of range.")
+            start, end = self.offsets[index], self.offsets[index + 1]
+            return self.detections[int(start) : int(end)]
+
+        index = np.asarray(index)
+        if index.dtype != bool or index.shape != (len(self.detections),):
+            raise ValueError(
+                "Batch can only be indexed with a frame index or a boolean array of "
+                f"shape ({len(self.detections)},)."
+            )
+        kept = np.concatenate([[0], np.cumsum(index, dtype=np.int64)])
+        return DetectionsBatch(
+            detections=self.detections[index], offsets=kept[self.offsets]
+        )
+
+    @property
+    def frame_index(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: An array of shape `(N,)` containing the frame index of each
+                detection in the batch.
+        """
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def split(self, values: np.ndarray) -> List[np.ndarray]:
+        """
+        Splits a per-detection array, for example the output of
+        `PolygonZone.trigger`, into per-frame views.
+
+        Args:
+            values (np.ndarray): An array with one row per detection in the batch.
+
+        Returns:
+            List[np.ndarray]: A list of `B` views, one per frame.
+        """
+        return np.split(values, self.offsets[1:-1])
+
+    def get_anchors_coordinates(self, anchor: Position) -> np.ndarray:
+        """
+        Calculates the anchor coordinates of all detections in the batch at once.
+        See `Detections.get_anchors_coordinates`.
+
+        Args:
+            anchor (Position): The position of the anchor point within the boxes.
+
+        Returns:
+            np.ndarray: An array of shape `(N, 2)` containing the `[x, y]`
+                coordinates of the anchor point of each detection.
+        """
+        return self.detections.get_anchors_coordinates(anchor=anchor)
+
+    @traced
+    def with_nms(
+        self, threshold: float = 0.5, class_agnostic: bool = False
+    ) -> DetectionsBatch:
+        """
+        Perform non-maximum suppression on every frame of the batch in one call.
+        Detections from different frames never suppress each other.
+
+        Args:
+            threshold (float, optional): The intersection-over-union threshold
+                to use for non-maximum suppression. Defaults to 0.5.
+            class_agnostic (bool, optional): Whether to perform class-agnostic
+                non-maximum suppression. Defaults to False.
+
+        Returns:
+            DetectionsBatch: A new batch containing the detections kept by NMS.
+
+        Raises:
+            AssertionError: If `confidence` is None, or if `class_id` is None
+                and class_agnostic is False.
+        """
+        detections = self.detections
+        if len(detections) == 0:
+            return self
+
+        assert (
+            detections.confidence is not None
+        ), "Detections confidence must be given for NMS to be executed."
+
+        # every (frame, class) pair becomes a separate NMS category
+        category = self.frame_index
+        if not class_agnostic:
+            assert detections.class_id is not None, (
+                "Detections class_id must be given for NMS to be executed. If you"
+                " intended to perform class agnostic NMS set class_agnostic=True."
+            )
+            class_id = detections.class_id.astype(np.int64)
+            class_id = class_id - class_id.min()
+            category = category * (int(class_id.max()) + 1) + class_id
+
+        predictions = np.hstack(
+            (
+                detections.xyxy,
+                detections.confidence.reshape(-1, 1),
+                category.reshape(-1, 1),
+            )
+        )
+        keep = non_max_suppression(predictions=predictions, iou_threshold=threshold)
+        return self[keep]
+
+    def box_iou(self, other: DetectionsBatch) -> List[np.ndarray]:
+        """
+        Computes the IoU between the boxes of matching frames of two batches,
+        for example ground truth and predictions, in one vectorized call.
+        Only pairs of boxes from the same frame are evaluated.
+
+        Args:
+            other (DetectionsBatch): A batch with the same number of frames.
+
+        Returns:
+            List[np.ndarray]: A list of `B` arrays of shape `(n_i, m_i)` where
+                `n_i` and `m_i` are the numbers of detections of frame `i` in
+                `self` and `other`.
+        """
+        if len(self) != len(other):
+            raise ValueError(
+                f"Batches must have the same number of frames, got {len(self)} "
+                f"and {len(other)}."
+            )
+
+        n = np.diff(self.offsets)
+        m = np.diff(other.offsets)
+        pair_counts = n * m
+        pair_offsets = np.concatenate([[0], np.cumsum(pair_counts)])
+
+        # enumerate the (i, j) pairs of every frame without a Python loop
+        pair_frame = np.repeat(np.arange(len(self)), pair_counts)
+        local = np.arange(pair_offsets[-1]) - pair_offsets[pair_frame]
+        width = np.maximum(m, 1)[pair_frame]
+        rows = self.offsets[pair_frame] + local // width
+        columns = other.offsets[pair_frame] + local % width
+
+        ious = _box_iou_pairs(
+            self.detections.xyxy[rows], other.detections.xyxy[columns]
+        )
+
+        return [
+            chunk.reshape(n_i, m_i)
+            for chunk, n_i, m_i in zip(np.split(ious, pair_offsets[1:-1]), n, m)
+        ]
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import astuple, dataclass
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
+from supervision.detection.mask import BaseMask
+from supervision.detection.serialization import (
+    deserialize_columns,
+    serialize_columns,
+)
 from supervision.detection.utils import (
     calculate_masks_centroids,
     extract_ultralytics_masks,
+    mask_non_max_suppression,
     non_max_suppression,
     process_roboflow_result,
     xywh_to_xyxy,
 )
 from supervision.geometry.core import Position
+from supervision.utils.dtype import as_float_dtype, as_int_dtype
+from supervision.utils.tracing import traced
 
 
 def _validate_xyxy(xyxy: Any, n: int) -> None:
@@ -23,12 +31,33 @@ def _validate_xyxy(xyxy: Any, n: int) -> None:
 
 def _validate_mask(mask: Any, n: int) -> None:
     is_valid = mask is None or (
-        isinstance(mask, np.ndarray) and len(mask.shape) == 3 and mask.shape[0] == n
+        isinstance(mask, (np.ndarray, BaseMask))
+        and len(mask.shape) == 3
+        and mask.shape[0] == n
     )
     if not is_valid:
         raise ValueError("mask must be 3d np.ndarray with (n, H, W) shape")
 
 
+def merge_masks(
+    masks_list: List[Optional[Union[np.ndarray, BaseMask]]],
+) -> Optional[Union[np.ndarray, BaseMask]]:
+    """
+    Concatenates masks of several Detections objects. Returns None if any of them is
+    None. Mask stores of the same type are merged without decoding, otherwise all
+    masks are concatenated as dense arrays.
+    """
+    if len(masks_list) == 0 or any(masks is None for masks in masks_list):
+        return None
+
+    mask_type = type(masks_list[0])
+    if issubclass(mask_type, BaseMask) and all(
+        type(masks) is mask_type for masks in masks_list
+    ):
+        return mask_type.merge(masks_list)
+    return np.concatenate([np.asarray(masks) for masks in masks_list])
+
+
 def validate_inference_callback(callback) -> None:
     tmp_img = np.zeros((256, 256, 3), dtype=np.uint8)
     res = callback(tmp_img)
@@ -68,18 +97,25 @@ class Detections:
     Attributes:
         xyxy (np.ndarray): An array of shape `(n, 4)` containing
             the bounding boxes coordinates in format `[x1, y1, x2, y2]`
-        mask: (Optional[np.ndarray]): An array of shape
-            `(n, H, W)` containing the segmentation masks.
+        mask: (Optional[Union[np.ndarray, BaseMask]]): An array of shape
+            `(n, H, W)` containing the segmentation masks. A `CompressedMask` or
+            a `CroppedMask` can be used instead of a dense array to reduce memory
+            usage.
         confidence (Optional[np.ndarray]): An array of shape
             `(n,)` containing the confidence scores of the detections.
         class_id (Optional[np.ndarray]): An array of shape
             `(n,)` containing the class ids of the detections.
         tracker_id (Optional[np.ndarray]): An array of shape
             `(n,)` containing the tracker ids of the detections.
+
+    Note:
+        When a dtype policy is set with `sv.set_dtype_policy`, `xyxy` and
+        `confidence` are cast to its float dtype and `class_id` and `tracker_id`
+        to its int dtype whenever they are assigned.
     """
 
     xyxy: np.ndarray
-    mask: Optional[np.ndarray] = None
+    mask: Optional[Union[np.ndarray, BaseMask]] = None
     confidence: Optional[np.ndarray] = None
     class_id: Optional[np.ndarray] = None
     tracker_id: Optional[np.ndarray] = None
@@ -92,6 +128,30 @@ class Detections:
         _validate_confidence(confidence=self.confidence, n=n)
         _validate_tracker_id(tracker_id=self.tracker_id, n=n)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # reassigning any attribute invalidates the cached derived values
+        self.__dict__.pop("_cache", None)
+        if isinstance(value, np.ndarray):
+            if name in ("xyxy", "confidence"):
+                value = as_float_dtype(value)
+            elif name in ("class_id", "tracker_id"):
+                value = as_int_dtype(value)
+        super().__setattr__(name, value)
+
+    def _get_cached(self, key: Any, calculate: Callable[[], Any]) -> Any:
+        """
+        Returns the derived value stored under `key`, calculating it on first use.
+        Cached arrays are shared between all internal consumers, so they are
+        read-only. Public accessors return copies of them.
+        """
+        cache = self.__dict__.setdefault("_cache", {})
+        if key not in cache:
+            value = calculate()
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            cache[key] = value
+        return cache[key]
+
     def __len__(self):
         """
         Returns the number of detections in the Detections object.
@@ -187,7 +247,9 @@ class Detections:
         )
 
     @classmethod
-    def from_ultralytics(cls, ultralytics_results) -> Detections:
+    def from_ultralytics(
+        cls, ultralytics_results, crop_masks: bool = False
+    ) -> Detections:
         """
         Creates a Detections instance from a
             [YOLOv8](https://github.com/ultralytics/ultralytics) inference result.
@@ -195,6 +257,9 @@ class Detections:
         Args:
             ultralytics_results (ultralytics.yolo.engine.results.Results):
                 The output Results instance from YOLOv8
+            crop_masks (bool): If True, segmentation masks are stored as a
+                `CroppedMask` aligned to the detection boxes instead of
+                full-resolution planes.
 
         Returns:
             Detections: A new Detections object.
@@ -223,7 +288,9 @@ class Detections:
             xyxy=ultralytics_results.boxes.xyxy.cpu().numpy(),
             confidence=ultralytics_results.boxes.conf.cpu().numpy(),
             class_id=ultralytics_results.boxes.cls.cpu().numpy().astype(int),
-            mask=extract_ultralytics_masks(ultralytics_results),
+            mask=extract_ultralytics_masks(
+                ultralytics_results, crop_masks=crop_masks
+            ),
             tracker_id=ultralytics_results.boxes.id.int().cpu().numpy()
             if ultralytics_results.boxes.id is not None
             else None,
@@ -681,7 +748,56 @@ class Detections:
             class_id=np.array([], dtype=int),
         )
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the Detections object into a compact binary record: a small
+        header followed by the raw buffers of all columns. Dense, compressed and
+        cropped masks are stored in their own representation.
+
+        Returns:
+            bytes: The binary record, readable with `Detections.from_bytes`.
+
+        Example:
+            ```python
+            >>> import supervision as sv
+
+            >>> detections = sv.Detections(...)
+
+            >>> payload = detections.to_bytes()
+            >>> sv.Detections.from_bytes(payload) == detections
+            True
+            ```
+        """
+        return serialize_columns(
+            xyxy=self.xyxy,
+            mask=self.mask,
+            confidence=self.confidence,
+            class_id=self.class_id,
+            tracker_id=self.tracker_id,
+        )
+
     @classmethod
+    def from_bytes(cls, buffer: Any, offset: int = 0) -> Detections:
+        """
+        Deserialize a Detections object from a binary record created with
+        `Detections.to_bytes`. The arrays of the returned object are zero-copy views
+        into `buffer`, which can be `bytes`, a `memoryview`, shared memory or an
+        `np.memmap`.
+
+        Args:
+            buffer (Any): An object exposing the buffer protocol.
+            offset (int): The position of the record within `buffer`.
+
+        Returns:
+            Detections: The deserialized detections.
+
+        Raises:
+            ValueError: If `buffer` does not contain a complete record at `offset`.
+        """
+        return cls(**deserialize_columns(buffer, offset=offset))
+
+    @classmethod
+    @traced
     def merge(cls, detections_list: List[Detections]) -> Detections:
         """
         Merge a list of Detections objects into a single Detections object.
@@ -712,26 +828,18 @@ class Detections:
         if len(detections_list) == 0:
             return Detections.empty()
 
-        detections_tuples_list = [astuple(detection) for detection in detections_list]
-        xyxy, mask, confidence, class_id, tracker_id = [
-            list(field) for field in zip(*detections_tuples_list)
-        ]
-
-        def __all_not_none(item_list: List[Any]):
-            return all(x is not None for x in item_list)
-
-        xyxy = np.vstack(xyxy)
-        mask = np.vstack(mask) if __all_not_none(mask) else None
-        confidence = np.hstack(confidence) if __all_not_none(confidence) else None
-        class_id = np.hstack(class_id) if __all_not_none(class_id) else None
-        tracker_id = np.hstack(tracker_id) if __all_not_none(tracker_id) else None
+        def __concatenate(field: str) -> Optional[np.ndarray]:
+            arrays = [getattr(detections, field) for detections in detections_list]
+            if any(array is None for array in arrays):
+                return None
+            return np.concatenate(arrays)
 
         return cls(
-            xyxy=xyxy,
-            mask=mask,
-            confidence=confidence,
-            class_id=class_id,
-            tracker_id=tracker_id,
+            xyxy=__concatenate("xyxy"),
+            mask=merge_masks([detections.mask for detections in detections_list]),
+            confidence=__concatenate("confidence"),
+            class_id=__concatenate("class_id"),
+            tracker_id=__concatenate("tracker_id"),
         )
 
     def get_anchors_coordinates(self, anchor: Position) -> np.ndarray:
@@ -753,7 +861,20 @@ class Detections:
 
         Raises:
             ValueError: If the provided `anchor` is not supported.
+
+        Note:
+            The result is cached until one of the attributes is reassigned, and a
+            copy of it is returned. Modifying `xyxy` or `mask` in place does not
+            invalidate the cache.
         """
+        return self._get_cached(
+            key=("anchors", anchor),
+            calculate=lambda: as_float_dtype(
+                self._calculate_anchors_coordinates(anchor=anchor)
+            ),
+        ).copy()
+
+    def _calculate_anchors_coordinates(self, anchor: Position) -> np.ndarray:
         if anchor == Position.CENTER:
             return np.array(
                 [
@@ -852,6 +973,11 @@ class Detections:
             in the format of `(area_1, area_2, ..., area_n)`,
             where n is the number of detections.
         """
+        return self._get_cached(key="area", calculate=self._calculate_area).copy()
+
+    def _calculate_area(self) -> np.ndarray:
+        if isinstance(self.mask, BaseMask):
+            return self.mask.area
         if self.mask is not None:
             return np.array([np.sum(mask) for mask in self.mask])
         else:
@@ -867,10 +993,19 @@ class Detections:
                 box in the format of `(area_1, area_2, ..., area_n)`,
                 where n is the number of detections.
         """
-        return (self.xyxy[:, 3] - self.xyxy[:, 1]) * (self.xyxy[:, 2] - self.xyxy[:, 0])
+        return self._get_cached(
+            key="box_area",
+            calculate=lambda: (self.xyxy[:, 3] - self.xyxy[:, 1])
+            * (self.xyxy[:, 2] - self.xyxy[:, 0]),
+        ).copy()
 
+    @traced
     def with_nms(
-        self, threshold: float = 0.5, class_agnostic: bool = False
+        self,
+        threshold: float = 0.5,
+        class_agnostic: bool = False,
+        max_detections: Optional[int] = None,
+        use_masks: bool = False,
     ) -> Detections:
         """
         Perform non-maximum suppression on the current set of object detections.
@@ -881,6 +1016,11 @@ class Detections:
             class_agnostic (bool, optional): Whether to perform class-agnostic
                 non-maximum suppression. If True, the class_id of each detection
                 will be ignored. Defaults to False.
+            max_detections (Optional[int], optional): The maximum number of
+                detections to keep. The highest confidence detections surviving
+                NMS are kept. If `None`, all surviving detections are kept.
+            use_masks (bool, optional): Whether to compute the intersection-over-union
+                on segmentation masks instead of bounding boxes. Defaults to False.
 
         Returns:
             Detections: A new Detections object containing the subset of detections
@@ -889,6 +1029,19 @@ class Detections:
         Raises:
             AssertionError: If `confidence` is None and class_agnostic is False.
                 If `class_id` is None and class_agnostic is False.
+                If `mask` is None and use_masks is True.
+
+        Example:
+            ```python
+            >>> import supervision as sv
+            >>> from ultralytics import YOLO
+
+            >>> model = YOLO('yolov8s-seg.pt')
+            >>> result = model(IMAGE)[0]
+            >>> detections = sv.Detections.from_ultralytics(result)
+
+            >>> detections = detections.with_nms(threshold=0.5, use_masks=True)
+            ```
         """
         if len(self) == 0:
             return self
@@ -899,18 +1052,33 @@ class Detections:
 
         if class_agnostic:
             predictions = np.hstack((self.xyxy, self.confidence.reshape(-1, 1)))
-            indices = non_max_suppression(
-                predictions=predictions, iou_threshold=threshold
+        else:
+            assert self.class_id is not None, (
+                "Detections class_id must be given for NMS to be executed. If you"
+                " intended to perform class agnostic NMS set class_agnostic=True."
+            )
+            predictions = np.hstack(
+                (
+                    self.xyxy,
+                    self.confidence.reshape(-1, 1),
+                    self.class_id.reshape(-1, 1),
+                )
             )
-            return self[indices]
-
-        assert self.class_id is not None, (
-            "Detections class_id must be given for NMS to be executed. If you intended"
-            " to perform class agnostic NMS set class_agnostic=True."
-        )
 
-        predictions = np.hstack(
-            (self.xyxy, self.confidence.reshape(-1, 1), self.class_id.reshape(-1, 1))
-        )
-        indices = non_max_suppression(predictions=predictions, iou_threshold=threshold)
+        if use_masks:
+            assert (
+                self.mask is not None
+            ), "Detections mask must be given for mask-based NMS to be executed."
+            indices = mask_non_max_suppression(
+                predictions=predictions,
+                masks=self.mask,
+                iou_threshold=threshold,
+                max_detections=max_detections,
+            )
+        else:
+            indices = non_max_suppression(
+                predictions=predictions,
+                iou_threshold=threshold,
+                max_detections=max_detections,
+            )
         return self[indices]
@@ -6,6 +6,7 @@ import numpy as np
 from supervision.detection.core import Detections
 from supervision.draw.color import Color
 from supervision.geometry.core import Point, Rect, Vector
+from supervision.utils.tracing import traced
 
 
 class LineZone:
@@ -37,6 +38,7 @@ class LineZone:
         self.in_count: int = 0
         self.out_count: int = 0
 
+    @traced
     def trigger(self, detections: Detections) -> Tuple[np.ndarray, np.ndarray]:
         """
         Update the `in_count` and `out_count` based on the objects that cross the line.
@@ -126,6 +128,7 @@ class LineZoneAnnotator:
         self.custom_in_text: str = custom_in_text
         self.custom_out_text: str = custom_out_text
 
+    @traced
     def annotate(self, frame: np.ndarray, line_counter: LineZone) -> np.ndarray:
         """
         Draws the line on the frame using the line_counter provided.
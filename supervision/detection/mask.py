@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+# number of set bits in every possible byte value
+_BYTE_POPCOUNT = np.array(
+    [bin(value).count("1") for value in range(256)], dtype=np.uint8
+)
+
+# sum of the in-byte positions of set bits; `np.packbits` stores the first pixel
+# in the most significant bit, so position `k` corresponds to bit `7 - k`
+_BYTE_POSITION_SUM = np.array(
+    [sum(k for k in range(8) if value & (0x80 >> k)) for value in range(256)],
+    dtype=np.uint8,
+)
+
+
+class BaseMask(ABC):
+    """
+    Base class for memory-efficient mask stores that can be used in place of a
+    dense `(n, H, W)` bool array as `sv.Detections.mask`.
+
+    Indexing with an integer materializes a single dense `(H, W)` mask, while indexing
+    with a slice, list or array returns a new mask store of the same type.
+    """
+
+    resolution_wh: Tuple[int, int]
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __getitem__(
+        self, index: Union[int, slice, List[int], np.ndarray]
+    ) -> Union[np.ndarray, BaseMask]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def merge(cls, masks_list: List[BaseMask]) -> BaseMask:
+        pass
+
+    @property
+    @abstractmethod
+    def area(self) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def to_xyxy(self) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def centroids(self) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def crop(self, index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        Returns the smallest part of a single mask that contains all of its pixels.
+
+        Args:
+            index (int): The index of the mask.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[int, int]]: A 2D bool array and the `(x, y)`
+                coordinates of its top-left corner in the full-resolution frame.
+        """
+        pass
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        width, height = self.resolution_wh
+        return len(self), height, width
+
+    @property
+    def ndim(self) -> int:
+        return 3
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(bool)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def __eq__(self, other) -> bool:
+        return np.array_equal(self.to_dense(), np.asarray(other))
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Decodes all masks.
+
+        Returns:
+            np.ndarray: A bool array of shape `(n, H, W)`.
+        """
+        _, height, width = self.shape
+        dense = np.zeros((len(self), height, width), dtype=bool)
+        for i in range(len(self)):
+            crop, (x, y) = self.crop(i)
+            crop_height, crop_width = crop.shape
+            dense[i, y : y + crop_height, x : x + crop_width] = crop
+        return dense
+
+
+class CompressedMask(BaseMask):
+    """
+    Bit-packed storage for a stack of binary masks that can be used in place of a
+    dense `(n, H, W)` bool array as `sv.Detections.mask`.
+
+    Each row of every mask is packed into bytes with `np.packbits`, reducing the
+    memory footprint eight times. Area, bounding boxes and centroids are computed
+    directly on the packed representation. Indexing with an integer decodes a single
+    dense `(H, W)` mask, while indexing with a slice, list or array returns a new
+    `CompressedMask` without decoding anything.
+
+    Attributes:
+        packed (np.ndarray): An array of shape `(n, H, ceil(W / 8))` and `np.uint8`
+            dtype containing the bit-packed masks.
+        resolution_wh (Tuple[int, int]): The width and height of the masks.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> detections = sv.Detections.from_sam(sam_result=sam_result)
+        >>> detections.mask = sv.CompressedMask.from_dense(detections.mask)
+
+        >>> detections.area
+        >>> detections[detections.confidence > 0.5]
+        ```
+    """
+
+    def __init__(self, packed: np.ndarray, resolution_wh: Tuple[int, int]):
+        width, height = resolution_wh
+        if packed.ndim != 3 or packed.shape[1:] != (height, (width + 7) // 8):
+            raise ValueError(
+                "packed must be 3d np.ndarray with (n, H, ceil(W / 8)) shape"
+            )
+        self.packed = packed
+        self.resolution_wh = resolution_wh
+
+    @classmethod
+    def from_dense(cls, masks: np.ndarray) -> CompressedMask:
+        """
+        Compresses a dense stack of binary masks.
+
+        Args:
+            masks (np.ndarray): An array of shape `(n, H, W)` containing the masks.
+
+        Returns:
+            CompressedMask: A new CompressedMask object.
+        """
+        _, height, width = masks.shape
+        packed = np.packbits(masks.astype(bool, copy=False), axis=2)
+        return cls(packed=packed, resolution_wh=(width, height))
+
+    @classmethod
+    def merge(cls, masks_list: List[CompressedMask]) -> CompressedMask:
+        """
+        Concatenates a list of CompressedMask objects with the same resolution.
+
+        Args:
+            masks_list (List[CompressedMask]): Masks to be concatenated.
+
+        Returns:
+            CompressedMask: A new CompressedMask object.
+        """
+        resolutions = {masks.resolution_wh for masks in masks_list}
+        if len(resolutions) != 1:
+            raise ValueError("All merged masks must have the same resolution.")
+        return cls(
+            packed=np.concatenate([masks.packed for masks in masks_list]),
+            resolution_wh=masks_list[0].resolution_wh,
+        )
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __getitem__(
+        self, index: Union[int, slice, List[int], np.ndarray]
+    ) -> Union[np.ndarray, CompressedMask]:
+        width, _ = self.resolution_wh
+        if isinstance(index, (int, np.integer)):
+            return np.unpackbits(self.packed[index], axis=1, count=width).astype(bool)
+        return CompressedMask(
+            packed=self.packed[index], resolution_wh=self.resolution_wh
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompressedMask):
+            return self.resolution_wh == other.resolution_wh and np.array_equal(
+                self.packed, other.packed
+            )
+        return super().__eq__(other)
+
+    def to_dense(self) -> np.ndarray:
+        width, _ = self.resolution_wh
+        return np.unpackbits(self.packed, axis=2, count=width).astype(bool)
+
+    def crop(self, index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        width, _ = self.resolution_wh
+        packed = self.packed[index]
+        rows = np.flatnonzero(packed.any(axis=1))
+        if len(rows) == 0:
+            return np.zeros((0, 0), dtype=bool), (0, 0)
+
+        y_min, y_max = rows[0], rows[-1] + 1
+        band = np.unpackbits(packed[y_min:y_max], axis=1, count=width).astype(bool)
+        columns = np.flatnonzero(band.any(axis=0))
+        x_min, x_max = columns[0], columns[-1] + 1
+        return band[:, x_min:x_max], (int(x_min), int(y_min))
+
+    @property
+    def area(self) -> np.ndarray:
+        """
+        Number of pixels covered by each mask.
+
+        Returns:
+            np.ndarray: An array of shape `(n,)` containing the mask areas.
+        """
+        return _BYTE_POPCOUNT[self.packed].sum(axis=(1, 2), dtype=int)
+
+    def to_xyxy(self) -> np.ndarray:
+        """
+        Computes the tight bounding box of each mask. Empty masks produce
+        `[0, 0, 0, 0]` boxes, like `sv.mask_to_xyxy`.
+
+        Returns:
+            np.ndarray: An array of shape `(n, 4)` containing the bounding boxes
+                `(x_min, y_min, x_max, y_max)` for each mask.
+        """
+        width, _ = self.resolution_wh
+        rows = self.packed.any(axis=2)
+        columns = np.unpackbits(
+            np.bitwise_or.reduce(self.packed, axis=1), axis=1, count=width
+        ).astype(bool)
+        return _occupancy_to_xyxy(rows=rows, columns=columns)
+
+    def centroids(self) -> np.ndarray:
+        """
+        Computes the centroid of each mask, matching `sv.calculate_masks_centroids`.
+
+        Returns:
+            np.ndarray: An array of shape `(n, 2)` containing the `x` and `y`
+                coordinates of the centroid of each mask.
+        """
+        _, height, _ = self.shape
+        bytes_per_row = self.packed.shape[2]
+
+        popcount = _BYTE_POPCOUNT[self.packed]
+        row_count = popcount.sum(axis=2, dtype=np.int64)
+        byte_column_count = popcount.sum(axis=1, dtype=np.int64)
+        position_sum = _BYTE_POSITION_SUM[self.packed].sum(axis=(1, 2), dtype=np.int64)
+
+        total_pixels = row_count.sum(axis=1)
+
+        # offset for 1-based indexing, same as for dense masks
+        sum_y = row_count @ (np.arange(height) + 0.5)
+        sum_x = (
+            byte_column_count @ (8 * np.arange(bytes_per_row))
+            + position_sum
+            + 0.5 * total_pixels
+        )
+
+        # avoid division by zero for empty masks
+        total_pixels = np.maximum(total_pixels, 1)
+        return np.column_stack((sum_x / total_pixels, sum_y / total_pixels)).astype(int)
+
+
+class CroppedMask(BaseMask):
+    """
+    Box-local storage for a stack of binary masks that can be used in place of a
+    dense `(n, H, W)` bool array as `sv.Detections.mask`.
+
+    Each mask is stored as a crop aligned to its bounding box together with the
+    offset of that crop in the frame, so memory and per-frame work scale with object
+    size rather than frame size. Full-resolution masks are only materialized when a
+    single mask is accessed by an integer index or when the whole stack is converted
+    with `to_dense`.
+
+    Attributes:
+        crops (List[np.ndarray]): A list of `n` 2D bool arrays, one for each mask.
+        offsets (np.ndarray): An array of shape `(n, 2)` containing the `(x, y)`
+            coordinates of the top-left corner of each crop.
+        resolution_wh (Tuple[int, int]): The width and height of the masks.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> dataset = sv.DetectionDataset.from_coco(
+        ...     images_directory_path=...,
+        ...     annotations_path=...,
+        ...     force_masks=True,
+        ...     crop_masks=True
+        ... )
+        ```
+    """
+
+    def __init__(
+        self,
+        crops: List[np.ndarray],
+        offsets: np.ndarray,
+        resolution_wh: Tuple[int, int],
+    ):
+        if offsets.shape != (len(crops), 2):
+            raise ValueError("offsets must be 2d np.ndarray with (n, 2) shape")
+        self.crops = crops
+        self.offsets = offsets
+        self.resolution_wh = resolution_wh
+
+    @classmethod
+    def from_dense(
+        cls, masks: np.ndarray, xyxy: Optional[np.ndarray] = None
+    ) -> CroppedMask:
+        """
+        Crops a dense stack of binary masks.
+
+        Args:
+            masks (np.ndarray): An array of shape `(n, H, W)` containing the masks.
+            xyxy (Optional[np.ndarray]): An array of shape `(n, 4)` containing the
+                boxes the masks should be cropped to. Pixels outside of the boxes are
+                discarded. If None, masks are cropped to their tight bounding boxes.
+
+        Returns:
+            CroppedMask: A new CroppedMask object.
+        """
+        _, height, width = masks.shape
+        if xyxy is None:
+            xyxy = _occupancy_to_xyxy(rows=masks.any(axis=2), columns=masks.any(axis=1))
+            xyxy[:, 2:] += 1
+        boxes = _xyxy_to_pixel_boxes(xyxy=xyxy, resolution_wh=(width, height))
+        crops = [
+            mask[y1:y2, x1:x2].astype(bool)
+            for mask, (x1, y1, x2, y2) in zip(masks, boxes)
+        ]
+        return cls(crops=crops, offsets=boxes[:, :2], resolution_wh=(width, height))
+
+    @classmethod
+    def from_polygons(
+        cls, polygons: List[np.ndarray], resolution_wh: Tuple[int, int]
+    ) -> CroppedMask:
+        """
+        Rasterizes polygons directly into box-local crops. The result is identical
+        to cropping the output of `sv.polygon_to_mask`, without allocating
+        full-resolution planes.
+
+        Args:
+            polygons (List[np.ndarray]): A list of `n` integer polygons, each of shape
+                `(N, 2)`.
+            resolution_wh (Tuple[int, int]): The width and height of the frame.
+
+        Returns:
+            CroppedMask: A new CroppedMask object.
+        """
+        crops = []
+        boxes = np.zeros((len(polygons), 4), dtype=int)
+        for i, polygon in enumerate(polygons):
+            polygon = np.asarray(polygon).astype(np.int32)
+            x_min, y_min = polygon.min(axis=0)
+            x_max, y_max = polygon.max(axis=0) + 1
+            boxes[i] = x_min, y_min, x_max, y_max
+        boxes = _xyxy_to_pixel_boxes(xyxy=boxes, resolution_wh=resolution_wh)
+
+        for polygon, (x1, y1, x2, y2) in zip(polygons, boxes):
+            crop = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+            if crop.size > 0:
+                shifted = np.asarray(polygon).astype(np.int32) - np.array([x1, y1])
+                cv2.fillPoly(crop, [shifted], color=1)
+            crops.append(crop.astype(bool))
+        return cls(crops=crops, offsets=boxes[:, :2], resolution_wh=resolution_wh)
+
+    @classmethod
+    def merge(cls, masks_list: List[CroppedMask]) -> CroppedMask:
+        """
+        Concatenates a list of CroppedMask objects with the same resolution.
+
+        Args:
+            masks_list (List[CroppedMask]): Masks to be concatenated.
+
+        Returns:
+            CroppedMask: A new CroppedMask object.
+        """
+        resolutions = {masks.resolution_wh for masks in masks_list}
+        if len(resolutions) != 1:
+            raise ValueError("All merged masks must have the same resolution.")
+        return cls(
+            crops=[crop for masks in masks_list for crop in masks.crops],
+            offsets=np.concatenate([masks.offsets for masks in masks_list]),
+            resolution_wh=masks_list[0].resolution_wh,
+        )
+
+    def __len__(self) -> int:
+        return len(self.crops)
+
+    def __getitem__(
+        self, index: Union[int, slice, List[int], np.ndarray]
+    ) -> Union[np.ndarray, CroppedMask]:
+        if isinstance(index, (int, np.integer)):
+            width, height = self.resolution_wh
+            mask = np.zeros((height, width), dtype=bool)
+            crop, (x, y) = self.crop(index)
+            mask[y : y + crop.shape[0], x : x + crop.shape[1]] = crop
+            return mask
+        indexes = np.arange(len(self))[index]
+        return CroppedMask(
+            crops=[self.crops[i] for i in indexes],
+            offsets=self.offsets[indexes],
+            resolution_wh=self.resolution_wh,
+        )
+
+    def crop(self, index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        x, y = self.offsets[index]
+        return self.crops[index], (int(x), int(y))
+
+    @property
+    def area(self) -> np.ndarray:
+        """
+        Number of pixels covered by each mask.
+
+        Returns:
+            np.ndarray: An array of shape `(n,)` containing the mask areas.
+        """
+        return np.array([np.count_nonzero(crop) for crop in self.crops], dtype=int)
+
+    def to_xyxy(self) -> np.ndarray:
+        """
+        Computes the tight bounding box of each mask. Empty masks produce
+        `[0, 0, 0, 0]` boxes, like `sv.mask_to_xyxy`.
+
+        Returns:
+            np.ndarray: An array of shape `(n, 4)` containing the bounding boxes
+                `(x_min, y_min, x_max, y_max)` for each mask.
+        """
+        xyxy = np.zeros((len(self), 4), dtype=int)
+        for i, (crop, (x, y)) in enumerate(zip(self.crops, self.offsets)):
+            rows = np.flatnonzero(crop.any(axis=1))
+            if len(rows) == 0:
+                continue
+            columns = np.flatnonzero(crop.any(axis=0))
+            xyxy[i] = x + columns[0], y + rows[0], x + columns[-1], y + rows[-1]
+        return xyxy
+
+    def centroids(self) -> np.ndarray:
+        """
+        Computes the centroid of each mask, matching `sv.calculate_masks_centroids`.
+
+        Returns:
+            np.ndarray: An array of shape `(n, 2)` containing the `x` and `y`
+                coordinates of the centroid of each mask.
+        """
+        centroids = np.zeros((len(self), 2), dtype=int)
+        for i, (crop, (x, y)) in enumerate(zip(self.crops, self.offsets)):
+            total_pixels = max(np.count_nonzero(crop), 1)
+            crop_height, crop_width = crop.shape
+            # offset for 1-based indexing, same as for dense masks
+            sum_x = crop.sum(axis=0) @ (np.arange(crop_width) + x + 0.5)
+            sum_y = crop.sum(axis=1) @ (np.arange(crop_height) + y + 0.5)
+            centroids[i] = int(sum_x / total_pixels), int(sum_y / total_pixels)
+        return centroids
+
+
+def _occupancy_to_xyxy(rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """
+    Converts per-mask row and column occupancy arrays of shapes `(n, H)` and `(n, W)`
+    into inclusive `(x_min, y_min, x_max, y_max)` boxes. Empty masks produce
+    `[0, 0, 0, 0]` boxes.
+    """
+    height, width = rows.shape[1], columns.shape[1]
+    xyxy = np.zeros((len(rows), 4), dtype=int)
+    non_empty = rows.any(axis=1)
+    rows, columns = rows[non_empty], columns[non_empty]
+    xyxy[non_empty, 0] = columns.argmax(axis=1)
+    xyxy[non_empty, 1] = rows.argmax(axis=1)
+    xyxy[non_empty, 2] = width - 1 - columns[:, ::-1].argmax(axis=1)
+    xyxy[non_empty, 3] = height - 1 - rows[:, ::-1].argmax(axis=1)
+    return xyxy
+
+
+def _xyxy_to_pixel_boxes(
+    xyxy: np.ndarray, resolution_wh: Tuple[int, int]
+) -> np.ndarray:
+    """
+    Converts boxes to integer pixel ranges `[x1, x2) x [y1, y2)` that cover them and
+    fit within the frame.
+    """
+    width, height = resolution_wh
+    boxes = np.empty((len(xyxy), 4), dtype=int)
+    boxes[:, :2] = np.floor(xyxy[:, :2])
+    boxes[:, 2:] = np.ceil(xyxy[:, 2:])
+    boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, width)
+    boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, height)
+    boxes[:, 2:] = np.maximum(boxes[:, 2:], boxes[:, :2])
+    return boxes
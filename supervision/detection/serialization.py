@@ -0,0 +1,163 @@
+import struct
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from supervision.detection.mask import BaseMask, CompressedMask, CroppedMask
+
+MAGIC = b"SVDT"
+VERSION = 1
+
+# magic, version, mask kind, column flags, n, mask height, mask width,
+# dtypes of the 4 array columns, record size in bytes
+HEADER = struct.Struct("<4sBBHIII16sQ4x")
+
+COLUMNS = ["xyxy", "confidence", "class_id", "tracker_id"]
+COLUMN_WIDTHS = {"xyxy": 4, "confidence": 1, "class_id": 1, "tracker_id": 1}
+
+MASK_NONE, MASK_DENSE, MASK_COMPRESSED, MASK_CROPPED = range(4)
+
+# columns are aligned so that decoded views are aligned for any dtype
+ALIGNMENT = 8
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def serialize_columns(
+    xyxy: np.ndarray,
+    mask: Optional[Union[np.ndarray, BaseMask]],
+    confidence: Optional[np.ndarray],
+    class_id: Optional[np.ndarray],
+    tracker_id: Optional[np.ndarray],
+) -> bytes:
+    """
+    Encodes the columns of a Detections object into a single binary record made of a
+    fixed-size header followed by the raw, 8-byte aligned column buffers.
+    """
+    n = len(xyxy)
+    arrays = dict(
+        xyxy=xyxy, confidence=confidence, class_id=class_id, tracker_id=tracker_id
+    )
+
+    flags, dtypes, chunks = 0, b"", []
+    for bit, column in enumerate(COLUMNS):
+        array = arrays[column]
+        if array is None:
+            dtypes += b"\0" * 4
+            continue
+        array = np.ascontiguousarray(array)
+        flags |= 1 << bit
+        dtypes += array.dtype.str.encode().ljust(4, b"\0")
+        chunks.append(array.tobytes())
+
+    mask_kind, height, width = MASK_NONE, 0, 0
+    if isinstance(mask, CompressedMask):
+        mask_kind, (width, height) = MASK_COMPRESSED, mask.resolution_wh
+        chunks.append(np.ascontiguousarray(mask.packed).tobytes())
+    elif isinstance(mask, CroppedMask):
+        mask_kind, (width, height) = MASK_CROPPED, mask.resolution_wh
+        boxes = np.zeros((n, 4), dtype="<i4")
+        boxes[:, :2] = mask.offsets
+        boxes[:, 2:] = np.array(
+            [crop.shape[::-1] for crop in mask.crops], dtype=int
+        ).reshape(-1, 2)
+        chunks.append(boxes.tobytes())
+        chunks.append(
+            b"".join(
+                np.ascontiguousarray(crop, dtype=bool).tobytes() for crop in mask.crops
+            )
+        )
+    elif mask is not None:
+        mask = np.asarray(mask)
+        mask_kind, height, width = MASK_DENSE, mask.shape[1], mask.shape[2]
+        chunks.append(np.ascontiguousarray(mask, dtype=bool).tobytes())
+
+    body = b"".join(chunk + b"\0" * _padding(len(chunk)) for chunk in chunks)
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        mask_kind,
+        flags,
+        n,
+        height,
+        width,
+        dtypes,
+        HEADER.size + len(body),
+    )
+    return header + body
+
+
+def read_record_size(buffer: Any, offset: int = 0) -> Optional[int]:
+    """
+    Returns the size of the record starting at `offset`, or `None` if `offset` is
+    the end of the buffer. Raises `ValueError` if the buffer does not contain a
+    valid, complete record there.
+    """
+    remaining = len(buffer) - offset
+    if remaining == 0:
+        return None
+    if remaining < HEADER.size:
+        raise ValueError(f"Incomplete Detections record at offset {offset}.")
+    magic, version, *_, size = HEADER.unpack_from(buffer, offset)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"No Detections record found at offset {offset}.")
+    if size < HEADER.size:
+        raise ValueError(f"Invalid Detections record size {size} at offset {offset}.")
+    if size > remaining:
+        raise ValueError(f"Incomplete Detections record at offset {offset}.")
+    return size
+
+
+def deserialize_columns(buffer: Any, offset: int = 0) -> Dict[str, Any]:
+    """
+    Decodes a record produced by `serialize_columns` into column arrays. The arrays
+    are views into `buffer`, nothing is copied.
+    """
+    if read_record_size(buffer, offset) is None:
+        raise ValueError(f"No Detections record found at offset {offset}.")
+    _, _, mask_kind, flags, n, height, width, dtypes, _ = HEADER.unpack_from(
+        buffer, offset
+    )
+    data = buffer if isinstance(buffer, np.ndarray) else np.frombuffer(buffer, np.uint8)
+    position = offset + HEADER.size
+
+    def take(dtype: Any, shape: Tuple[int, ...]) -> np.ndarray:
+        nonlocal position
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        array = data[position : position + size].view(dtype).reshape(shape)
+        position += size + _padding(size)
+        return array
+
+    columns: Dict[str, Any] = {}
+    for bit, column in enumerate(COLUMNS):
+        if not flags & (1 << bit):
+            columns[column] = None
+            continue
+        dtype = dtypes[bit * 4 : bit * 4 + 4].rstrip(b"\0").decode()
+        width_column = COLUMN_WIDTHS[column]
+        shape = (n, width_column) if width_column > 1 else (n,)
+        columns[column] = take(dtype, shape)
+
+    if mask_kind == MASK_DENSE:
+        columns["mask"] = take(bool, (n, height, width))
+    elif mask_kind == MASK_COMPRESSED:
+        packed = take(np.uint8, (n, height, (width + 7) // 8))
+        columns["mask"] = CompressedMask(packed=packed, resolution_wh=(width, height))
+    elif mask_kind == MASK_CROPPED:
+        boxes = take("<i4", (n, 4))
+        flat = take(bool, (int(np.sum(boxes[:, 2] * boxes[:, 3])),))
+        crops: List[np.ndarray] = []
+        start = 0
+        for crop_width, crop_height in boxes[:, 2:]:
+            end = start + crop_width * crop_height
+            crops.append(flat[start:end].reshape(crop_height, crop_width))
+            start = end
+        columns["mask"] = CroppedMask(
+            crops=crops, offsets=boxes[:, :2], resolution_wh=(width, height)
+        )
+    else:
+        columns["mask"] = None
+    return columns
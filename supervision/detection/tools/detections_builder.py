@@ -0,0 +1,179 @@
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from supervision.detection.core import Detections, merge_masks
+from supervision.detection.mask import BaseMask
+
+COLUMNS = ["xyxy", "confidence", "class_id", "tracker_id"]
+
+
+class DetectionsBuilder:
+    """
+    Accumulates many Detections objects, for example per-slice or per-frame results,
+    into preallocated column buffers and emits a single Detections object at the end.
+
+    Appending copies each column exactly once into a buffer that grows geometrically,
+    so collecting `k` Detections objects costs amortized `O(n)` instead of the
+    repeated reallocations of merging them one by one. The result is equal to
+    `sv.Detections.merge` called on all appended objects: a field is `None` if it is
+    `None` in any of them.
+
+    Args:
+        capacity (int): The initial number of rows of the column buffers.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> builder = sv.DetectionsBuilder()
+        >>> for frame in sv.get_video_frames_generator(source_path='source.mp4'):
+        ...     result = model(frame)[0]
+        ...     builder.append(sv.Detections.from_ultralytics(result))
+
+        >>> detections = builder.build()
+        ```
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(capacity, 1)
+        self._length = 0
+        self._is_empty = True
+        self._buffers: Dict[str, Optional[np.ndarray]] = {}
+        self._mask_buffer: Optional[np.ndarray] = None
+        self._mask_chunks: Optional[List[Union[np.ndarray, BaseMask]]] = None
+        self._has_mask = True
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, detections: Detections) -> None:
+        """
+        Copies the columns of a Detections object into the buffers.
+
+        Args:
+            detections (Detections): The detections to be appended.
+        """
+        n = len(detections)
+        start, end = self._length, self._length + n
+
+        for column in COLUMNS:
+            values = getattr(detections, column)
+            if values is None or (
+                column in self._buffers and self._buffers[column] is None
+            ):
+                self._buffers[column] = None
+                continue
+            buffer = self._reserve(self._buffers.get(column), values, end)
+            buffer[start:end] = values
+            self._buffers[column] = buffer
+
+        self._append_mask(detections.mask, start=start, end=end)
+        self._length = end
+        self._is_empty = False
+
+    def build(self) -> Detections:
+        """
+        Emits a Detections object containing all appended detections.
+
+        Returns:
+            Detections: The accumulated detections.
+
+        !!! warning
+
+            To avoid a copy, the returned arrays are views into the builder buffers.
+            They stay valid while more detections are appended, but are overwritten
+            after `clear()` is called and the builder is reused. Copy the result if
+            it needs to outlive the next `clear()`.
+        """
+        if self._is_empty:
+            return Detections.empty()
+
+        def __view(column: str) -> Optional[np.ndarray]:
+            buffer = self._buffers[column]
+            return None if buffer is None else buffer[: self._length]
+
+        if not self._has_mask:
+            mask = None
+        elif self._mask_chunks is not None:
+            mask = merge_masks(self._mask_chunks)
+        else:
+            mask = self._mask_buffer[: self._length]
+
+        return Detections(
+            xyxy=__view("xyxy"),
+            mask=mask,
+            confidence=__view("confidence"),
+            class_id=__view("class_id"),
+            tracker_id=__view("tracker_id"),
+        )
+
+    def clear(self) -> None:
+        """
+        Removes all appended detections while keeping the allocated buffers,
+        so that the builder can be reused, e.g. for the next frame.
+        """
+        self._length = 0
+        self._is_empty = True
+        self._buffers = {
+            column: buffer
+            for column, buffer in self._buffers.items()
+            if buffer is not None
+        }
+        self._mask_chunks = None
+        self._has_mask = True
+
+    def _append_mask(
+        self, mask: Optional[Union[np.ndarray, BaseMask]], start: int, end: int
+    ) -> None:
+        if mask is None or not self._has_mask:
+            self._has_mask = False
+            self._mask_chunks = None
+            return
+
+        if self._mask_chunks is not None or (
+            isinstance(mask, BaseMask) and self._is_empty
+        ):
+            # mask stores are merged once in `build` to avoid decoding them
+            if self._mask_chunks is None:
+                self._mask_chunks = []
+            self._mask_chunks.append(mask)
+            return
+
+        mask = np.asarray(mask)
+        self._mask_buffer = self._reserve(self._mask_buffer, mask, end)
+        self._mask_buffer[start:end] = mask
+
+    def _reserve(
+        self, buffer: Optional[np.ndarray], values: np.ndarray, size: int
+    ) -> np.ndarray:
+        """
+        Returns a buffer that can hold `size` rows shaped and typed like `values`,
+        reusing `buffer` when possible and growing it geometrically otherwise.
+        """
+        values = np.asarray(values)
+        if self._length == 0 and buffer is not None:
+            # nothing to preserve, e.g. after `clear`, so only reuse the allocation
+            if buffer.shape[1:] != values.shape[1:]:
+                buffer = None
+        elif buffer is not None and buffer.shape[1:] != values.shape[1:]:
+            raise ValueError(
+                f"Cannot append values of shape {values.shape[1:]} to buffer of "
+                f"shape {buffer.shape[1:]}."
+            )
+
+        dtype = (
+            values.dtype
+            if buffer is None or self._length == 0
+            else np.result_type(buffer.dtype, values.dtype)
+        )
+        if buffer is not None and len(buffer) >= size and buffer.dtype == dtype:
+            return buffer
+
+        capacity = max(self.capacity, 1 if buffer is None else len(buffer))
+        while capacity < size:
+            capacity *= 2
+        new_buffer = np.empty((capacity,) + values.shape[1:], dtype=dtype)
+        if buffer is not None:
+            new_buffer[: self._length] = buffer[: self._length]
+        return new_buffer
@@ -0,0 +1,105 @@
+import os
+from typing import Iterator, List
+
+import numpy as np
+
+from supervision.detection.core import Detections
+from supervision.detection.serialization import read_record_size
+
+
+class DetectionsSink:
+    """
+    Context manager that appends the detections of consecutive frames to a single
+    binary file, one `Detections.to_bytes` record per frame. The file can be read
+    back with `sv.DetectionsReader`.
+
+    Attributes:
+        target_path (str): The path of the output file.
+        append (bool): Whether to keep the existing records of `target_path`
+            and append new ones after them, instead of overwriting the file.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> with sv.DetectionsSink(target_path='detections.bin') as sink:
+        ...     for frame in sv.get_video_frames_generator(source_path='source.mp4'):
+        ...         result = model(frame)[0]
+        ...         sink.write(sv.Detections.from_ultralytics(result))
+        ```
+    """
+
+    def __init__(self, target_path: str, append: bool = False):
+        self.target_path = target_path
+        self.append = append
+        self.__file = None
+
+    def __enter__(self):
+        self.__file = open(self.target_path, "ab" if self.append else "wb")
+        return self
+
+    def write(self, detections: Detections) -> None:
+        """
+        Appends the detections of the next frame to the file.
+
+        Args:
+            detections (Detections): The detections of a single frame.
+        """
+        self.__file.write(detections.to_bytes())
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.__file.close()
+
+
+class DetectionsReader:
+    """
+    Random access reader for files written with `sv.DetectionsSink`.
+
+    The file is mapped with `np.memmap` and every frame is decoded as zero-copy,
+    read-only views into the mapping, so opening even very large files is cheap and
+    only the accessed frames are paged in. A truncated or corrupt file raises
+    `ValueError` when opened.
+
+    Attributes:
+        source_path (str): The path of the file to read.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> reader = sv.DetectionsReader(source_path='detections.bin')
+        >>> len(reader)
+        >>> detections = reader[42]
+
+        >>> for detections in reader:
+        ...     ...
+        ```
+    """
+
+    def __init__(self, source_path: str):
+        self.source_path = source_path
+        self.__data = (
+            np.memmap(source_path, dtype=np.uint8, mode="r")
+            if os.path.getsize(source_path) > 0
+            else np.empty(0, dtype=np.uint8)
+        )
+        self.offsets = self.__index_records()
+
+    def __index_records(self) -> List[int]:
+        offsets, offset = [], 0
+        while True:
+            size = read_record_size(self.__data, offset)
+            if size is None:
+                return offsets
+            offsets.append(offset)
+            offset += size
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> Detections:
+        return Detections.from_bytes(self.__data, offset=self.offsets[index])
+
+    def __iter__(self) -> Iterator[Detections]:
+        for offset in self.offsets:
+            yield Detections.from_bytes(self.__data, offset=offset)
@@ -6,6 +6,7 @@ import numpy as np
 from supervision.detection.core import Detections, validate_inference_callback
 from supervision.detection.utils import move_boxes
 from supervision.utils.image import crop_image
+from supervision.utils.tracing import traced
 
 
 def move_detections(detections: Detections, offset: np.array) -> Detections:
@@ -39,6 +40,8 @@ class InferenceSlicer:
         callback (Callable): A function that performs inference on a given image
             slice and returns detections.
         thread_workers (int): Number of threads for parallel execution.
+        max_detections (Optional[int]): The maximum number of detections kept
+            after non-max suppression. If `None`, all surviving detections are kept.
 
     Note:
         The class ensures that slices do not exceed the boundaries of the original
@@ -54,14 +57,17 @@ class InferenceSlicer:
         overlap_ratio_wh: Tuple[float, float] = (0.2, 0.2),
         iou_threshold: Optional[float] = 0.5,
         thread_workers: int = 1,
+        max_detections: Optional[int] = None,
     ):
         self.slice_wh = slice_wh
         self.overlap_ratio_wh = overlap_ratio_wh
         self.iou_threshold = iou_threshold
         self.callback = callback
         self.thread_workers = thread_workers
+        self.max_detections = max_detections
         validate_inference_callback(callback=callback)
 
+    @traced
     def __call__(self, image: np.ndarray) -> Detections:
         """
         Performs slicing-based inference on the provided image using the specified
@@ -110,7 +116,7 @@ class InferenceSlicer:
                 detections_list.append(future.result())
 
         return Detections.merge(detections_list=detections_list).with_nms(
-            threshold=self.iou_threshold
+            threshold=self.iou_threshold, max_detections=self.max_detections
         )
 
     def _run_callback(self, image, offset) -> Detections:
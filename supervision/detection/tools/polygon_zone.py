@@ -1,15 +1,17 @@
 from dataclasses import replace
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
 from supervision import Detections
+from supervision.detection.batch import DetectionsBatch
 from supervision.detection.utils import clip_boxes, polygon_to_mask
 from supervision.draw.color import Color
 from supervision.draw.utils import draw_polygon, draw_text
 from supervision.geometry.core import Position
 from supervision.geometry.utils import get_polygon_center
+from supervision.utils.tracing import traced
 
 
 class PolygonZone:
@@ -42,29 +44,50 @@ class PolygonZone:
             polygon=polygon, resolution_wh=(width + 1, height + 1)
         )
 
-    def trigger(self, detections: Detections) -> np.ndarray:
+    @traced
+    def trigger(self, detections: Union[Detections, DetectionsBatch]) -> np.ndarray:
         """
         Determines if the detections are within the polygon zone.
 
         Parameters:
-            detections (Detections): The detections
-                to be checked against the polygon zone
+            detections (Union[Detections, DetectionsBatch]): The detections
+                to be checked against the polygon zone. When a `DetectionsBatch`
+                is given, all frames are checked at once and `current_count`
+                holds the count of the last frame.
 
         Returns:
             np.ndarray: A boolean numpy array indicating
                 if each detection is within the polygon zone
         """
+        batch = detections if isinstance(detections, DetectionsBatch) else None
+        if batch is not None:
+            detections = batch.detections
+
+        # zones with the same resolution and triggering position share the anchors
+        clipped_anchors = detections._get_cached(
+            key=(
+                "zone_anchors",
+                tuple(self.frame_resolution_wh),
+                self.triggering_position,
+            ),
+            calculate=lambda: self._calculate_clipped_anchors(detections=detections),
+        )
+        is_in_zone = self.mask[clipped_anchors[:, 1], clipped_anchors[:, 0]]
+        if batch is None:
+            self.current_count = int(np.sum(is_in_zone))
+        else:
+            last_frame = is_in_zone[batch.offsets[-2] :] if len(batch) else []
+            self.current_count = int(np.sum(last_frame))
+        return is_in_zone.astype(bool)
 
+    def _calculate_clipped_anchors(self, detections: Detections) -> np.ndarray:
         clipped_xyxy = clip_boxes(
             xyxy=detections.xyxy, resolution_wh=self.frame_resolution_wh
         )
         clipped_detections = replace(detections, xyxy=clipped_xyxy)
-        clipped_anchors = np.ceil(
+        return np.ceil(
             clipped_detections.get_anchors_coordinates(anchor=self.triggering_position)
         ).astype(int)
-        is_in_zone = self.mask[clipped_anchors[:, 1], clipped_anchors[:, 0]]
-        self.current_count = int(np.sum(is_in_zone))
-        return is_in_zone.astype(bool)
 
 
 class PolygonZoneAnnotator:
@@ -105,6 +128,7 @@ class PolygonZoneAnnotator:
         self.font = cv2.FONT_HERSHEY_SIMPLEX
         self.center = get_polygon_center(polygon=zone.polygon)
 
+    @traced
     def annotate(self, scene: np.ndarray, label: Optional[str] = None) -> np.ndarray:
         """
         Annotates the polygon zone within a frame with a count of detected objects.
@@ -1,10 +1,24 @@
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+from scipy import sparse
+
+from supervision.detection.mask import (
+    BaseMask,
+    CroppedMask,
+    _occupancy_to_xyxy,
+    _xyxy_to_pixel_boxes,
+)
+from supervision.utils.dtype import as_float_dtype, get_dtype_policy
 
 MIN_POLYGON_POINT_COUNT = 3
 
+# upper bound on the number of box pairs evaluated at once by the IoU functions
+_MAX_PAIRS = 1 << 20
+# number of box pairs above which the sort-and-sweep IoU beats the dense matrix
+SPARSE_IOU_MIN_PAIRS = 10_000
+
 
 def polygon_to_mask(polygon: np.ndarray, resolution_wh: Tuple[int, int]) -> np.ndarray:
     """Generate a mask from a polygon.
@@ -16,13 +30,20 @@ def polygon_to_mask(polygon: np.ndarray, resolution_wh: Tuple[int, int]) -> np.n
 
     Returns:
         np.ndarray: The generated 2D mask, where the polygon is marked with
-            `1`'s and the rest is filled with `0`'s.
+            `1`'s and the rest is filled with `0`'s. The mask is `float64` unless
+            a mask dtype is set with `sv.set_dtype_policy`.
     """
     width, height = resolution_wh
-    mask = np.zeros((height, width))
+    dtype = get_dtype_policy().mask_dtype
+    is_bool = dtype is not None and dtype.kind == "b"
+    if dtype is None:
+        mask = np.zeros((height, width))
+    else:
+        # OpenCV cannot draw into bool arrays, so those are filled as uint8
+        mask = np.zeros((height, width), dtype=np.uint8 if is_bool else dtype)
 
     cv2.fillPoly(mask, [polygon], color=1)
-    return mask
+    return mask.view(bool) if is_bool else mask
 
 
 def box_iou_batch(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.ndarray:
@@ -31,6 +52,10 @@ def box_iou_batch(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.nda
         `boxes_true` and `boxes_detection`. Both sets
         of boxes are expected to be in `(x_min, y_min, x_max, y_max)` format.
 
+    The matrix is computed in chunks of rows, so the temporary arrays stay small
+    even for large inputs. Use `box_iou_batch_sparse` when most boxes do not overlap
+    and the dense `(N, M)` result itself is too large.
+
     Args:
         boxes_true (np.ndarray): 2D `np.ndarray` representing ground-truth boxes.
             `shape = (N, 4)` where `N` is number of true objects.
@@ -42,7 +67,98 @@ def box_iou_batch(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.nda
             `shape = (N, M)` where `N` is number of true objects and
             `M` is number of detected objects.
     """
+    boxes_true = as_float_dtype(boxes_true)
+    boxes_detection = as_float_dtype(boxes_detection)
+    rows_per_chunk = max(_MAX_PAIRS // max(len(boxes_detection), 1), 1)
+    if len(boxes_true) <= rows_per_chunk:
+        return _box_iou_dense(boxes_true, boxes_detection)
+
+    result = None
+    for start in range(0, len(boxes_true), rows_per_chunk):
+        iou = _box_iou_dense(
+            boxes_true[start : start + rows_per_chunk], boxes_detection
+        )
+        if result is None:
+            result = np.empty((len(boxes_true), len(boxes_detection)), iou.dtype)
+        result[start : start + len(iou)] = iou
+    return result
+
+
+def box_iou_batch_sparse(
+    boxes_true: np.ndarray, boxes_detection: np.ndarray, iou_threshold: float = 0.0
+) -> sparse.csr_matrix:
+    """
+    Compute Intersection over Union (IoU) of two sets of bounding boxes -
+        `boxes_true` and `boxes_detection` - storing only the pairs with IoU above
+        `iou_threshold`. Both sets of boxes are expected to be in
+        `(x_min, y_min, x_max, y_max)` format.
+
+    Overlapping pairs are found with a sort-and-sweep over `x_min`, so memory and
+    time grow with the number of overlapping pairs rather than with `N * M`.
+
+    Args:
+        boxes_true (np.ndarray): 2D `np.ndarray` representing ground-truth boxes.
+            `shape = (N, 4)` where `N` is number of true objects.
+        boxes_detection (np.ndarray): 2D `np.ndarray` representing detection boxes.
+            `shape = (M, 4)` where `M` is number of detected objects.
+        iou_threshold (float): Only pairs with IoU strictly greater than this value
+            are stored. Defaults to `0`, which stores all overlapping pairs.
+
+    Returns:
+        sparse.csr_matrix: Pairwise IoU of boxes from `boxes_true` and
+            `boxes_detection` with `shape = (N, M)`. Missing entries have IoU not
+            greater than `iou_threshold`. Call `.toarray()` to get a dense matrix.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> iou = sv.box_iou_batch_sparse(boxes_true, boxes_detection)
+        >>> iou = iou.tocoo()
+        >>> iou.row, iou.col, iou.data
+        ```
+    """
+    n, m = len(boxes_true), len(boxes_detection)
+    boxes = as_float_dtype(np.concatenate((boxes_true, boxes_detection)))
+    boxes = boxes.reshape(-1, 4)
+
+    rows, columns, ious = _overlapping_pairs(
+        boxes=boxes,
+        categories=np.zeros(n + m),
+        index_a=np.arange(n),
+        index_b=np.arange(n, n + m),
+        iou=lambda a, b: _box_iou_pairs(boxes[a], boxes[b]),
+        iou_threshold=iou_threshold,
+        max_pairs=_MAX_PAIRS,
+    )
 
+    result = sparse.csr_matrix(
+        (as_float_dtype(ious), (rows, columns - n)), shape=(n, m)
+    )
+    result.sort_indices()
+    return result
+
+
+def box_iou_batch_matches(
+    boxes_true: np.ndarray, boxes_detection: np.ndarray, iou_threshold: float = 0.0
+) -> sparse.coo_matrix:
+    """
+    Returns the pairs of boxes with IoU strictly greater than `iou_threshold`, in
+    row-major order. Small inputs use the dense `box_iou_batch`, inputs with more
+    than `SPARSE_IOU_MIN_PAIRS` pairs use `box_iou_batch_sparse`.
+    """
+    if len(boxes_true) * len(boxes_detection) > SPARSE_IOU_MIN_PAIRS:
+        return box_iou_batch_sparse(
+            boxes_true=boxes_true,
+            boxes_detection=boxes_detection,
+            iou_threshold=iou_threshold,
+        ).tocoo()
+    iou = box_iou_batch(boxes_true, boxes_detection)
+    rows, columns = np.nonzero(iou > iou_threshold)
+    return sparse.coo_matrix((iou[rows, columns], (rows, columns)), shape=iou.shape)
+
+
+def _box_iou_dense(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.ndarray:
     def box_area(box):
         return (box[2] - box[0]) * (box[3] - box[1])
 
@@ -56,18 +172,204 @@ def box_iou_batch(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.nda
     return area_inter / (area_true[:, None] + area_detection - area_inter)
 
 
+def _box_iou_pairs(boxes_true: np.ndarray, boxes_detection: np.ndarray) -> np.ndarray:
+    """
+    Compute the IoU of corresponding rows of two `(N, 4)` arrays of boxes in
+    `(x_min, y_min, x_max, y_max)` format, using the same arithmetic as
+    `box_iou_batch`.
+    """
+    area_true = (boxes_true[:, 2] - boxes_true[:, 0]) * (
+        boxes_true[:, 3] - boxes_true[:, 1]
+    )
+    area_detection = (boxes_detection[:, 2] - boxes_detection[:, 0]) * (
+        boxes_detection[:, 3] - boxes_detection[:, 1]
+    )
+
+    top_left = np.maximum(boxes_true[:, :2], boxes_detection[:, :2])
+    bottom_right = np.minimum(boxes_true[:, 2:], boxes_detection[:, 2:])
+
+    area_inter = np.prod(np.clip(bottom_right - top_left, a_min=0, a_max=None), 1)
+    return area_inter / (area_true + area_detection - area_inter)
+
+
+def _mask_iou_pairs(
+    masks: Union[np.ndarray, BaseMask],
+    extents: np.ndarray,
+    areas: np.ndarray,
+    index_a: np.ndarray,
+    index_b: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the mask IoU of pairs of masks, counting the intersection only within
+    the overlap of their pixel extents `[x1, x2) x [y1, y2)`.
+    """
+    x1 = np.maximum(extents[index_a, 0], extents[index_b, 0])
+    y1 = np.maximum(extents[index_a, 1], extents[index_b, 1])
+    x2 = np.minimum(extents[index_a, 2], extents[index_b, 2])
+    y2 = np.minimum(extents[index_a, 3], extents[index_b, 3])
+
+    crops = {}
+
+    def region(index: int, k: int) -> np.ndarray:
+        if not isinstance(masks, BaseMask):
+            return masks[index, y1[k] : y2[k], x1[k] : x2[k]]
+        if index not in crops:
+            crops[index] = masks.crop(index)
+        crop, (x, y) = crops[index]
+        return crop[y1[k] - y : y2[k] - y, x1[k] - x : x2[k] - x]
+
+    ious = np.zeros(len(index_a))
+    is_candidate = (x2 > x1) & (y2 > y1) & (areas[index_a] > 0) & (areas[index_b] > 0)
+    for k in np.flatnonzero(is_candidate):
+        a, b = index_a[k], index_b[k]
+        area_inter = np.count_nonzero(region(a, k) & region(b, k))
+        ious[k] = area_inter / (areas[a] + areas[b] - area_inter)
+    return ious
+
+
+def _overlapping_pairs(
+    boxes: np.ndarray,
+    categories: np.ndarray,
+    index_a: np.ndarray,
+    index_b: np.ndarray,
+    iou: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    iou_threshold: float,
+    max_pairs: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the pairs of items from `index_a` and `index_b` that share a category and
+    have `iou` above `iou_threshold`.
+
+    Boxes of `index_a` are sorted by `(category, x_min)` and swept, so `iou` is only
+    evaluated on pairs whose x-ranges can overlap, at most `max_pairs` at a time.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Paired elements of `index_a` and
+            `index_b`, and their IoU.
+    """
+    empty = np.empty(0, dtype=int)
+    if len(index_a) == 0 or len(index_b) == 0:
+        return empty, empty, np.empty(0)
+
+    boxes_a, boxes_b = boxes[index_a], boxes[index_b]
+    categories_a, categories_b = categories[index_a], categories[index_b]
+
+    # complex numbers sort lexicographically, by category first and x_min second
+    keys = categories_a + 1j * boxes_a[:, 0]
+    order = np.argsort(keys)
+    keys = keys[order]
+    max_width = np.max(boxes_a[:, 2] - boxes_a[:, 0])
+    lower = np.searchsorted(keys, categories_b + 1j * (boxes_b[:, 0] - max_width))
+    upper = np.searchsorted(keys, categories_b + 1j * boxes_b[:, 2], side="right")
+    counts = upper - lower
+    cumulative = np.cumsum(counts)
+
+    pairs_a, pairs_b, pairs_iou = [empty], [empty], [np.empty(0)]
+    start = 0
+    while start < len(index_b):
+        end = np.searchsorted(
+            cumulative, cumulative[start] - counts[start] + max_pairs, side="right"
+        )
+        end = max(end, start + 1)
+        chunk_counts = counts[start:end]
+        chunk_offsets = np.cumsum(chunk_counts) - chunk_counts
+        chunk_b = index_b[np.repeat(np.arange(start, end), chunk_counts)]
+        chunk_a = index_a[
+            order[
+                np.repeat(lower[start:end] - chunk_offsets, chunk_counts)
+                + np.arange(chunk_counts.sum())
+            ]
+        ]
+        chunk_iou = iou(chunk_a, chunk_b)
+        is_overlapping = chunk_iou > iou_threshold
+        pairs_a.append(chunk_a[is_overlapping])
+        pairs_b.append(chunk_b[is_overlapping])
+        pairs_iou.append(chunk_iou[is_overlapping])
+        start = end
+
+    return (
+        np.concatenate(pairs_a),
+        np.concatenate(pairs_b),
+        np.concatenate(pairs_iou),
+    )
+
+
+def _greedy_suppression(
+    boxes: np.ndarray,
+    categories: np.ndarray,
+    iou: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    iou_threshold: float,
+    max_detections: int,
+    tile_size: int,
+) -> np.ndarray:
+    """
+    Runs greedy NMS over items already sorted by descending score and returns the
+    positions of the kept items.
+
+    Items are processed in tiles of `tile_size`. Each tile is first suppressed by
+    the items already kept, then resolved internally with vectorized fixed-point
+    iteration, which yields the same result as classic greedy NMS.
+    """
+    max_pairs = tile_size**2
+    kept = np.empty(0, dtype=int)
+    for start in range(0, len(boxes), tile_size):
+        if len(kept) >= max_detections:
+            break
+        tile = np.arange(start, min(start + tile_size, len(boxes)))
+
+        # drop tile items overlapping an already kept item
+        alive = np.ones(len(tile), dtype=bool)
+        _, suppressed, _ = _overlapping_pairs(
+            boxes, categories, kept, tile, iou, iou_threshold, max_pairs
+        )
+        alive[suppressed - start] = False
+
+        # item `i` can only suppress lower scoring items `j > i`
+        i, j, _ = _overlapping_pairs(
+            boxes, categories, tile[alive], tile[alive], iou, iou_threshold, max_pairs
+        )
+        is_edge = i < j
+        i, j = i[is_edge] - start, j[is_edge] - start
+
+        tile_keep = alive
+        while True:
+            updated_keep = alive.copy()
+            updated_keep[j[tile_keep[i]]] = False
+            if np.array_equal(updated_keep, tile_keep):
+                break
+            tile_keep = updated_keep
+
+        kept = np.concatenate((kept, tile[tile_keep]))
+
+    return kept[:max_detections]
+
+
 def non_max_suppression(
-    predictions: np.ndarray, iou_threshold: float = 0.5
+    predictions: np.ndarray,
+    iou_threshold: float = 0.5,
+    max_detections: Optional[int] = None,
+    tile_size: int = 1024,
 ) -> np.ndarray:
     """
     Perform Non-Maximum Suppression (NMS) on object detection predictions.
 
+    Predictions are sorted by score and processed in tiles of `tile_size`. Each tile
+    is first suppressed by the predictions already kept, then resolved internally
+    with vectorized fixed-point iteration, which yields the same result as classic
+    greedy NMS. Overlapping boxes are found with a sorted sweep over `x_min`, so the
+    memory usage stays bounded and no dense `N x N` IoU matrix is built.
+
     Args:
         predictions (np.ndarray): An array of object detection predictions in
             the format of `(x_min, y_min, x_max, y_max, score)`
             or `(x_min, y_min, x_max, y_max, score, class)`.
         iou_threshold (float, optional): The intersection-over-union threshold
             to use for non-maximum suppression.
+        max_detections (Optional[int], optional): The maximum number of predictions
+            to keep. The highest scoring predictions surviving NMS are kept. If
+            `None`, all surviving predictions are kept.
+        tile_size (int, optional): The number of predictions processed at once.
+            At most `tile_size ** 2` box pairs are evaluated at a time.
 
     Returns:
         np.ndarray: A boolean array indicating which predictions to keep after n
@@ -83,31 +385,97 @@ def non_max_suppression(
     )
     rows, columns = predictions.shape
 
-    # add column #5 - category filled with zeros for agnostic nms
-    if columns == 5:
-        predictions = np.c_[predictions, np.zeros(rows)]
+    # category filled with zeros for agnostic nms
+    categories = predictions[:, 5] if columns == 6 else np.zeros(rows)
 
     # sort predictions column #4 - score
     sort_index = np.flip(predictions[:, 4].argsort())
-    predictions = predictions[sort_index]
+    boxes = predictions[sort_index, :4]
+
+    kept = _greedy_suppression(
+        boxes=boxes,
+        categories=categories[sort_index],
+        iou=lambda a, b: _box_iou_pairs(boxes[a], boxes[b]),
+        iou_threshold=iou_threshold,
+        max_detections=rows if max_detections is None else max_detections,
+        tile_size=tile_size,
+    )
 
-    boxes = predictions[:, :4]
-    categories = predictions[:, 5]
-    ious = box_iou_batch(boxes, boxes)
-    ious = ious - np.eye(rows)
+    keep = np.zeros(rows, dtype=bool)
+    keep[sort_index[kept]] = True
+    return keep
 
-    keep = np.ones(rows, dtype=bool)
 
-    for index, (iou, category) in enumerate(zip(ious, categories)):
-        if not keep[index]:
-            continue
+def mask_non_max_suppression(
+    predictions: np.ndarray,
+    masks: Union[np.ndarray, BaseMask],
+    iou_threshold: float = 0.5,
+    max_detections: Optional[int] = None,
+    tile_size: int = 1024,
+) -> np.ndarray:
+    """
+    Perform Non-Maximum Suppression (NMS) on segmentation predictions, using the IoU
+    of their masks instead of their boxes.
 
-        # drop detections with iou > iou_threshold and
-        # same category as current detections
-        condition = (iou > iou_threshold) & (categories == category)
-        keep = keep & ~condition
+    Candidate pairs are first pre-filtered by the overlap of the tight boxes of
+    their masks, and the mask intersection is then counted only within the
+    overlapping region, so large frames do not make the suppression expensive.
 
-    return keep[sort_index.argsort()]
+    Args:
+        predictions (np.ndarray): An array of object detection predictions in
+            the format of `(x_min, y_min, x_max, y_max, score)`
+            or `(x_min, y_min, x_max, y_max, score, class)`.
+        masks (Union[np.ndarray, BaseMask]): A 3D `np.array` of shape `(N, H, W)`
+            containing 2D bool masks, a `CompressedMask` or a `CroppedMask`.
+        iou_threshold (float, optional): The mask intersection-over-union
+            threshold to use for non-maximum suppression.
+        max_detections (Optional[int], optional): The maximum number of predictions
+            to keep. The highest scoring predictions surviving NMS are kept. If
+            `None`, all surviving predictions are kept.
+        tile_size (int, optional): The number of predictions processed at once.
+
+    Returns:
+        np.ndarray: A boolean array indicating which predictions to keep after
+            non-maximum suppression.
+
+    Raises:
+        AssertionError: If `iou_threshold` is not within the
+            closed range from `0` to `1`.
+    """
+    assert 0 <= iou_threshold <= 1, (
+        "Value of `iou_threshold` must be in the closed range from 0 to 1, "
+        f"{iou_threshold} given."
+    )
+    rows, columns = predictions.shape
+
+    # category filled with zeros for agnostic nms
+    categories = predictions[:, 5] if columns == 6 else np.zeros(rows)
+
+    if isinstance(masks, BaseMask):
+        extents, areas = masks.to_xyxy(), masks.area
+    else:
+        extents = _occupancy_to_xyxy(rows=masks.any(axis=2), columns=masks.any(axis=1))
+        areas = np.count_nonzero(masks, axis=(1, 2))
+    # inclusive mask boxes to pixel ranges `[x1, x2) x [y1, y2)`
+    extents[:, 2:] += 1
+
+    # sort predictions column #4 - score
+    sort_index = np.flip(predictions[:, 4].argsort())
+
+    kept = _greedy_suppression(
+        boxes=extents[sort_index].astype(float),
+        categories=categories[sort_index],
+        iou=lambda a, b: _mask_iou_pairs(
+            masks, extents, areas, index_a=sort_index[a], index_b=sort_index[b]
+        ),
+        iou_threshold=iou_threshold,
+        max_detections=rows if max_detections is None else max_detections,
+        tile_size=tile_size,
+    )
+
+    keep = np.zeros(rows, dtype=bool)
+    keep[sort_index[kept]] = True
+    return keep
 
 
 def clip_boxes(xyxy: np.ndarray, resolution_wh: Tuple[int, int]) -> np.ndarray:
@@ -140,18 +508,22 @@ def xywh_to_xyxy(boxes_xywh: np.ndarray) -> np.ndarray:
     return xyxy
 
 
-def mask_to_xyxy(masks: np.ndarray) -> np.ndarray:
+def mask_to_xyxy(masks: Union[np.ndarray, BaseMask]) -> np.ndarray:
     """
     Converts a 3D `np.array` of 2D bool masks into a 2D `np.array` of bounding boxes.
 
     Parameters:
-        masks (np.ndarray): A 3D `np.array` of shape `(N, W, H)`
-            containing 2D bool masks
+        masks (Union[np.ndarray, BaseMask]): A 3D `np.array` of shape
+            `(N, W, H)` containing 2D bool masks, a `CompressedMask` or
+            a `CroppedMask`
 
     Returns:
         np.ndarray: A 2D `np.array` of shape `(N, 4)` containing the bounding boxes
             `(x_min, y_min, x_max, y_max)` for each mask
     """
+    if isinstance(masks, BaseMask):
+        return masks.to_xyxy()
+
     n = masks.shape[0]
     bboxes = np.zeros((n, 4), dtype=int)
 
@@ -292,7 +664,9 @@ def approximate_polygon(
     return np.squeeze(approximated_points, axis=1)
 
 
-def extract_ultralytics_masks(yolov8_results) -> Optional[np.ndarray]:
+def extract_ultralytics_masks(
+    yolov8_results, crop_masks: bool = False
+) -> Optional[Union[np.ndarray, CroppedMask]]:
     if not yolov8_results.masks:
         return None
 
@@ -315,8 +689,15 @@ def extract_ultralytics_masks(yolov8_results) -> Optional[np.ndarray]:
     top, left = int(pad[1]), int(pad[0])
     bottom, right = int(inference_shape[0] - pad[1]), int(inference_shape[1] - pad[0])
 
-    mask_maps = []
     masks = yolov8_results.masks.data.cpu().numpy()
+    if crop_masks:
+        return _crop_ultralytics_masks(
+            masks=masks[:, top:bottom, left:right],
+            xyxy=yolov8_results.boxes.xyxy.cpu().numpy(),
+            resolution_wh=(orig_shape[1], orig_shape[0]),
+        )
+
+    mask_maps = []
     for i in range(masks.shape[0]):
         mask = masks[i]
         mask = mask[top:bottom, left:right]
@@ -329,6 +710,46 @@ def extract_ultralytics_masks(yolov8_results) -> Optional[np.ndarray]:
     return np.asarray(mask_maps, dtype=bool)
 
 
+def _crop_ultralytics_masks(
+    masks: np.ndarray, xyxy: np.ndarray, resolution_wh: Tuple[int, int]
+) -> CroppedMask:
+    """
+    Resizes only the parts of the inference-resolution masks covered by the boxes,
+    instead of upscaling whole masks to the full frame resolution. The crops are
+    identical to the same regions of the masks resized with `cv2.resize`.
+    """
+    width, height = resolution_wh
+    boxes = _xyxy_to_pixel_boxes(xyxy=xyxy, resolution_wh=resolution_wh)
+
+    crops = []
+    for mask, (x1, y1, x2, y2) in zip(masks > 0, boxes):
+        x_low, x_high = _linear_resize_support(x1, x2, mask.shape[1], width)
+        y_low, y_high = _linear_resize_support(y1, y2, mask.shape[0], height)
+        crops.append(
+            mask[np.ix_(y_low, x_low)]
+            | mask[np.ix_(y_low, x_high)]
+            | mask[np.ix_(y_high, x_low)]
+            | mask[np.ix_(y_high, x_high)]
+        )
+    return CroppedMask(crops=crops, offsets=boxes[:, :2], resolution_wh=resolution_wh)
+
+
+def _linear_resize_support(
+    start: int, stop: int, source_size: int, target_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns, for the target pixels `[start, stop)` of a `cv2.resize` with
+    `INTER_LINEAR` from `source_size` to `target_size`, the two source pixels they
+    are interpolated from. Both are the same pixel when the second one has no
+    weight, so a binary mask pixel is set if either source pixel is set.
+    """
+    scale = source_size / target_size
+    position = ((np.arange(start, stop) + 0.5) * scale - 0.5).astype(np.float32)
+    low = np.floor(position).astype(int)
+    high = np.where(position > low, low + 1, low)
+    return np.clip(low, 0, source_size - 1), np.clip(high, 0, source_size - 1)
+
+
 def process_roboflow_result(
     roboflow_result: dict,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray], np.ndarray]:
@@ -442,18 +863,22 @@ def scale_boxes(xyxy: np.ndarray, factor: float) -> np.ndarray:
     return np.concatenate((centers - new_sizes / 2, centers + new_sizes / 2), axis=1)
 
 
-def calculate_masks_centroids(masks: np.ndarray) -> np.ndarray:
+def calculate_masks_centroids(masks: Union[np.ndarray, BaseMask]) -> np.ndarray:
     """
     Calculate the centroids of binary masks in a tensor.
 
     Parameters:
-        masks (np.ndarray): A 3D NumPy array of shape (num_masks, height, width).
+        masks (Union[np.ndarray, BaseMask]): A 3D NumPy array of shape
+            (num_masks, height, width), a `CompressedMask` or a `CroppedMask`.
             Each 2D array in the tensor represents a binary mask.
 
     Returns:
         A 2D NumPy array of shape (num_masks, 2), where each row contains the x and y
             coordinates (in that order) of the centroid of the corresponding mask.
     """
+    if isinstance(masks, BaseMask):
+        return masks.centroids()
+
     num_masks, height, width = masks.shape
     total_pixels = masks.sum(axis=(1, 2))
 
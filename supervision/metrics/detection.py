@@ -9,7 +9,8 @@ import numpy as np
 
 from supervision.dataset.core import DetectionDataset
 from supervision.detection.core import Detections
-from supervision.detection.utils import box_iou_batch
+from supervision.detection.utils import box_iou_batch_matches
+from supervision.utils.dtype import as_float_dtype
 
 
 def detections_to_tensor(
@@ -38,7 +39,7 @@ def detections_to_tensor(
             )
         arrays_to_concat.append(np.expand_dims(detections.confidence, 1))
 
-    return np.concatenate(arrays_to_concat, axis=1)
+    return as_float_dtype(np.concatenate(arrays_to_concat, axis=1))
 
 
 def validate_input_tensors(predictions: List[np.ndarray], targets: List[np.ndarray]):
@@ -295,15 +296,14 @@ class ConfusionMatrix:
         true_boxes = targets[:, :class_id_idx]
         detection_boxes = detection_batch_filtered[:, :class_id_idx]
 
-        iou_batch = box_iou_batch(
-            boxes_true=true_boxes, boxes_detection=detection_boxes
+        iou_batch = box_iou_batch_matches(
+            boxes_true=true_boxes,
+            boxes_detection=detection_boxes,
+            iou_threshold=iou_threshold,
         )
-        matched_idx = np.asarray(iou_batch > iou_threshold).nonzero()
 
-        if matched_idx[0].shape[0]:
-            matches = np.stack(
-                (matched_idx[0], matched_idx[1], iou_batch[matched_idx]), axis=1
-            )
+        if iou_batch.nnz:
+            matches = np.stack((iou_batch.row, iou_batch.col, iou_batch.data), axis=1)
             matches = ConfusionMatrix._drop_extra_matches(matches=matches)
         else:
             matches = np.zeros((0, 3))
@@ -769,18 +769,20 @@ class MeanAveragePrecision:
         """
         num_predictions, num_iou_levels = predictions.shape[0], iou_thresholds.shape[0]
         correct = np.zeros((num_predictions, num_iou_levels), dtype=bool)
-        iou = box_iou_batch(targets[:, :4], predictions[:, :4])
-        correct_class = targets[:, 4:5] == predictions[:, 4]
+        # only overlapping pairs are stored, the IoU of all other pairs is 0
+        iou = box_iou_batch_matches(targets[:, :4], predictions[:, :4])
+        correct_class = targets[iou.row, 4] == predictions[iou.col, 4]
 
         for i, iou_level in enumerate(iou_thresholds):
-            matched_indices = np.where((iou >= iou_level) & correct_class)
+            is_matched = (iou.data >= iou_level) & correct_class
 
-            if matched_indices[0].shape[0]:
-                combined_indices = np.stack(matched_indices, axis=1)
-                iou_values = iou[matched_indices][:, None]
-                matches = np.hstack([combined_indices, iou_values])
+            if np.any(is_matched):
+                matches = np.stack(
+                    (iou.row[is_matched], iou.col[is_matched], iou.data[is_matched]),
+                    axis=1,
+                )
 
-                if matched_indices[0].shape[0] > 1:
+                if matches.shape[0] > 1:
                     matches = matches[matches[:, 2].argsort()[::-1]]
                     matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
                     matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
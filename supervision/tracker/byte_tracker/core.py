@@ -6,6 +6,8 @@ from supervision.detection.core import Detections
 from supervision.tracker.byte_tracker import matching
 from supervision.tracker.byte_tracker.basetrack import BaseTrack, TrackState
 from supervision.tracker.byte_tracker.kalman_filter import KalmanFilter
+from supervision.utils.dtype import as_float_dtype
+from supervision.utils.tracing import traced
 
 
 class STrack(BaseTrack):
@@ -154,11 +156,13 @@ def detections2boxes(detections: Detections) -> np.ndarray:
         (np.ndarray): Detections as numpy tensors as in
             `(x_min, y_min, x_max, y_max, confidence, class_id)` order.
     """
-    return np.hstack(
-        (
-            detections.xyxy,
-            detections.confidence[:, np.newaxis],
-            detections.class_id[:, np.newaxis],
+    return as_float_dtype(
+        np.hstack(
+            (
+                detections.xyxy,
+                detections.confidence[:, np.newaxis],
+                detections.class_id[:, np.newaxis],
+            )
         )
     )
 
@@ -194,6 +198,7 @@ class ByteTrack:
         self.lost_tracks: List[STrack] = []
         self.removed_tracks: List[STrack] = []
 
+    @traced
     def update_with_detections(self, detections: Detections) -> Detections:
         """
         Updates the tracker with the provided detections and
@@ -254,6 +259,7 @@ class ByteTrack:
 
         return detections
 
+    @traced
     def update_with_tensors(self, tensors: np.ndarray) -> List[STrack]:
         """
         Updates the tracker with the provided tensors and returns the updated tracks.
@@ -3,7 +3,11 @@ from typing import List, Tuple
 import numpy as np
 from scipy.optimize import linear_sum_assignment
 
-from supervision.detection.utils import box_iou_batch
+from supervision.detection.utils import (
+    SPARSE_IOU_MIN_PAIRS,
+    box_iou_batch,
+    box_iou_batch_sparse,
+)
 
 
 def indices_to_matches(
@@ -46,7 +50,9 @@ def iou_distance(atracks: List, btracks: List) -> np.ndarray:
         btlbrs = [track.tlbr for track in btracks]
 
     _ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
-    if _ious.size != 0:
+    if _ious.size > SPARSE_IOU_MIN_PAIRS:
+        _ious = box_iou_batch_sparse(np.asarray(atlbrs), np.asarray(btlbrs)).toarray()
+    elif _ious.size != 0:
         _ious = box_iou_batch(np.asarray(atlbrs), np.asarray(btlbrs))
     cost_matrix = 1 - _ious
 
@@ -0,0 +1,148 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DTypePolicy:
+    """
+    Describes the dtypes used for arrays produced by supervision. A field set to
+    `None` keeps the dtype each function produced so far, so the default policy
+    changes nothing.
+
+    Attributes:
+        float_dtype (Optional[np.dtype]): The dtype of box coordinates, anchors,
+            confidences and IoU values, e.g. `np.float32`.
+        int_dtype (Optional[np.dtype]): The dtype of `class_id` and `tracker_id`,
+            e.g. `np.int32`.
+        mask_dtype (Optional[np.dtype]): The dtype of masks rasterized from
+            polygons, e.g. `np.uint8` or `bool`.
+    """
+
+    float_dtype: Optional[np.dtype] = None
+    int_dtype: Optional[np.dtype] = None
+    mask_dtype: Optional[np.dtype] = None
+
+
+_policy = DTypePolicy()
+# policy of the innermost `dtype_policy` block of the current thread or task
+_context_policy: ContextVar[Optional[DTypePolicy]] = ContextVar(
+    "dtype_policy", default=None
+)
+
+
+def get_dtype_policy() -> DTypePolicy:
+    """
+    Returns the dtype policy currently in effect.
+
+    Returns:
+        DTypePolicy: The current dtype policy.
+    """
+    policy = _context_policy.get()
+    return _policy if policy is None else policy
+
+
+def set_dtype_policy(
+    float_dtype: Optional[Any] = None,
+    int_dtype: Optional[Any] = None,
+    mask_dtype: Optional[Any] = None,
+) -> DTypePolicy:
+    """
+    Sets the global dtype policy followed by `Detections`, the detection utils,
+    zones, the tracker and the metrics. Calling it without arguments restores the
+    default behaviour. Within a `dtype_policy` block, the block policy still takes
+    precedence.
+
+    Args:
+        float_dtype (Optional[Any]): The dtype of box coordinates, anchors,
+            confidences and IoU values.
+        int_dtype (Optional[Any]): The dtype of `class_id` and `tracker_id`.
+        mask_dtype (Optional[Any]): The dtype of masks rasterized from polygons.
+
+    Returns:
+        DTypePolicy: The previous dtype policy.
+
+    Example:
+        ```python
+        >>> import numpy as np
+        >>> import supervision as sv
+
+        >>> sv.set_dtype_policy(
+        ...     float_dtype=np.float32, int_dtype=np.int32, mask_dtype=np.uint8
+        ... )
+        ```
+    """
+    global _policy
+    previous = _policy
+    _policy = DTypePolicy(
+        float_dtype=None if float_dtype is None else np.dtype(float_dtype),
+        int_dtype=None if int_dtype is None else np.dtype(int_dtype),
+        mask_dtype=None if mask_dtype is None else np.dtype(mask_dtype),
+    )
+    return previous
+
+
+@contextmanager
+def dtype_policy(
+    float_dtype: Optional[Any] = None,
+    int_dtype: Optional[Any] = None,
+    mask_dtype: Optional[Any] = None,
+) -> Iterator[DTypePolicy]:
+    """
+    Context manager applying a dtype policy only within its block. Fields that are
+    not given are inherited from the policy in effect.
+
+    Args:
+        float_dtype (Optional[Any]): The dtype of box coordinates, anchors,
+            confidences and IoU values.
+        int_dtype (Optional[Any]): The dtype of `class_id` and `tracker_id`.
+        mask_dtype (Optional[Any]): The dtype of masks rasterized from polygons.
+
+    Example:
+        ```python
+        >>> import numpy as np
+        >>> import supervision as sv
+
+        >>> with sv.dtype_policy(float_dtype=np.float32):
+        ...     detections = sv.Detections.from_ultralytics(result)
+        ```
+
+    Note:
+        The policy only applies to the current thread or asyncio task, so blocks
+        running concurrently in other threads do not affect each other. Use
+        `set_dtype_policy` to set the policy of all threads.
+    """
+    overrides = {
+        name: np.dtype(value)
+        for name, value in [
+            ("float_dtype", float_dtype),
+            ("int_dtype", int_dtype),
+            ("mask_dtype", mask_dtype),
+        ]
+        if value is not None
+    }
+    policy = replace(get_dtype_policy(), **overrides)
+    token = _context_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _context_policy.reset(token)
+
+
+def as_float_dtype(array: np.ndarray) -> np.ndarray:
+    """
+    Casts `array` to the policy float dtype, without copying if it already matches.
+    """
+    dtype = get_dtype_policy().float_dtype
+    return array if dtype is None else np.asarray(array).astype(dtype, copy=False)
+
+
+def as_int_dtype(array: np.ndarray) -> np.ndarray:
+    """
+    Casts `array` to the policy int dtype, without copying if it already matches.
+    """
+    dtype = get_dtype_policy().int_dtype
+    return array if dtype is None else np.asarray(array).astype(dtype, copy=False)
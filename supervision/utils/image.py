@@ -1,10 +1,14 @@
 import os
 import shutil
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 
 import cv2
 import numpy as np
 
+from supervision.utils.profiler import Profiler, _measure
+
 
 def crop_image(image: np.ndarray, xyxy: np.ndarray) -> np.ndarray:
     """
@@ -42,6 +46,11 @@ class ImageSink:
         target_dir_path: str,
         overwrite: bool = False,
         image_name_pattern: str = "image_{:05d}.png",
+        max_workers: int = 0,
+        jpeg_quality: Optional[int] = None,
+        png_compression: Optional[int] = None,
+        webp_quality: Optional[int] = None,
+        profiler: Optional[Profiler] = None,
     ):
         """
         Initialize a context manager for saving images.
@@ -52,6 +61,20 @@ class ImageSink:
                 Defaults to False.
             image_name_pattern (str, optional): The image file name pattern.
                 Defaults to "image_{:05d}.png".
+            max_workers (int, optional): The number of threads encoding and writing
+                images in the background. If `0`, images are written synchronously
+                by `save_image`. All images are written before the context exits.
+                Defaults to 0.
+            jpeg_quality (Optional[int], optional): The quality of `.jpg` and
+                `.jpeg` images, from 0 to 100. Defaults to the OpenCV default.
+            png_compression (Optional[int], optional): The compression level of
+                `.png` images, from 0 (fastest) to 9 (smallest). Defaults to the
+                OpenCV default.
+            webp_quality (Optional[int], optional): The quality of `.webp` images,
+                from 1 to 100, above 100 for lossless. Defaults to the OpenCV
+                default.
+            profiler (Optional[Profiler], optional): Records the `encode` and
+                `encode_wait` stages if given. Defaults to None.
 
         Examples:
             ```python
@@ -62,6 +85,13 @@ class ImageSink:
             ...     for image in sv.get_video_frames_generator(
             ...         source_path='source_video.mp4', stride=2):
             ...         sink.save_image(image=image)
+
+            >>> with sv.ImageSink(target_dir_path='target/directory/path',
+            ...                   image_name_pattern="image_{:05d}.jpg",
+            ...                   max_workers=4, jpeg_quality=90) as sink:
+            ...     for image in sv.get_video_frames_generator(
+            ...         source_path='source_video.mp4', stride=2):
+            ...         sink.save_image(image=image)
             ```
         """
 
@@ -69,6 +99,17 @@ class ImageSink:
         self.overwrite = overwrite
         self.image_name_pattern = image_name_pattern
         self.image_count = 0
+        self.max_workers = max_workers
+        self.profiler = profiler
+        self.encoder_params = {
+            ".jpg": _encoder_params(cv2.IMWRITE_JPEG_QUALITY, jpeg_quality),
+            ".jpeg": _encoder_params(cv2.IMWRITE_JPEG_QUALITY, jpeg_quality),
+            ".png": _encoder_params(cv2.IMWRITE_PNG_COMPRESSION, png_compression),
+            ".webp": _encoder_params(cv2.IMWRITE_WEBP_QUALITY, webp_quality),
+        }
+        self.__executor = None
+        self.__slots = None
+        self.__errors = []
 
     def __enter__(self):
         if os.path.exists(self.target_dir_path):
@@ -78,6 +119,11 @@ class ImageSink:
         else:
             os.makedirs(self.target_dir_path)
 
+        if self.max_workers > 0:
+            self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            # bounds the memory held by images waiting to be written
+            self.__slots = threading.BoundedSemaphore(2 * self.max_workers)
+            self.__errors = []
         return self
 
     def save_image(self, image: np.ndarray, image_name: Optional[str] = None):
@@ -94,8 +140,41 @@ class ImageSink:
             image_name = self.image_name_pattern.format(self.image_count)
 
         image_path = os.path.join(self.target_dir_path, image_name)
-        cv2.imwrite(image_path, image)
+        params = self.encoder_params.get(os.path.splitext(image_name)[1].lower(), [])
+        if self.__executor is None:
+            self.__write(image_path, image, params)
+        else:
+            if self.__errors:
+                raise self.__errors[0]
+            with _measure(self.profiler, "encode_wait"):
+                self.__slots.acquire()
+            future = self.__executor.submit(
+                self.__write, image_path, image.copy(), params
+            )
+            future.add_done_callback(self.__on_written)
         self.image_count += 1
 
+    def __write(self, image_path: str, image: np.ndarray, params: List[int]) -> None:
+        with _measure(self.profiler, "encode"):
+            _write_image(image_path, image, params)
+
+    def __on_written(self, future: Future) -> None:
+        self.__slots.release()
+        if future.exception() is not None:
+            self.__errors.append(future.exception())
+
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        pass
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+            if self.__errors and exc_type is None:
+                raise self.__errors[0]
+
+
+def _write_image(image_path: str, image: np.ndarray, params: List[int]) -> None:
+    if not cv2.imwrite(image_path, image, params):
+        raise OSError(f"Could not write image to {image_path}")
+
+
+def _encoder_params(flag: int, value: Optional[int]) -> List[int]:
+    return [] if value is None else [flag, int(value)]
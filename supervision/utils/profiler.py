@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import csv
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import ContextManager, Dict, Generator, Iterator, List, Optional, TypeVar
+
+import numpy as np
+
+from supervision.utils.file import save_json_file
+
+T = TypeVar("T")
+
+STAGE_FIELDS = ["count", "total_s", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+
+@dataclass
+class StageStats:
+    """
+    Latency statistics of a single pipeline stage.
+
+    Attributes:
+        count (int): The number of measurements.
+        total_s (float): The total time spent in the stage in seconds.
+        mean_ms (float): The mean latency in milliseconds.
+        p50_ms (float): The median latency in milliseconds.
+        p95_ms (float): The 95th percentile latency in milliseconds.
+        p99_ms (float): The 99th percentile latency in milliseconds.
+        max_ms (float): The maximum latency in milliseconds.
+    """
+
+    count: int
+    total_s: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, samples: List[float]) -> StageStats:
+        milliseconds = np.asarray(samples, dtype=np.float64) * 1000
+        p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+        return cls(
+            count=len(milliseconds),
+            total_s=float(milliseconds.sum() / 1000),
+            mean_ms=float(milliseconds.mean()),
+            p50_ms=float(p50),
+            p95_ms=float(p95),
+            p99_ms=float(p99),
+            max_ms=float(milliseconds.max()),
+        )
+
+
+class _Histogram:
+    """
+    Latency histogram with log-spaced buckets from 1 µs to about 20 minutes, using
+    constant memory however many samples it holds. Count, total, mean and maximum
+    are exact, percentiles are accurate to within half a bucket, about 0.5%.
+    """
+
+    MIN_SECONDS = 1e-6
+    BUCKETS_PER_OCTAVE = 64
+    BUCKET_COUNT = 30 * BUCKETS_PER_OCTAVE
+
+    def __init__(self):
+        self.counts = np.zeros(self.BUCKET_COUNT, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = 0
+        if seconds > self.MIN_SECONDS:
+            index = int(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_OCTAVE)
+        self.counts[min(index, self.BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        rank = q / 100 * (self.count - 1)
+        index = int(np.searchsorted(np.cumsum(self.counts), rank, side="right"))
+        # geometric center of the bucket, within the observed range
+        center = self.MIN_SECONDS * 2 ** ((index + 0.5) / self.BUCKETS_PER_OCTAVE)
+        return min(max(center, self.min), self.max)
+
+    def stats(self) -> StageStats:
+        p50, p95, p99 = (self.percentile(q) * 1000 for q in (50, 95, 99))
+        return StageStats(
+            count=self.count,
+            total_s=self.total,
+            mean_ms=self.total / self.count * 1000,
+            p50_ms=p50,
+            p95_ms=p95,
+            p99_ms=p99,
+            max_ms=self.max * 1000,
+        )
+
+
+@dataclass
+class ProfileReport:
+    """
+    Summary of the measurements collected by a `Profiler`.
+
+    Attributes:
+        stages (Dict[str, StageStats]): Latency statistics by stage name.
+        counters (Dict[str, int]): Event counts by name, e.g. dropped frames.
+    """
+
+    stages: Dict[str, StageStats]
+    counters: Dict[str, int]
+
+    def to_dict(self) -> dict:
+        return {
+            "stages": {name: asdict(stats) for name, stats in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+    def save(self, file_path: str) -> None:
+        """
+        Writes the report to a `.json` file, or to a `.csv` file with one row per
+        stage followed by one row per counter.
+
+        Args:
+            file_path (str): The path of the output file.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == ".json":
+            save_json_file(self.to_dict(), file_path=file_path)
+        elif extension == ".csv":
+            with open(file_path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["name"] + STAGE_FIELDS)
+                for name, stats in self.stages.items():
+                    row = asdict(stats)
+                    writer.writerow([name] + [row[field] for field in STAGE_FIELDS])
+                for name, value in self.counters.items():
+                    writer.writerow([name, value] + [""] * (len(STAGE_FIELDS) - 1))
+        else:
+            raise ValueError(
+                f"Unsupported report format '{extension}', use '.json' or '.csv'."
+            )
+
+
+class Profiler:
+    """
+    Thread-safe collector of per-stage latencies and event counters, used to find
+    the bottleneck of a video pipeline. Pass it to `process_video`,
+    `get_video_frames_generator`, `VideoSink` or `ImageSink`, or measure custom
+    stages.
+
+    Stages recorded by supervision:
+
+    - `decode`: decoding a frame, on the decoding thread when prefetching.
+    - `decode_wait`: waiting for a prefetched frame.
+    - `callback`: running the `process_video` callback.
+    - `callback_wait`: waiting for the next in-order result of parallel callbacks.
+    - `encode`: encoding and writing a frame or image, on the writer threads
+        when writing in the background.
+    - `encode_wait`: waiting for space in the encoding queue.
+
+    The `dropped_frames` counter counts frames dropped by `VideoSink`.
+
+    Latencies are kept in fixed-size histograms, so memory stays constant on long
+    runs. Percentiles are accurate to about 0.5%.
+
+    Attributes:
+        report_path (Optional[str]): A `.json` or `.csv` path the report is written
+            to when `process_video` finishes.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> profiler = sv.Profiler(report_path='profile.json')
+        >>> sv.process_video(
+        ...     source_path='source.mp4',
+        ...     target_path='target.mp4',
+        ...     callback=callback,
+        ...     profiler=profiler
+        ... )
+        >>> profiler.report().stages['callback'].p95_ms
+
+        >>> with profiler.measure('inference'):
+        ...     result = model(frame)
+        ```
+    """
+
+    def __init__(self, report_path: Optional[str] = None):
+        self.report_path = report_path
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Records a single latency measurement.
+
+        Args:
+            stage (str): The name of the stage.
+            seconds (float): The measured latency in seconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram()
+            histogram.add(seconds)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """
+        Increments an event counter.
+
+        Args:
+            counter (str): The name of the counter.
+            value (int): The increment. Defaults to `1`.
+        """
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + value
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Context manager recording the time spent within its block.
+
+        Args:
+            stage (str): The name of the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """
+        Removes all measurements and counters.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def report(self) -> ProfileReport:
+        """
+        Summarizes the measurements collected so far.
+
+        Returns:
+            ProfileReport: Latency percentiles by stage and the counters.
+        """
+        with self._lock:
+            return ProfileReport(
+                stages={
+                    stage: histogram.stats()
+                    for stage, histogram in self._histograms.items()
+                },
+                counters=dict(self._counters),
+            )
+
+
+def _timed(
+    iterator: Iterator[T], profiler: Profiler, stage: str
+) -> Generator[T, None, None]:
+    """
+    Yields the items of `iterator`, recording the time each one took to produce.
+    """
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            profiler.record(stage, time.perf_counter() - start)
+            yield item
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()
+
+
+def _measure(profiler: Optional[Profiler], stage: str) -> ContextManager:
+    return nullcontext() if profiler is None else profiler.measure(stage)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from supervision.utils.profiler import ProfileReport, StageStats
+
+F = TypeVar("F", bound=Callable)
+
+
+class Tracer:
+    """
+    Records every call of the supervision hot-path methods, such as `annotate`,
+    `ByteTrack.update_with_tensors`, `PolygonZone.trigger` or `Detections.merge`,
+    while tracing is enabled. Calls are aggregated into per-method statistics and
+    can be exported as a Chrome trace, to be opened in `chrome://tracing` or
+    [Perfetto](https://ui.perfetto.dev).
+
+    Use `sv.tracing()` or `sv.enable_tracing()` to create an active tracer.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> with sv.tracing() as tracer:
+        ...     for frame in sv.get_video_frames_generator(source_path='source.mp4'):
+        ...         detections = tracker.update_with_detections(detections)
+        ...         frame = box_annotator.annotate(frame, detections)
+
+        >>> tracer.report().stages['BoundingBoxAnnotator.annotate'].p95_ms
+        >>> tracer.save_chrome_trace('trace.json')
+        ```
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        # name, start and duration in seconds since origin, thread id
+        self._events: List[Tuple[str, float, float, int]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Records a call of `name` between two `time.perf_counter()` readings.
+
+        Args:
+            name (str): The name of the traced call.
+            start (float): The time the call started.
+            end (float): The time the call ended.
+        """
+        event = (name, start - self._origin, end - start, threading.get_ident())
+        with self._lock:
+            self._events.append(event)
+
+    def report(self) -> ProfileReport:
+        """
+        Aggregates the recorded calls into per-method statistics.
+
+        Returns:
+            ProfileReport: Latency percentiles by traced method.
+        """
+        with self._lock:
+            events = list(self._events)
+        durations: Dict[str, List[float]] = {}
+        for name, _, duration, _ in events:
+            durations.setdefault(name, []).append(duration)
+        return ProfileReport(
+            stages={
+                name: StageStats.from_samples(values)
+                for name, values in durations.items()
+            },
+            counters={},
+        )
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Returns:
+            dict: The recorded calls in the Chrome trace event format.
+        """
+        with self._lock:
+            events = list(self._events)
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "supervision",
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                for name, start, duration, tid in events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, file_path: str) -> None:
+        """
+        Writes the recorded calls to a Chrome trace JSON file.
+
+        Args:
+            file_path (str): The path of the output file.
+        """
+        with open(file_path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+_tracer: Optional[Tracer] = None
+# tracer of the innermost `tracing` block of the current thread or task
+_context_tracer: ContextVar[Optional[Tracer]] = ContextVar("tracer", default=None)
+
+
+def enable_tracing() -> Tracer:
+    """
+    Starts recording the calls of the supervision hot-path methods in all threads.
+    Within a `tracing` block, the block tracer still takes precedence.
+
+    Returns:
+        Tracer: The new active tracer.
+    """
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """
+    Stops recording calls.
+
+    Returns:
+        Optional[Tracer]: The tracer that was active, if any.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+@contextmanager
+def tracing() -> Iterator[Tracer]:
+    """
+    Context manager recording the calls of the supervision hot-path methods
+    within its block.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> with sv.tracing() as tracer:
+        ...     annotated_frame = box_annotator.annotate(frame, detections)
+        >>> tracer.save_chrome_trace('trace.json')
+        ```
+
+    Note:
+        The block only records calls made by the current thread or asyncio task,
+        and by the callbacks `process_video` runs on its threads. Use
+        `enable_tracing` to record the calls of all threads.
+    """
+    tracer = Tracer()
+    token = _context_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _context_tracer.reset(token)
+
+
+def traced(function: F) -> F:
+    """
+    Marks a function as a traced hot-path call. While tracing is disabled, the
+    only overhead is a context variable and a global lookup.
+    """
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        tracer = _context_tracer.get() or _tracer
+        if tracer is None:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            tracer.record(name, start, time.perf_counter())
+
+    return wrapper
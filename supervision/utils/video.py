@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
 import time
+import warnings
 from collections import deque
-from dataclasses import dataclass
-from typing import Callable, Generator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, replace
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import cv2
 import numpy as np
 
+from supervision.detection.core import Detections
+from supervision.detection.mask import BaseMask, CroppedMask
+from supervision.utils.profiler import Profiler, _measure, _timed
+
 
 @dataclass
 class VideoInfo:
@@ -63,11 +88,24 @@ class VideoSink:
     """
     Context manager that saves video frames to a file using OpenCV.
 
+    Frames can optionally be encoded on a background thread. With `queue_size > 0`,
+    `write_frame` only enqueues a copy of the frame and returns, while a writer
+    thread encodes queued frames in order. When the queue is full, `write_frame`
+    either waits for a free slot or, with `drop_frames=True`, drops the frame.
+    All queued frames are encoded before `__exit__` returns, also when the block
+    exits with an exception.
+
     Attributes:
         target_path (str): The path to the output file where the video will be saved.
         video_info (VideoInfo): Information about the video resolution, fps,
             and total frame count.
         codec (str): FOURCC code for video format
+        queue_size (int): The maximum number of frames waiting to be encoded on
+            the background thread. If `0`, frames are encoded synchronously.
+        drop_frames (bool): Whether to drop frames instead of waiting when the
+            queue is full. Ignored if `queue_size` is `0`.
+        profiler (Optional[Profiler]): Records the `encode` and `encode_wait`
+            stages and the `dropped_frames` counter if given.
 
     Example:
         ```python
@@ -79,34 +117,413 @@ class VideoSink:
         >>> with sv.VideoSink(target_path='target.mp4', video_info=video_info) as sink:
         ...     for frame in frames_generator:
         ...         sink.write_frame(frame=frame)
+
+        >>> with sv.VideoSink(
+        ...     target_path='target.mp4', video_info=video_info, queue_size=16
+        ... ) as sink:
+        ...     for frame in frames_generator:
+        ...         sink.write_frame(frame=frame)
+        >>> sink.peak_queue_depth, sink.dropped_frames
         ```
     """
 
-    def __init__(self, target_path: str, video_info: VideoInfo, codec: str = "mp4v"):
+    def __init__(
+        self,
+        target_path: str,
+        video_info: VideoInfo,
+        codec: str = "mp4v",
+        queue_size: int = 0,
+        drop_frames: bool = False,
+        profiler: Optional[Profiler] = None,
+    ):
         self.target_path = target_path
         self.video_info = video_info
+        self.queue_size = queue_size
+        self.drop_frames = drop_frames
+        self.profiler = profiler
+        self.dropped_frames = 0
+        self.peak_queue_depth = 0
         self.__codec = codec
         self.__writer = None
+        self.__queue = None
+        self.__thread = None
+        self.__error = None
 
     def __enter__(self):
+        self.__writer = self._create_writer()
+        self.dropped_frames = 0
+        self.peak_queue_depth = 0
+        self.__error = None
+        if self.queue_size > 0:
+            self.__queue = queue.Queue(maxsize=self.queue_size)
+            self.__thread = threading.Thread(target=self.__encode, daemon=True)
+            self.__thread.start()
+        return self
+
+    def _create_writer(self):
+        """
+        Returns the object encoding the frames, which must provide `write(frame)`
+        and `release()` like `cv2.VideoWriter`.
+        """
         try:
             self.__fourcc = cv2.VideoWriter_fourcc(*self.__codec)
         except TypeError as e:
             print(str(e) + ". Defaulting to mp4v...")
             self.__fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        self.__writer = cv2.VideoWriter(
+        return cv2.VideoWriter(
             self.target_path,
             self.__fourcc,
             self.video_info.fps,
             self.video_info.resolution_wh,
         )
-        return self
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns:
+            int: The number of frames currently waiting to be encoded.
+        """
+        return 0 if self.__queue is None else self.__queue.qsize()
 
     def write_frame(self, frame: np.ndarray):
-        self.__writer.write(frame)
+        if self.__queue is None:
+            with _measure(self.profiler, "encode"):
+                self.__writer.write(frame)
+            return
+
+        if self.__error is not None:
+            raise self.__error
+        frame = frame.copy()
+        if self.drop_frames:
+            try:
+                self.__queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped_frames += 1
+                if self.profiler is not None:
+                    self.profiler.increment("dropped_frames")
+                return
+        else:
+            with _measure(self.profiler, "encode_wait"):
+                self.__queue.put(frame)
+        self.peak_queue_depth = max(self.peak_queue_depth, self.__queue.qsize())
+
+    def __encode(self) -> None:
+        while True:
+            frame = self.__queue.get()
+            if frame is None:
+                return
+            if self.__error is not None:
+                continue
+            try:
+                with _measure(self.profiler, "encode"):
+                    self.__writer.write(frame)
+            except Exception as error:
+                self.__error = error
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self.__thread is not None:
+            self.__queue.put(None)
+            self.__thread.join()
+            self.__thread = None
+            self.__queue = None
         self.__writer.release()
+        if self.__error is not None and exc_type is None:
+            raise self.__error
+
+
+class _FFmpegWriter:
+    """
+    Pipes raw BGR frames to an `ffmpeg` subprocess, mirroring the `write` and
+    `release` methods of `cv2.VideoWriter`.
+    """
+
+    def __init__(self, command: List[str], resolution_wh: Tuple[int, int]):
+        self.resolution_wh = resolution_wh
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    def write(self, frame: np.ndarray) -> None:
+        width, height = self.resolution_wh
+        if frame.shape[:2] != (height, width):
+            raise ValueError(
+                f"Frame of shape {frame.shape} does not match the video resolution "
+                f"{width}x{height}."
+            )
+        try:
+            self.process.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        except BrokenPipeError:
+            raise Exception(f"ffmpeg exited unexpectedly: {self.__stderr()}")
+
+    def release(self) -> None:
+        if self.process.stdin.closed:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self.process.wait() != 0:
+            raise Exception(f"ffmpeg failed: {self.__stderr()}")
+
+    def __stderr(self) -> str:
+        self.process.wait()
+        return self.process.stderr.read().decode(errors="replace").strip()
+
+
+class FFmpegVideoSink(VideoSink):
+    """
+    Context manager that saves video frames to a file by piping them to a local
+    `ffmpeg` executable, which produces much faster and smaller encodes than
+    OpenCV, e.g. with H.264. It is used exactly like `VideoSink`, and falls back
+    to OpenCV with the `mp4v` codec if `ffmpeg` cannot be found.
+
+    Attributes:
+        target_path (str): The path to the output file where the video will be saved.
+        video_info (VideoInfo): Information about the video resolution, fps,
+            and total frame count.
+        codec (str): The ffmpeg video encoder, e.g. `libx264`, `libx265` or
+            `libvpx-vp9`.
+        preset (Optional[str]): The encoder preset trading speed for size, e.g.
+            `ultrafast` or `medium` for `libx264`. If None, the encoder default.
+        crf (Optional[int]): The constant rate factor, lower values give higher
+            quality and larger files. If None, the encoder default.
+        threads (int): The number of encoder threads, `0` lets ffmpeg decide.
+        ffmpeg_path (str): The name or path of the ffmpeg executable.
+        queue_size (int): See `VideoSink`.
+        drop_frames (bool): See `VideoSink`.
+        profiler (Optional[Profiler]): See `VideoSink`.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> video_info = sv.VideoInfo.from_video_path('source.mp4')
+        >>> frames_generator = sv.get_video_frames_generator('source.mp4')
+
+        >>> with sv.FFmpegVideoSink(
+        ...     target_path='target.mp4', video_info=video_info, crf=23
+        ... ) as sink:
+        ...     for frame in frames_generator:
+        ...         sink.write_frame(frame=frame)
+        ```
+    """
+
+    def __init__(
+        self,
+        target_path: str,
+        video_info: VideoInfo,
+        codec: str = "libx264",
+        preset: Optional[str] = "veryfast",
+        crf: Optional[int] = 23,
+        threads: int = 0,
+        ffmpeg_path: str = "ffmpeg",
+        queue_size: int = 0,
+        drop_frames: bool = False,
+        profiler: Optional[Profiler] = None,
+    ):
+        super().__init__(
+            target_path=target_path,
+            video_info=video_info,
+            queue_size=queue_size,
+            drop_frames=drop_frames,
+            profiler=profiler,
+        )
+        self.codec = codec
+        self.preset = preset
+        self.crf = crf
+        self.threads = threads
+        self.ffmpeg_path = ffmpeg_path
+
+    def _create_writer(self):
+        executable = shutil.which(self.ffmpeg_path)
+        if executable is None:
+            warnings.warn(
+                f"{self.ffmpeg_path} not found, falling back to OpenCV with mp4v."
+            )
+            return super()._create_writer()
+
+        width, height = self.video_info.resolution_wh
+        command = [
+            executable,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(self.video_info.fps),
+            "-i",
+            "-",
+            "-c:v",
+            self.codec,
+            "-threads",
+            str(self.threads),
+            "-pix_fmt",
+            "yuv420p",
+        ]
+        if self.preset is not None:
+            command += ["-preset", self.preset]
+        if self.crf is not None:
+            command += ["-crf", str(self.crf)]
+        command.append(self.target_path)
+        return _FFmpegWriter(command=command, resolution_wh=(width, height))
+
+
+@dataclass
+class VideoKeyframeIndex:
+    """
+    Index of the keyframes of a video, used to seek to the nearest keyframe instead
+    of decoding every frame in between when sampling with a large stride, starting
+    in the middle of a video or extracting frames at random positions.
+
+    The index is built by reading the compressed packets of the video without
+    decoding them, and stored next to the video so that it is built only once.
+
+    Attributes:
+        keyframes (np.ndarray): A sorted array containing the indices of the
+            keyframes of the video.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> video_info = sv.VideoInfo.from_video_path('source.mp4')
+        >>> keyframe_index = sv.VideoKeyframeIndex.from_video_path('source.mp4')
+
+        >>> # one frame per second
+        >>> for frame in sv.get_video_frames_generator(
+        ...     source_path='source.mp4',
+        ...     stride=video_info.fps,
+        ...     keyframe_index=keyframe_index
+        ... ):
+        ...     ...
+        ```
+
+    Note:
+        For codecs that reorder frames, e.g. with B-frames, keyframe positions are
+        approximated by their position in decoding order. This only affects how
+        often seeking is used, never which frames are returned.
+    """
+
+    keyframes: np.ndarray
+
+    @classmethod
+    def from_video_path(
+        cls, video_path: str, index_path: Optional[str] = None
+    ) -> VideoKeyframeIndex:
+        """
+        Loads the keyframe index of a video, building and saving it first if it
+        does not exist yet or is older than the video.
+
+        Args:
+            video_path (str): The path of the video file.
+            index_path (Optional[str]): The path of the index file. Defaults to
+                the video path followed by `.keyframes.npy`.
+
+        Returns:
+            VideoKeyframeIndex: The keyframe index of the video.
+        """
+        index_path = index_path or f"{video_path}.keyframes.npy"
+        if os.path.exists(index_path) and os.path.getmtime(
+            index_path
+        ) >= os.path.getmtime(video_path):
+            return cls(keyframes=np.load(index_path))
+
+        keyframe_index = cls.build(video_path=video_path)
+        try:
+            with open(index_path, "wb") as file:
+                np.save(file, keyframe_index.keyframes)
+        except OSError:
+            # e.g. a read-only directory, the index can still be used in memory
+            pass
+        return keyframe_index
+
+    @classmethod
+    def build(cls, video_path: str) -> VideoKeyframeIndex:
+        """
+        Builds the keyframe index of a video without saving it.
+
+        Args:
+            video_path (str): The path of the video file.
+
+        Returns:
+            VideoKeyframeIndex: The keyframe index of the video. If the video
+                backend cannot read compressed packets, only the first frame is
+                considered a keyframe, which disables seeking.
+        """
+        video = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+        keyframes = [0]
+        if video.isOpened() and video.get(cv2.CAP_PROP_FORMAT) == -1:
+            frame_index = 0
+            while video.grab():
+                if video.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(frame_index)
+                frame_index += 1
+        video.release()
+        return cls(keyframes=np.unique(keyframes))
+
+    def nearest_keyframe(self, frame_index: int) -> int:
+        """
+        Returns:
+            int: The index of the last keyframe at or before `frame_index`.
+        """
+        position = np.searchsorted(self.keyframes, frame_index, side="right") - 1
+        return int(self.keyframes[max(position, 0)])
+
+
+class _FrameRing:
+    """
+    Decodes frames into a ring of `size` reused buffers, allocated on first use.
+    With `size == 0`, every frame is decoded into a new array.
+    """
+
+    def __init__(self, size: int = 0):
+        self.frames = [None] * size
+        self.position = 0
+
+    def read(self, video: cv2.VideoCapture) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.frames:
+            return video.read()
+        success, frame = video.read(self.frames[self.position])
+        if success:
+            self.frames[self.position] = frame
+            self.position = (self.position + 1) % len(self.frames)
+        return success, frame
+
+
+def _read_frames_at(
+    video: cv2.VideoCapture,
+    frame_indices: Iterable[int],
+    keyframe_index: VideoKeyframeIndex,
+    ring: Optional[_FrameRing] = None,
+) -> Generator[np.ndarray, None, None]:
+    ring = ring or _FrameRing()
+    position = int(video.get(cv2.CAP_PROP_POS_FRAMES))
+    try:
+        for frame_index in frame_indices:
+            keyframe = keyframe_index.nearest_keyframe(frame_index)
+            # seek only if it skips decoding frames, otherwise decode forward
+            if frame_index < position or keyframe > position:
+                video.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+                position = keyframe
+            while position < frame_index:
+                if not video.grab():
+                    return
+                position += 1
+            success, frame = ring.read(video)
+            if not success:
+                return
+            position += 1
+            yield frame
+    finally:
+        video.release()
 
 
 def _validate_and_setup_video(source_path: str, start: int, end: Optional[int]):
@@ -122,8 +539,96 @@ def _validate_and_setup_video(source_path: str, start: int, end: Optional[int]):
     return video, start, end
 
 
+T = TypeVar("T")
+
+
+class _ProducerError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_END_OF_STREAM = object()
+
+
+def _prefetch(iterator: Iterator[T], depth: int) -> Generator[T, None, None]:
+    """
+    Consumes `iterator` on a background thread into a queue holding at most `depth`
+    items and yields them in order. Exceptions raised by `iterator` are re-raised
+    in the consumer. When the consumer stops early, the background thread is
+    stopped and `iterator` is closed on it before this generator returns.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if not put(item):
+                    break
+        except BaseException as error:
+            put(_ProducerError(error))
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+            put(_END_OF_STREAM)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _read_frames(
+    video: cv2.VideoCapture,
+    start: int,
+    end: int,
+    stride: int,
+    ring: Optional[_FrameRing] = None,
+) -> Generator[np.ndarray, None, None]:
+    ring = ring or _FrameRing()
+    frame_position = start
+    try:
+        while frame_position < end:
+            success, frame = ring.read(video)
+            if not success:
+                break
+            yield frame
+            for _ in range(stride - 1):
+                success = video.grab()
+                if not success:
+                    break
+            frame_position += stride
+    finally:
+        video.release()
+
+
 def get_video_frames_generator(
-    source_path: str, stride: int = 1, start: int = 0, end: Optional[int] = None
+    source_path: str,
+    stride: int = 1,
+    start: int = 0,
+    end: Optional[int] = None,
+    prefetch: int = 0,
+    keyframe_index: Optional[VideoKeyframeIndex] = None,
+    ring_size: int = 0,
+    profiler: Optional[Profiler] = None,
 ) -> Generator[np.ndarray, None, None]:
     """
     Get a generator that yields the frames of the video.
@@ -136,6 +641,18 @@ def get_video_frames_generator(
             video should generate frames
         end (Optional[int]): Indicates the ending position at which video
             should stop generating frames. If None, video will be read to the end.
+        prefetch (int): The number of frames decoded ahead on a background thread,
+            so that decoding overlaps with the processing of the yielded frames.
+            If `0`, frames are decoded on the calling thread. Defaults to `0`.
+        keyframe_index (Optional[VideoKeyframeIndex]): The keyframe index of the
+            video. If given, skipped frames are not decoded whenever a keyframe
+            lies between two returned frames, and `start` is reached by seeking to
+            the nearest keyframe.
+        ring_size (int): The number of preallocated buffers frames are decoded
+            into, reused in turn so that no memory is allocated once the ring is
+            full. If `0`, every frame is a new array. Defaults to `0`.
+        profiler (Optional[Profiler]): Records the `decode` stage, and the
+            `decode_wait` stage when prefetching, if given.
 
     Returns:
         (Generator[np.ndarray, None, None]): A generator that yields the
@@ -147,32 +664,404 @@ def get_video_frames_generator(
 
         >>> for frame in sv.get_video_frames_generator(source_path='source_video.mp4'):
         ...     ...
+
+        >>> for frame in sv.get_video_frames_generator(
+        ...     source_path='source_video.mp4', prefetch=8
+        ... ):
+        ...     ...
         ```
+
+    !!! warning
+
+        With `ring_size > 0`, a yielded frame is overwritten by a later frame.
+        Only the last `ring_size` yielded frames stay valid, or the last
+        `ring_size - prefetch - 1` frames when prefetching, as the background
+        thread decodes ahead. Copy frames that need to be kept longer.
+    """
+    if prefetch > 0 and 0 < ring_size <= prefetch + 1:
+        raise ValueError(
+            f"ring_size must be greater than prefetch + 1, got {ring_size} "
+            f"and prefetch={prefetch}."
+        )
+    ring = _FrameRing(size=ring_size)
+    if keyframe_index is None:
+        video, start, end = _validate_and_setup_video(source_path, start, end)
+        frames = _read_frames(
+            video=video, start=start, end=end, stride=stride, ring=ring
+        )
+    else:
+        video, _, end = _validate_and_setup_video(source_path, 0, end)
+        frames = _read_frames_at(
+            video=video,
+            frame_indices=range(max(start, 0), end, stride),
+            keyframe_index=keyframe_index,
+            ring=ring,
+        )
+    if profiler is not None:
+        frames = _timed(frames, profiler=profiler, stage="decode")
+    if prefetch > 0:
+        frames = _prefetch(frames, depth=prefetch)
+        if profiler is not None:
+            frames = _timed(frames, profiler=profiler, stage="decode_wait")
+    yield from frames
+
+
+def get_video_frames_at(
+    source_path: str,
+    frame_indices: Iterable[int],
+    keyframe_index: Optional[VideoKeyframeIndex] = None,
+) -> Generator[np.ndarray, None, None]:
+    """
+    Get a generator that yields the frames of the video at the given indices,
+    seeking to the nearest keyframe before each frame when that avoids decoding.
+
+    Args:
+        source_path (str): The path of the video file.
+        frame_indices (Iterable[int]): The indices of the frames to return,
+            in any order.
+        keyframe_index (Optional[VideoKeyframeIndex]): The keyframe index of the
+            video. If None, it is loaded with `VideoKeyframeIndex.from_video_path`,
+            which builds and saves it next to the video the first time.
+
+    Returns:
+        (Generator[np.ndarray, None, None]): A generator that yields the frames at
+            `frame_indices`. It stops early at the first index past the end of
+            the video.
+
+    Examples:
+        ```python
+        >>> import supervision as sv
+
+        >>> for frame in sv.get_video_frames_at(
+        ...     source_path='source_video.mp4', frame_indices=[300, 20, 4500]
+        ... ):
+        ...     ...
+        ```
+    """
+    if keyframe_index is None:
+        keyframe_index = VideoKeyframeIndex.from_video_path(video_path=source_path)
+    video, _, _ = _validate_and_setup_video(source_path, 0, None)
+    yield from _read_frames_at(
+        video=video, frame_indices=frame_indices, keyframe_index=keyframe_index
+    )
+
+
+def get_video_frames_batch_generator(
+    source_path: str,
+    batch_size: int,
+    stride: int = 1,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+    """
+    Get a generator that yields batches of frames of the video, decoded directly
+    into a single preallocated buffer of shape `(batch_size, H, W, 3)`.
+
+    Args:
+        source_path (str): The path of the video file.
+        batch_size (int): The maximum number of frames in a batch.
+        stride (int): Indicates the interval at which frames are returned,
+            skipping stride - 1 frames between each.
+        start (int): Indicates the starting position from which
+            video should generate frames
+        end (Optional[int]): Indicates the ending position at which video
+            should stop generating frames. If None, video will be read to the end.
+
+    Returns:
+        (Generator[Tuple[np.ndarray, np.ndarray], None, None]): A generator that
+            yields tuples of a contiguous array of shape `(B, H, W, 3)` holding
+            the frames of the batch and an array of shape `(B,)` holding their
+            indices in the video. `B` equals `batch_size` except for the last,
+            possibly partial batch.
+
+    Examples:
+        ```python
+        >>> import supervision as sv
+
+        >>> for frames, indices in sv.get_video_frames_batch_generator(
+        ...     source_path='source_video.mp4', batch_size=8
+        ... ):
+        ...     results = model(frames)
+        ```
+
+    !!! warning
+
+        The buffer is reused, so the frames of a batch are overwritten when the
+        next batch is requested. Copy them if they need to be kept longer.
     """
     video, start, end = _validate_and_setup_video(source_path, start, end)
-    frame_position = start
-    while True:
-        success, frame = video.read()
-        if not success or frame_position >= end:
-            break
-        yield frame
-        for _ in range(stride - 1):
-            success = video.grab()
+    video_info = VideoInfo.from_video_path(video_path=source_path)
+    frames = np.empty(
+        (batch_size, video_info.height, video_info.width, 3), dtype=np.uint8
+    )
+    indices = np.empty(batch_size, dtype=np.int64)
+
+    count, frame_position = 0, start
+    try:
+        while frame_position < end:
+            success, frame = video.read(frames[count])
             if not success:
                 break
-        frame_position += stride
-    video.release()
+            if not np.shares_memory(frame, frames):
+                frames[count] = frame
+            indices[count] = frame_position
+            count += 1
+            if count == batch_size:
+                yield frames, indices
+                count = 0
+            for _ in range(stride - 1):
+                if not video.grab():
+                    break
+            frame_position += stride
+        if count > 0:
+            yield frames[:count], indices[:count]
+    finally:
+        video.release()
+
+
+@dataclass(frozen=True)
+class ScaleTransform:
+    """
+    Maps coordinates from a resized copy of a frame, e.g. the input of a detector,
+    back to the frame it was resized from.
+
+    Attributes:
+        source_wh (Tuple[int, int]): The resolution of the original frame.
+        target_wh (Tuple[int, int]): The resolution of the resized frame.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> transform = sv.ScaleTransform(source_wh=(3840, 2160), target_wh=(640, 360))
+        >>> detections = transform.detections_to_source(detections)
+        ```
+    """
+
+    source_wh: Tuple[int, int]
+    target_wh: Tuple[int, int]
+
+    @property
+    def factors(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The `[x, y]` factors mapping resized to original coordinates.
+        """
+        return np.array(self.source_wh) / np.array(self.target_wh)
+
+    def boxes_to_source(self, xyxy: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            xyxy (np.ndarray): An array of shape `(n, 4)` containing boxes in the
+                coordinates of the resized frame.
+
+        Returns:
+            np.ndarray: The boxes in the coordinates of the original frame.
+        """
+        return xyxy * np.tile(self.factors, 2)
+
+    def detections_to_source(self, detections: Detections) -> Detections:
+        """
+        Maps detections found on the resized frame to the original frame, scaling
+        their boxes and resizing their masks.
+
+        Args:
+            detections (Detections): Detections in the coordinates of the
+                resized frame.
+
+        Returns:
+            Detections: A new Detections object in the coordinates of the
+                original frame.
+        """
+        mask = detections.mask
+        if isinstance(mask, CroppedMask):
+            mask = self._cropped_mask_to_source(mask)
+        elif mask is not None:
+            dense = mask.to_dense() if isinstance(mask, BaseMask) else mask
+            resized = np.array(
+                [
+                    cv2.resize(
+                        np.asarray(m, dtype=np.uint8),
+                        self.source_wh,
+                        interpolation=cv2.INTER_NEAREST,
+                    )
+                    for m in dense
+                ],
+                dtype=bool,
+            ).reshape(len(dense), self.source_wh[1], self.source_wh[0])
+            mask = (
+                type(mask).from_dense(resized)
+                if isinstance(mask, BaseMask)
+                else resized
+            )
+        return replace(
+            detections, xyxy=self.boxes_to_source(detections.xyxy), mask=mask
+        )
+
+    def _cropped_mask_to_source(self, mask: CroppedMask) -> CroppedMask:
+        """
+        Resizes every crop on its own, giving the same result as resizing the dense
+        masks with `cv2.INTER_NEAREST` without allocating full-resolution planes.
+        """
+        x_index = _nearest_resize_indices(self.target_wh[0], self.source_wh[0])
+        y_index = _nearest_resize_indices(self.target_wh[1], self.source_wh[1])
+        crops, offsets = [], []
+        for crop, (x, y) in zip(mask.crops, mask.offsets):
+            height, width = crop.shape
+            x1, x2 = np.searchsorted(x_index, [x, x + width])
+            y1, y2 = np.searchsorted(y_index, [y, y + height])
+            crops.append(crop[np.ix_(y_index[y1:y2] - y, x_index[x1:x2] - x)])
+            offsets.append((x1, y1))
+        return CroppedMask(
+            crops=crops,
+            offsets=np.array(offsets, dtype=int).reshape(-1, 2),
+            resolution_wh=self.source_wh,
+        )
+
+
+def _nearest_resize_indices(size: int, resized_size: int) -> np.ndarray:
+    """
+    Returns, for every pixel of an axis resized from `size` to `resized_size` pixels
+    with `cv2.INTER_NEAREST`, the pixel it is taken from. The result is sorted.
+    """
+    scale = 1.0 / (resized_size / size)
+    indices = np.floor(np.arange(resized_size) * scale).astype(int)
+    return np.minimum(indices, size - 1)
+
+
+class ScaledFrame:
+    """
+    A decoded frame together with a downscaled copy for inference and the
+    transform mapping detections on the copy back to the frame.
+
+    Attributes:
+        frame (np.ndarray): The frame at full resolution.
+        transform (ScaleTransform): The transform from `inference_frame`
+            coordinates to `frame` coordinates.
+    """
+
+    def __init__(self, frame: np.ndarray, transform: ScaleTransform):
+        self.frame = frame
+        self.transform = transform
+        self.__inference_frame = None
+
+    @property
+    def inference_frame(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The frame resized to `transform.target_wh`, computed on first
+                access.
+        """
+        if self.__inference_frame is None:
+            if self.transform.target_wh == self.transform.source_wh:
+                self.__inference_frame = self.frame
+            else:
+                self.__inference_frame = cv2.resize(
+                    self.frame, self.transform.target_wh, interpolation=cv2.INTER_AREA
+                )
+        return self.__inference_frame
+
+
+def get_video_scaled_frames_generator(
+    source_path: str,
+    max_size: int,
+    stride: int = 1,
+    start: int = 0,
+    end: Optional[int] = None,
+    prefetch: int = 0,
+    lazy: bool = True,
+) -> Generator[ScaledFrame, None, None]:
+    """
+    Get a generator that yields the frames of the video together with a copy
+    downscaled for inference and the transform mapping detections on the copy back
+    to full resolution.
+
+    Args:
+        source_path (str): The path of the video file.
+        max_size (int): The length of the longer side of the inference frames.
+            Frames that are already smaller are not resized.
+        stride (int): Indicates the interval at which frames are returned,
+            skipping stride - 1 frames between each.
+        start (int): Indicates the starting position from which
+            video should generate frames
+        end (Optional[int]): Indicates the ending position at which video
+            should stop generating frames. If None, video will be read to the end.
+        prefetch (int): The number of frames decoded ahead on a background thread.
+            See `get_video_frames_generator`. Defaults to `0`.
+        lazy (bool): Whether the inference frame is only computed when accessed.
+            If False, it is computed right after decoding, on the background
+            thread when prefetching. Defaults to True.
+
+    Returns:
+        (Generator[ScaledFrame, None, None]): A generator that yields the frames
+            of the video.
+
+    Examples:
+        ```python
+        >>> import supervision as sv
+
+        >>> for scaled_frame in sv.get_video_scaled_frames_generator(
+        ...     source_path='source_video.mp4', max_size=640
+        ... ):
+        ...     result = model(scaled_frame.inference_frame)[0]
+        ...     detections = sv.Detections.from_ultralytics(result)
+        ...     detections = scaled_frame.transform.detections_to_source(detections)
+        ```
+
+    Note:
+        OpenCV always decodes at full resolution; inference frames are resized
+        from the decoded frames.
+    """
+    video_info = VideoInfo.from_video_path(video_path=source_path)
+    source_wh = video_info.resolution_wh
+    scale = min(max_size / max(source_wh), 1.0)
+    transform = ScaleTransform(
+        source_wh=source_wh,
+        target_wh=(
+            max(round(source_wh[0] * scale), 1),
+            max(round(source_wh[1] * scale), 1),
+        ),
+    )
+
+    def scaled_frames() -> Generator[ScaledFrame, None, None]:
+        frames = get_video_frames_generator(
+            source_path=source_path, stride=stride, start=start, end=end
+        )
+        try:
+            for frame in frames:
+                scaled_frame = ScaledFrame(frame=frame, transform=transform)
+                if not lazy:
+                    scaled_frame.inference_frame
+                yield scaled_frame
+        finally:
+            frames.close()
+
+    frames = scaled_frames()
+    if prefetch > 0:
+        frames = _prefetch(frames, depth=prefetch)
+    yield from frames
 
 
 def process_video(
     source_path: str,
     target_path: str,
     callback: Callable[[np.ndarray, int], np.ndarray],
+    max_workers: int = 1,
+    use_processes: bool = False,
+    profiler: Optional[Profiler] = None,
 ) -> None:
     """
     Process a video file by applying a callback function on each frame
         and saving the result to a target video file.
 
+    With `max_workers > 1`, decoding, processing and encoding run as a pipeline:
+    frames are decoded on a background thread, `callback` runs on a pool of
+    `max_workers` threads (or processes if `use_processes` is True), and results
+    are reassembled in frame order before being encoded on another background
+    thread. This only pays off for callbacks that do not depend on previous
+    frames, e.g. blurring, annotation or per-frame detection, as frames are
+    processed out of order.
+
     Args:
         source_path (str): The path to the source video file.
         target_path (str): The path to the target video file.
@@ -180,6 +1069,14 @@ def process_video(
             a numpy ndarray representation of a video frame and an
             int index of the frame and returns a processed numpy ndarray
             representation of the frame.
+        max_workers (int): The number of frames processed concurrently.
+            Defaults to `1`, processing frames one by one on the calling thread.
+        use_processes (bool): Whether to run `callback` in worker processes instead
+            of threads. Use it for callbacks that hold the GIL; `callback` must then
+            be picklable, e.g. a module-level function. Defaults to False.
+        profiler (Optional[Profiler]): Records the latency of decoding, the
+            callback and encoding if given, and writes the report to
+            `profiler.report_path` at the end of the run if it is set.
 
     Examples:
         ```python
@@ -193,17 +1090,219 @@ def process_video(
         ...     target_path='...',
         ...     callback=callback
         ... )
+
+        >>> process_video(
+        ...     source_path='...',
+        ...     target_path='...',
+        ...     callback=callback,
+        ...     max_workers=4
+        ... )
         ```
     """
+    try:
+        if max_workers <= 1 and not use_processes:
+            _process_video_serial(
+                source_path=source_path,
+                target_path=target_path,
+                callback=callback,
+                profiler=profiler,
+            )
+        else:
+            _process_video_parallel(
+                source_path=source_path,
+                target_path=target_path,
+                callback=callback,
+                max_workers=max(max_workers, 1),
+                use_processes=use_processes,
+                profiler=profiler,
+            )
+    finally:
+        if profiler is not None and profiler.report_path is not None:
+            profiler.report().save(profiler.report_path)
+
+
+def _process_video_serial(
+    source_path: str,
+    target_path: str,
+    callback: Callable[[np.ndarray, int], np.ndarray],
+    profiler: Optional[Profiler],
+) -> None:
     source_video_info = VideoInfo.from_video_path(video_path=source_path)
-    with VideoSink(target_path=target_path, video_info=source_video_info) as sink:
+    with VideoSink(
+        target_path=target_path, video_info=source_video_info, profiler=profiler
+    ) as sink:
         for index, frame in enumerate(
-            get_video_frames_generator(source_path=source_path)
+            get_video_frames_generator(source_path=source_path, profiler=profiler)
         ):
-            result_frame = callback(frame, index)
+            with _measure(profiler, "callback"):
+                result_frame = callback(frame, index)
             sink.write_frame(frame=result_frame)
 
 
+def _timed_call(
+    callback: Callable[[np.ndarray, int], np.ndarray], frame: np.ndarray, index: int
+) -> Tuple[np.ndarray, float]:
+    start = time.perf_counter()
+    result_frame = callback(frame, index)
+    return result_frame, time.perf_counter() - start
+
+
+def _process_video_parallel(
+    source_path: str,
+    target_path: str,
+    callback: Callable[[np.ndarray, int], np.ndarray],
+    max_workers: int,
+    use_processes: bool,
+    profiler: Optional[Profiler],
+) -> None:
+    source_video_info = VideoInfo.from_video_path(video_path=source_path)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    frames = get_video_frames_generator(
+        source_path=source_path, prefetch=2 * max_workers, profiler=profiler
+    )
+
+    def write_next() -> None:
+        with _measure(profiler, "callback_wait"):
+            result_frame, seconds = pending.popleft().result()
+        if profiler is not None:
+            profiler.record("callback", seconds)
+        sink.write_frame(frame=result_frame)
+
+    with VideoSink(
+        target_path=target_path,
+        video_info=source_video_info,
+        queue_size=2 * max_workers,
+        profiler=profiler,
+    ) as sink, executor_class(max_workers=max_workers) as executor:
+        # futures are kept in submission order, so results are written in order
+        pending = deque()
+        try:
+            for index, frame in enumerate(frames):
+                args = (_timed_call, callback, frame, index)
+                if not use_processes:
+                    # threads run the callback in a copy of the caller's context,
+                    # so an enclosing `sv.dtype_policy` block applies to it
+                    args = (copy_context().run,) + args
+                pending.append(executor.submit(*args))
+                if len(pending) >= 2 * max_workers:
+                    write_next()
+            while pending:
+                write_next()
+        finally:
+            frames.close()
+
+
+def _process_video_segment(
+    source_path: str,
+    target_path: str,
+    callback_factory: Callable[[], Callable[[np.ndarray, int], np.ndarray]],
+    start: int,
+    end: int,
+    warmup: int,
+) -> None:
+    callback = callback_factory()
+    warmup_start = max(start - warmup, 0)
+    video_info = VideoInfo.from_video_path(video_path=source_path)
+    with VideoSink(target_path=target_path, video_info=video_info) as sink:
+        frames = get_video_frames_generator(
+            source_path=source_path, start=warmup_start, end=end
+        )
+        for index, frame in enumerate(frames, start=warmup_start):
+            result_frame = callback(frame, index)
+            if index >= start:
+                sink.write_frame(frame=result_frame)
+
+
+def process_video_in_segments(
+    source_path: str,
+    target_path: str,
+    callback_factory: Callable[[], Callable[[np.ndarray, int], np.ndarray]],
+    segments: int,
+    warmup: int = 0,
+) -> None:
+    """
+    Process a video file by splitting it into `segments` consecutive frame ranges,
+        processing each range in a separate worker process and concatenating the
+        results into a target video file.
+
+    Every worker creates its own callback with `callback_factory`, so stateful
+    components such as `ByteTrack`, `TraceAnnotator` or `LineZone` must be created
+    inside the factory. To re-synchronise their state at segment boundaries, each
+    worker first runs the callback on the `warmup` frames preceding its range and
+    discards those results.
+
+    Args:
+        source_path (str): The path to the source video file.
+        target_path (str): The path to the target video file.
+        callback_factory (Callable[[], Callable[[np.ndarray, int], np.ndarray]]):
+            A picklable function, e.g. defined at module level, that returns the
+            callback of a worker. The callback takes in a video frame and its
+            index in the source video and returns the processed frame.
+        segments (int): The number of frame ranges processed in parallel.
+        warmup (int): The number of frames before each range that are processed
+            only to warm up the state of the callback. Defaults to `0`.
+
+    Examples:
+        ```python
+        >>> import supervision as sv
+
+        >>> def callback_factory():
+        ...     tracker = sv.ByteTrack()
+        ...     def callback(scene: np.ndarray, index: int) -> np.ndarray:
+        ...         ...
+        ...     return callback
+
+        >>> sv.process_video_in_segments(
+        ...     source_path='...',
+        ...     target_path='...',
+        ...     callback_factory=callback_factory,
+        ...     segments=8,
+        ...     warmup=30
+        ... )
+        ```
+
+    Note:
+        The segments are encoded twice, once by the workers and once when they are
+        concatenated, as OpenCV cannot join video files without decoding them.
+    """
+    source_video_info = VideoInfo.from_video_path(video_path=source_path)
+    boundaries = np.linspace(
+        0, source_video_info.total_frames, max(segments, 1) + 1
+    ).astype(int)
+    extension = os.path.splitext(target_path)[1]
+
+    with tempfile.TemporaryDirectory() as directory:
+        segment_paths = [
+            os.path.join(directory, f"segment_{i}{extension}")
+            for i in range(len(boundaries) - 1)
+        ]
+        with ProcessPoolExecutor(max_workers=len(segment_paths)) as executor:
+            futures = [
+                executor.submit(
+                    _process_video_segment,
+                    source_path,
+                    segment_path,
+                    callback_factory,
+                    start,
+                    end,
+                    warmup,
+                )
+                for segment_path, start, end in zip(
+                    segment_paths, boundaries[:-1], boundaries[1:]
+                )
+                if end > start
+            ]
+            for future in futures:
+                future.result()
+
+        with VideoSink(target_path=target_path, video_info=source_video_info) as sink:
+            for segment_path in segment_paths:
+                if not os.path.exists(segment_path):
+                    continue
+                for frame in get_video_frames_generator(source_path=segment_path):
+                    sink.write_frame(frame=frame)
+
+
 class FPSMonitor:
     """
     A class for monitoring frames per second (FPS) to benchmark latency.
@@ -254,3 +1353,314 @@ class FPSMonitor:
         Clears all the time stamps from the deque.
         """
         self.all_timestamps.clear()
+
+
+@dataclass
+class VideoSourceStats:
+    """
+    Statistics of a single source of a `MultiSourceVideoReader`.
+
+    Attributes:
+        frames_read (int): The number of frames decoded from the source.
+        frames_dropped (int): The number of decoded frames dropped because the
+            queue of the source was full.
+        fps (float): The recent decoding rate of the source in frames per second.
+    """
+
+    frames_read: int = 0
+    frames_dropped: int = 0
+    fps: float = 0.0
+
+
+class MultiSourceVideoReader:
+    """
+    Reads many video sources, such as files, camera indices or stream URLs,
+    concurrently on a pool of threads and yields their frames from a single loop.
+
+    Each source is decoded into its own bounded queue. The threads of the pool
+    are not tied to sources: each one repeatedly decodes a single frame of
+    whichever source has space left in its queue, so a few threads can serve many
+    sources. Frames are yielded either round-robin, one frame per source in turn,
+    or synchronized by timestamp, always yielding the earliest pending frame
+    across all sources.
+
+    Attributes:
+        sources (Dict[Hashable, Union[str, int]]): The sources by source id. A list
+            of sources is given the ids `0, 1, ...`.
+        ordering (str): Either `"round_robin"` or `"timestamp"`.
+        queue_size (int): The maximum number of decoded frames waiting per source.
+        drop_frames (bool): Whether to drop frames of a source whose queue is full,
+            e.g. for live cameras, instead of pausing its decoding.
+        max_workers (Optional[int]): The number of decoding threads shared by all
+            sources. Defaults to the number of sources.
+        stats (Dict[Hashable, VideoSourceStats]): Statistics of every source,
+            updated while reading.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> reader = sv.MultiSourceVideoReader(
+        ...     sources={'entrance': 'entrance.mp4', 'parking': 'parking.mp4'},
+        ...     ordering='timestamp'
+        ... )
+
+        >>> for source_id, frame_index, frame in reader:
+        ...     ...
+
+        >>> reader.stats['entrance'].fps
+        ```
+    """
+
+    def __init__(
+        self,
+        sources: Union[List[Union[str, int]], Dict[Hashable, Union[str, int]]],
+        ordering: str = "round_robin",
+        queue_size: int = 8,
+        drop_frames: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        if ordering not in ("round_robin", "timestamp"):
+            raise ValueError(
+                f"ordering must be 'round_robin' or 'timestamp', got '{ordering}'."
+            )
+        self.sources = (
+            dict(sources) if isinstance(sources, dict) else dict(enumerate(sources))
+        )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        self.ordering = ordering
+        self.queue_size = queue_size
+        self.drop_frames = drop_frames
+        self.max_workers = max_workers
+        self.stats = {source_id: VideoSourceStats() for source_id in self.sources}
+
+    def __iter__(self) -> Generator[Tuple[Hashable, int, np.ndarray], None, None]:
+        """
+        Yields:
+            (Tuple[Hashable, int, np.ndarray]): The source id, the index of the
+                frame within its source and the frame.
+        """
+        self.stats = {source_id: VideoSourceStats() for source_id in self.sources}
+        self.__queue_size = max(self.queue_size, 1)
+        # the queues are bounded by scheduling, at most one frame of a source is
+        # decoded at a time and only while its queue has space left
+        self.__frames = {source_id: queue.Queue() for source_id in self.sources}
+        self.__videos = {}
+        self.__fps_monitors = {source_id: FPSMonitor() for source_id in self.sources}
+        self.__parked = set()
+        self.__lock = threading.Lock()
+        self.__ready = queue.Queue()
+        self.__stop = threading.Event()
+        for source_id in self.sources:
+            self.__ready.put(source_id)
+
+        max_workers = self.max_workers or max(len(self.sources), 1)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        for _ in range(max_workers):
+            executor.submit(self.__work)
+
+        def take(source_id: Hashable):
+            item = self.__frames[source_id].get()
+            with self.__lock:
+                if source_id in self.__parked:
+                    self.__parked.discard(source_id)
+                    self.__ready.put(source_id)
+            if isinstance(item, _ProducerError):
+                raise item.error
+            return item
+
+        try:
+            if self.ordering == "round_robin":
+                active = list(self.sources)
+                while active:
+                    for source_id in list(active):
+                        item = take(source_id)
+                        if item is _END_OF_STREAM:
+                            active.remove(source_id)
+                            continue
+                        frame_index, _, frame = item
+                        yield source_id, frame_index, frame
+            else:
+                active, heads = set(self.sources), {}
+                while True:
+                    for source_id in [s for s in active if s not in heads]:
+                        item = take(source_id)
+                        if item is _END_OF_STREAM:
+                            active.remove(source_id)
+                        else:
+                            heads[source_id] = item
+                    if not heads:
+                        break
+                    source_id = min(heads, key=lambda s: heads[s][1])
+                    frame_index, _, frame = heads.pop(source_id)
+                    yield source_id, frame_index, frame
+        finally:
+            self.__stop.set()
+            executor.shutdown(wait=True)
+            for video in self.__videos.values():
+                video.release()
+
+    def __work(self) -> None:
+        while not self.__stop.is_set():
+            try:
+                source_id = self.__ready.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if self.__read_frame(source_id):
+                continue
+            with self.__lock:
+                if self.drop_frames or (
+                    self.__frames[source_id].qsize() < self.__queue_size
+                ):
+                    self.__ready.put(source_id)
+                else:
+                    # resumed by the consumer once it takes a frame of the source
+                    self.__parked.add(source_id)
+
+    def __read_frame(self, source_id: Hashable) -> bool:
+        """
+        Decodes the next frame of a source into its queue. Returns whether the
+        source is finished.
+        """
+        frames, stats = self.__frames[source_id], self.stats[source_id]
+        try:
+            video = self.__videos.get(source_id)
+            if video is None:
+                source = self.sources[source_id]
+                video = self.__videos[source_id] = cv2.VideoCapture(source)
+                if not video.isOpened():
+                    raise Exception(f"Could not open video at {source}")
+            success, frame = video.read()
+            if not success:
+                video.release()
+                frames.put(_END_OF_STREAM)
+                return True
+            fps_monitor = self.__fps_monitors[source_id]
+            fps_monitor.tick()
+            stats.fps = fps_monitor()
+            item = (stats.frames_read, video.get(cv2.CAP_PROP_POS_MSEC), frame)
+            stats.frames_read += 1
+            if frames.qsize() < self.__queue_size:
+                frames.put(item)
+            else:
+                stats.frames_dropped += 1
+            return False
+        except BaseException as error:
+            frames.put(_ProducerError(error))
+            frames.put(_END_OF_STREAM)
+            return True
+
+
+class LatestFrameReader:
+    """
+    Real-time reader for live sources that always hands out the most recent frame.
+
+    The source is decoded on a background thread that keeps only the latest frame,
+    so when processing is slower than the source, stale frames are dropped instead
+    of being buffered and latency stays bounded. Frames are yielded together with
+    their index in the source, which reveals the gaps left by dropped frames.
+
+    Attributes:
+        source (Union[str, int]): A video file, camera index or stream URL.
+        target_fps (Optional[float]): The maximum rate at which frames are
+            yielded. Frames decoded in between are dropped. If None, a frame is
+            yielded as soon as a new one is available.
+        pace (bool): Whether to decode at the frame rate of the source, so that a
+            video file behaves like a live camera. Live sources are paced by
+            nature and should leave it False.
+        stats (VideoSourceStats): The number of frames read and dropped and the
+            decoding FPS, updated while reading.
+
+    Example:
+        ```python
+        >>> import supervision as sv
+
+        >>> reader = sv.LatestFrameReader(source='rtsp://camera/stream')
+        >>> for frame_index, frame in reader:
+        ...     result = model(frame)[0]
+
+        >>> reader.stats.frames_dropped
+        ```
+    """
+
+    def __init__(
+        self,
+        source: Union[str, int],
+        target_fps: Optional[float] = None,
+        pace: bool = False,
+    ):
+        self.source = source
+        self.target_fps = target_fps
+        self.pace = pace
+        self.stats = VideoSourceStats()
+
+    def __iter__(self) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Yields:
+            (Tuple[int, np.ndarray]): The index of the frame in the source and
+                the frame.
+        """
+        self.stats = VideoSourceStats()
+        self.__latest = None
+        self.__finished = False
+        self.__error = None
+        self.__condition = threading.Condition()
+        self.__stop = threading.Event()
+        thread = threading.Thread(target=self.__read, daemon=True)
+        thread.start()
+
+        interval = 1 / self.target_fps if self.target_fps else 0.0
+        next_time = time.monotonic()
+        try:
+            while True:
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                with self.__condition:
+                    while self.__latest is None and not self.__finished:
+                        self.__condition.wait()
+                    item, self.__latest = self.__latest, None
+                if item is None:
+                    if self.__error is not None:
+                        raise self.__error
+                    return
+                next_time = max(next_time + interval, time.monotonic())
+                yield item
+        finally:
+            self.__stop.set()
+            thread.join()
+
+    def __read(self) -> None:
+        fps_monitor = FPSMonitor()
+        video = cv2.VideoCapture(self.source)
+        try:
+            if not video.isOpened():
+                raise Exception(f"Could not open video at {self.source}")
+            source_fps = video.get(cv2.CAP_PROP_FPS)
+            start = time.monotonic()
+            frame_index = 0
+            while not self.__stop.is_set():
+                if self.pace and source_fps > 0:
+                    delay = start + frame_index / source_fps - time.monotonic()
+                    if delay > 0 and self.__stop.wait(delay):
+                        break
+                success, frame = video.read()
+                if not success:
+                    break
+                fps_monitor.tick()
+                self.stats.frames_read += 1
+                self.stats.fps = fps_monitor()
+                with self.__condition:
+                    if self.__latest is not None:
+                        self.stats.frames_dropped += 1
+                    self.__latest = (frame_index, frame)
+                    self.__condition.notify()
+                frame_index += 1
+        except Exception as error:
+            self.__error = error
+        finally:
+            video.release()
+            with self.__condition:
+                self.__finished = True
+                self.__condition.notify()
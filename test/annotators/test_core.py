@@ -0,0 +1,134 @@
+from typing import Callable, List
+
+import cv2
+import numpy as np
+import pytest
+
+from supervision.annotators.core import (
+    BoundingBoxAnnotator,
+    ColorAnnotator,
+    CompositeAnnotator,
+    HaloAnnotator,
+    LabelAnnotator,
+    MaskAnnotator,
+)
+from supervision.annotators.utils import ColorLookup
+from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask, CroppedMask
+from supervision.draw.color import ColorPalette
+
+
+def _detections(n: int, mask_type: Callable = np.asarray) -> Detections:
+    rng = np.random.default_rng(n)
+    xy = rng.integers(-10, 90, size=(n, 2))
+    wh = rng.integers(5, 40, size=(n, 2))
+    xyxy = np.hstack([xy, xy + wh]).astype(np.float32)
+    mask = np.zeros((n, 80, 100), dtype=bool)
+    for i, (x1, y1, x2, y2) in enumerate(np.clip(xyxy, 0, None).astype(int)):
+        mask[i, y1:y2, x1:x2] = True
+    return Detections(
+        xyxy=xyxy,
+        mask=mask_type(mask),
+        class_id=np.arange(n),
+        tracker_id=np.arange(n)[::-1].copy(),
+    )
+
+
+def _scene() -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 256, (80, 100, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("n", [0, 1, 7])
+@pytest.mark.parametrize(
+    "mask_type", [np.asarray, CompressedMask.from_dense, CroppedMask.from_dense]
+)
+def test_mask_annotator(n: int, mask_type: Callable) -> None:
+    scene = _scene()
+    detections = _detections(n, mask_type)
+    palette = ColorPalette.default()
+
+    colored_mask = scene.copy()
+    dense = _detections(n).mask
+    for index in np.flip(np.argsort(detections.area)):
+        colored_mask[dense[index]] = palette.by_idx(index).as_bgr()
+    expected = cv2.addWeighted(colored_mask, 0.5, scene, 0.5, 0)
+
+    result = MaskAnnotator(color_lookup=ColorLookup.INDEX).annotate(
+        scene=scene.copy(), detections=detections
+    )
+
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n", [0, 1, 7])
+def test_color_annotator(n: int) -> None:
+    scene = _scene()
+    detections = _detections(n)
+    palette = ColorPalette.default()
+
+    colored = scene.copy()
+    for index, (x1, y1, x2, y2) in enumerate(detections.xyxy.astype(int)):
+        cv2.rectangle(colored, (x1, y1), (x2, y2), palette.by_idx(index).as_bgr(), -1)
+    expected = cv2.addWeighted(colored, 0.5, scene, 0.5, gamma=0)
+
+    result = ColorAnnotator(color_lookup=ColorLookup.INDEX).annotate(
+        scene=scene.copy(), detections=detections
+    )
+
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n", [0, 1])
+def test_halo_annotator_without_halo_leaves_scene_unchanged(n: int) -> None:
+    scene = _scene()
+    detections = _detections(n)
+    if n > 0:
+        detections.mask[:] = False
+
+    result = HaloAnnotator().annotate(scene=scene.copy(), detections=detections)
+
+    assert np.array_equal(result, scene)
+
+
+@pytest.mark.parametrize("n", [0, 1, 7])
+@pytest.mark.parametrize(
+    "mask_type", [np.asarray, CompressedMask.from_dense, CroppedMask.from_dense]
+)
+@pytest.mark.parametrize(
+    "annotators",
+    [
+        lambda: [
+            MaskAnnotator(),
+            ColorAnnotator(color_lookup=ColorLookup.TRACK),
+            HaloAnnotator(color_lookup=ColorLookup.INDEX),
+            BoundingBoxAnnotator(),
+            LabelAnnotator(),
+        ],
+        lambda: [
+            ColorAnnotator(color_lookup=ColorLookup.INDEX),
+            MaskAnnotator(color_lookup=ColorLookup.TRACK),
+            ColorAnnotator(opacity=0.5),
+            ColorAnnotator(opacity=0.3, color_lookup=ColorLookup.TRACK),
+            MaskAnnotator(opacity=0.3),
+            LabelAnnotator(),
+        ],
+        lambda: [MaskAnnotator(opacity=0.3), ColorAnnotator(opacity=0.6)],
+    ],
+)
+def test_composite_annotator_matches_sequential_annotators(
+    n: int, mask_type: Callable, annotators: Callable[[], List]
+) -> None:
+    labels = [f"label {i}" for i in range(n)]
+
+    expected = _scene()
+    for annotator in annotators():
+        if isinstance(annotator, LabelAnnotator):
+            expected = annotator.annotate(expected, _detections(n, mask_type), labels)
+        else:
+            expected = annotator.annotate(expected, _detections(n, mask_type))
+
+    result = CompositeAnnotator(annotators=annotators()).annotate(
+        scene=_scene(), detections=_detections(n, mask_type), labels=labels
+    )
+
+    assert np.array_equal(result, expected)
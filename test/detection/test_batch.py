@@ -0,0 +1,109 @@
+from contextlib import ExitStack as DoesNotRaise
+from test.test_utils import mock_detections
+from typing import List
+
+import numpy as np
+import pytest
+
+from supervision.detection.batch import DetectionsBatch
+from supervision.detection.core import Detections
+from supervision.detection.tools.polygon_zone import PolygonZone
+from supervision.detection.utils import box_iou_batch
+from supervision.geometry.core import Position
+
+FRAMES = [
+    mock_detections(
+        xyxy=[[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]],
+        confidence=[0.9, 0.8, 0.7],
+        class_id=[0, 0, 1],
+    ),
+    Detections.empty(),
+    mock_detections(
+        xyxy=[[0, 0, 10, 10], [1, 1, 11, 11]],
+        confidence=[0.6, 0.7],
+        class_id=[0, 1],
+    ),
+    mock_detections(
+        xyxy=[[20, 20, 40, 40], [21, 21, 40, 40], [80, 80, 90, 90]],
+        confidence=[0.5, 0.9, 0.4],
+        class_id=[2, 2, 2],
+    ),
+]
+FRAMES[1].confidence = np.array([], dtype=np.float32)
+FRAMES[1].class_id = np.array([], dtype=int)
+
+
+@pytest.mark.parametrize(
+    "detections, offsets, exception",
+    [
+        (FRAMES[0], [0, 3], DoesNotRaise()),  # single frame
+        (FRAMES[0], [0, 1, 1, 3], DoesNotRaise()),  # frame without detections
+        (Detections.empty(), [0], DoesNotRaise()),  # no frames
+        (FRAMES[0], [0, 2], pytest.raises(ValueError)),  # offsets too short
+        (FRAMES[0], [0, 2, 1, 3], pytest.raises(ValueError)),  # decreasing offsets
+        (FRAMES[0], [1, 3], pytest.raises(ValueError)),  # not starting at 0
+    ],
+)
+def test_detections_batch_validation(
+    detections: Detections, offsets: List[int], exception: Exception
+) -> None:
+    with exception:
+        DetectionsBatch(detections=detections, offsets=np.array(offsets))
+
+
+def test_detections_batch_frames() -> None:
+    batch = DetectionsBatch.from_detections_list(FRAMES)
+
+    assert len(batch) == len(FRAMES)
+    assert np.array_equal(batch.frame_index, [0, 0, 0, 2, 2, 3, 3, 3])
+    for frame, detections in zip(batch, FRAMES):
+        assert frame == detections
+    assert batch[-1] == FRAMES[-1]
+    with pytest.raises(IndexError):
+        batch[len(FRAMES)]
+
+
+@pytest.mark.parametrize("class_agnostic", [False, True])
+def test_detections_batch_with_nms(class_agnostic: bool) -> None:
+    batch = DetectionsBatch.from_detections_list(FRAMES)
+    result = batch.with_nms(threshold=0.5, class_agnostic=class_agnostic)
+
+    expected_result = DetectionsBatch.from_detections_list(
+        [
+            frame.with_nms(threshold=0.5, class_agnostic=class_agnostic)
+            for frame in FRAMES
+        ]
+    )
+    assert result == expected_result
+
+
+def test_detections_batch_box_iou() -> None:
+    batch = DetectionsBatch.from_detections_list(FRAMES)
+    other = DetectionsBatch.from_detections_list(FRAMES[::-1])
+
+    result = batch.box_iou(other)
+
+    assert len(result) == len(FRAMES)
+    for iou, frame, other_frame in zip(result, FRAMES, FRAMES[::-1]):
+        expected_result = box_iou_batch(frame.xyxy, other_frame.xyxy)
+        assert iou.shape == expected_result.shape
+        assert np.allclose(iou, expected_result)
+
+
+def test_polygon_zone_trigger_batch() -> None:
+    batch = DetectionsBatch.from_detections_list(FRAMES)
+    zone = PolygonZone(
+        polygon=np.array([[0, 0], [45, 0], [45, 45], [0, 45]]),
+        frame_resolution_wh=(100, 100),
+        triggering_position=Position.CENTER,
+    )
+
+    expected_results = [zone.trigger(frame) for frame in FRAMES]
+    result = zone.trigger(batch)
+
+    assert zone.current_count == 2
+    for frame_result, expected_result in zip(batch.split(result), expected_results):
+        assert np.array_equal(frame_result, expected_result)
+    assert batch[result] == DetectionsBatch.from_detections_list(
+        [frame[mask] for frame, mask in zip(FRAMES, expected_results)]
+    )
@@ -1,11 +1,14 @@
 from contextlib import ExitStack as DoesNotRaise
 from test.test_utils import mock_detections
-from typing import List, Optional, Union
+from types import SimpleNamespace
+from typing import List, Optional, Tuple, Union
 
+import cv2
 import numpy as np
 import pytest
 
 from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask, CroppedMask
 from supervision.geometry.core import Position
 
 PREDICTIONS = np.array(
@@ -273,3 +276,160 @@ def test_get_anchor_coordinates(
     result = detections.get_anchors_coordinates(anchor)
     with exception:
         assert np.array_equal(result, expected_result)
+
+
+def test_with_nms_use_masks() -> None:
+    masks = np.zeros((3, 20, 40), dtype=bool)
+    masks[0, 2:18, 2:6] = True  # thin vertical bar
+    masks[1, 2:6, 2:38] = True  # thin horizontal bar, box overlaps the first one
+    masks[2, 2:18, 3:6] = True  # near duplicate of the first mask
+    detections = Detections(
+        xyxy=np.array([[2, 2, 38, 18], [2, 2, 38, 18], [3, 2, 38, 18]], dtype=float),
+        mask=masks,
+        confidence=np.array([0.9, 0.8, 0.7]),
+        class_id=np.array([0, 0, 0]),
+    )
+
+    assert len(detections.with_nms(threshold=0.5)) == 1
+    assert detections.with_nms(threshold=0.5, use_masks=True) == detections[[0, 1]]
+
+
+def test_derived_attributes_are_cached() -> None:
+    detections = mock_detections(xyxy=[[10, 10, 20, 30], [0, 0, 5, 5]])
+
+    anchors = detections.get_anchors_coordinates(anchor=Position.CENTER)
+    assert ("anchors", Position.CENTER) in detections._cache
+    area = detections.area
+    assert "area" in detections._cache
+
+    # results are copies of the cache, so callers may modify them
+    anchors += 1
+    area[:] = 0
+    assert np.array_equal(
+        detections.get_anchors_coordinates(anchor=Position.CENTER),
+        [[15, 20], [2.5, 2.5]],
+    )
+    assert np.array_equal(detections.area, [200, 25])
+
+    detections.xyxy = np.array([[0, 0, 10, 10], [0, 0, 2, 2]], dtype=np.float32)
+    assert np.array_equal(
+        detections.get_anchors_coordinates(anchor=Position.CENTER), [[5, 5], [1, 1]]
+    )
+    assert np.array_equal(detections.area, [100, 4])
+
+
+def _mock_masks() -> np.ndarray:
+    masks = np.zeros((3, 10, 21), dtype=bool)
+    masks[0, 1:4, 2:19] = True
+    masks[2, 9, 20] = True
+    return masks
+
+
+@pytest.mark.parametrize(
+    "detections",
+    [
+        Detections.empty(),  # empty detections
+        mock_detections(xyxy=[[10, 10, 20, 20]]),  # only xyxy
+        mock_detections(
+            xyxy=[[10, 10, 20, 20], [0, 0, 5, 5]],
+            confidence=[0.5, 0.25],
+            class_id=[1, 2],
+            tracker_id=[7, 8],
+        ),  # all array columns
+        Detections(
+            xyxy=np.zeros((3, 4), dtype=np.float64),
+            mask=_mock_masks(),
+            class_id=np.array([0, 1, 2], dtype=np.int16),
+        ),  # dense mask and non default dtypes
+        Detections(
+            xyxy=np.zeros((3, 4)), mask=CompressedMask.from_dense(_mock_masks())
+        ),  # compressed mask
+        Detections(
+            xyxy=np.zeros((3, 4)), mask=CroppedMask.from_dense(_mock_masks())
+        ),  # cropped mask
+    ],
+)
+def test_to_bytes_from_bytes(detections: Detections) -> None:
+    result = Detections.from_bytes(detections.to_bytes())
+
+    assert result == detections
+    assert type(result.mask) is type(detections.mask)
+    assert result.xyxy.dtype == detections.xyxy.dtype
+    for column in ["confidence", "class_id", "tracker_id"]:
+        value = getattr(detections, column)
+        assert getattr(result, column) is None or value.dtype == (
+            getattr(result, column).dtype
+        )
+
+
+def test_from_bytes_incomplete_record() -> None:
+    payload = mock_detections(xyxy=[[10, 10, 20, 20]]).to_bytes()
+
+    with pytest.raises(ValueError):
+        Detections.from_bytes(payload[:-8])
+
+
+class _MockTensor:
+    def __init__(self, array: np.ndarray):
+        self.array = np.asarray(array)
+        self.shape = self.array.shape
+
+    def cpu(self) -> "_MockTensor":
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self.array
+
+
+def _mock_ultralytics_results(
+    inference_hw: Tuple[int, int], orig_hw: Tuple[int, int]
+) -> SimpleNamespace:
+    inference_height, inference_width = inference_hw
+    masks = np.zeros((4, inference_height, inference_width), dtype=np.float32)
+    centers = [(0.3, 0.4), (0.5, 0.5), (0.8, 0.2), (0.02, 0.98)]
+    for mask, (x, y) in zip(masks, centers):
+        center = (int(x * inference_width), int(y * inference_height))
+        cv2.ellipse(mask, center, (40, 25), 30, 0, 360, 1.0, -1)
+
+    gain = min(inference_height / orig_hw[0], inference_width / orig_hw[1])
+    pad_x = (inference_width - orig_hw[1] * gain) / 2
+    pad_y = (inference_height - orig_hw[0] * gain) / 2
+    xyxy = []
+    for mask in masks:
+        ys, xs = np.nonzero(mask)
+        box = np.array([xs.min(), ys.min(), xs.max() + 1, ys.max() + 1], float)
+        box = (box - [pad_x, pad_y, pad_x, pad_y]) / gain
+        # loose boxes, partially outside of the frame for the last mask
+        xyxy.append(box + [-7.3, -5.6, 6.2, 4.9])
+
+    return SimpleNamespace(
+        orig_shape=orig_hw,
+        masks=SimpleNamespace(data=_MockTensor(masks)),
+        boxes=SimpleNamespace(
+            xyxy=_MockTensor(np.array(xyxy, dtype=np.float32)),
+            conf=_MockTensor(np.ones(len(masks), dtype=np.float32)),
+            cls=_MockTensor(np.zeros(len(masks))),
+            id=None,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "inference_hw, orig_hw",
+    [
+        ((360, 640), (360, 640)),  # no resize
+        ((384, 640), (360, 640)),  # letterbox padding
+        ((384, 640), (2160, 3840)),  # padding and upscaling
+        ((640, 640), (480, 1000)),  # non-integer scale
+    ],
+)
+def test_from_ultralytics_crop_masks(
+    inference_hw: Tuple[int, int], orig_hw: Tuple[int, int]
+) -> None:
+    results = _mock_ultralytics_results(inference_hw=inference_hw, orig_hw=orig_hw)
+
+    expected = Detections.from_ultralytics(results)
+    result = Detections.from_ultralytics(results, crop_masks=True)
+
+    assert isinstance(result.mask, CroppedMask)
+    assert np.array_equal(result.mask.to_dense(), expected.mask)
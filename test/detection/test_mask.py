@@ -0,0 +1,166 @@
+from contextlib import ExitStack as DoesNotRaise
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from supervision.annotators.core import HaloAnnotator, MaskAnnotator
+from supervision.annotators.utils import ColorLookup
+from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask, CroppedMask
+from supervision.detection.utils import (
+    calculate_masks_centroids,
+    mask_to_xyxy,
+    polygon_to_mask,
+)
+
+
+def _generate_masks() -> np.ndarray:
+    masks = np.zeros((4, 30, 45), dtype=bool)
+    masks[0, 2:10, 3:17] = True
+    masks[1, 20:29, 30:45] = True
+    masks[2, 0, 0] = True
+    masks[2, 15:20, 8:12] = True
+    return masks  # masks[3] is empty
+
+
+MASKS = _generate_masks()
+
+
+@pytest.mark.parametrize(
+    "masks, exception",
+    [
+        (np.zeros((0, 30, 45), dtype=bool), DoesNotRaise()),  # no masks
+        (MASKS[:1], DoesNotRaise()),  # single mask
+        (MASKS, DoesNotRaise()),  # many masks including empty one
+        (MASKS[:, :, :40], DoesNotRaise()),  # width divisible by 8
+    ],
+)
+def test_compressed_mask_matches_dense(masks: np.ndarray, exception: Exception):
+    with exception:
+        compressed_mask = CompressedMask.from_dense(masks)
+        assert compressed_mask.shape == masks.shape
+        assert np.array_equal(compressed_mask.to_dense(), masks)
+        assert np.array_equal(compressed_mask.area, masks.sum(axis=(1, 2)))
+        assert np.array_equal(mask_to_xyxy(compressed_mask), mask_to_xyxy(masks))
+        assert np.array_equal(
+            calculate_masks_centroids(compressed_mask),
+            calculate_masks_centroids(masks),
+        )
+
+
+@pytest.mark.parametrize(
+    "index, expected_result",
+    [
+        (0, MASKS[0]),  # single index decodes dense mask
+        (np.int64(2), MASKS[2]),  # numpy integer index
+        (slice(1, 3), MASKS[1:3]),  # slice
+        ([0, 3], MASKS[[0, 3]]),  # list of indexes
+        (np.array([True, False, True, False]), MASKS[[0, 2]]),  # bool mask
+    ],
+)
+def test_compressed_mask_getitem(index, expected_result: np.ndarray) -> None:
+    result = CompressedMask.from_dense(MASKS)[index]
+    assert np.array_equal(np.asarray(result), expected_result)
+
+
+def test_detections_with_compressed_mask() -> None:
+    xyxy = mask_to_xyxy(MASKS).astype(np.float32)
+    detections = Detections(
+        xyxy=xyxy,
+        mask=CompressedMask.from_dense(MASKS),
+        confidence=np.array([0.9, 0.8, 0.7, 0.6]),
+        class_id=np.array([0, 1, 0, 1]),
+    )
+    dense_detections = Detections(
+        xyxy=xyxy,
+        mask=MASKS,
+        confidence=np.array([0.9, 0.8, 0.7, 0.6]),
+        class_id=np.array([0, 1, 0, 1]),
+    )
+
+    assert np.array_equal(detections.area, dense_detections.area)
+    assert isinstance(detections[detections.class_id == 0].mask, CompressedMask)
+    assert detections[[1, 2]] == dense_detections[[1, 2]]
+
+    merged = Detections.merge([detections[:2], detections[2:]])
+    assert isinstance(merged.mask, CompressedMask)
+    assert merged == dense_detections
+
+
+@pytest.mark.parametrize(
+    "masks, xyxy, exception",
+    [
+        (np.zeros((0, 30, 45), dtype=bool), None, DoesNotRaise()),  # no masks
+        (MASKS, None, DoesNotRaise()),  # tight boxes
+        (
+            MASKS,
+            np.array(
+                [[0, 0, 20, 12], [29.5, 19.2, 45, 30], [0, 0, 45, 30], [5, 5, 6, 6]]
+            ),
+            DoesNotRaise(),
+        ),  # boxes covering the masks
+    ],
+)
+def test_cropped_mask_matches_dense(
+    masks: np.ndarray, xyxy: np.ndarray, exception: Exception
+) -> None:
+    with exception:
+        cropped_mask = CroppedMask.from_dense(masks, xyxy=xyxy)
+        assert cropped_mask.shape == masks.shape
+        assert np.array_equal(cropped_mask.to_dense(), masks)
+        assert np.array_equal(cropped_mask.area, masks.sum(axis=(1, 2)))
+        assert np.array_equal(mask_to_xyxy(cropped_mask), mask_to_xyxy(masks))
+        assert np.array_equal(
+            calculate_masks_centroids(cropped_mask),
+            calculate_masks_centroids(masks),
+        )
+        for i in range(len(masks)):
+            assert np.array_equal(cropped_mask[i], masks[i])
+        assert np.array_equal(np.asarray(cropped_mask[1:]), masks[1:])
+
+
+@pytest.mark.parametrize(
+    "polygons, resolution_wh",
+    [
+        ([np.array([[2, 2], [10, 2], [10, 12], [2, 12]])], (20, 20)),  # rectangle
+        ([np.array([[5, 0], [19, 19], [0, 19]])], (20, 20)),  # triangle
+        ([np.array([[-5, -5], [25, 3], [10, 30]])], (20, 20)),  # outside of frame
+        (
+            [np.array([[0, 0], [3, 0], [3, 3]]), np.array([[8, 8], [15, 9], [9, 14]])],
+            (16, 16),
+        ),  # multiple polygons
+    ],
+)
+def test_cropped_mask_from_polygons(
+    polygons: List[np.ndarray], resolution_wh: Tuple[int, int]
+) -> None:
+    cropped_mask = CroppedMask.from_polygons(
+        polygons=polygons, resolution_wh=resolution_wh
+    )
+    expected_result = np.array(
+        [polygon_to_mask(polygon, resolution_wh=resolution_wh) for polygon in polygons],
+        dtype=bool,
+    )
+    assert np.array_equal(cropped_mask.to_dense(), expected_result)
+
+
+@pytest.mark.parametrize(
+    "annotator",
+    [MaskAnnotator(color_lookup=ColorLookup.INDEX), HaloAnnotator(kernel_size=5)],
+)
+def test_mask_annotators_with_mask_stores(annotator) -> None:
+    scene = np.full((30, 45, 3), 127, dtype=np.uint8)
+    xyxy = mask_to_xyxy(MASKS).astype(np.float32)
+    class_id = np.array([0, 1, 2, 3])
+    expected_result = annotator.annotate(
+        scene=scene.copy(),
+        detections=Detections(xyxy=xyxy, mask=MASKS, class_id=class_id),
+    )
+
+    for mask in [CompressedMask.from_dense(MASKS), CroppedMask.from_dense(MASKS)]:
+        result = annotator.annotate(
+            scene=scene.copy(),
+            detections=Detections(xyxy=xyxy, mask=mask, class_id=class_id),
+        )
+        assert np.array_equal(result, expected_result)
@@ -4,10 +4,17 @@ from typing import List, Optional, Tuple
 import numpy as np
 import pytest
 
+from supervision.detection import utils
+from supervision.detection.mask import CompressedMask, CroppedMask
 from supervision.detection.utils import (
+    box_iou_batch,
+    box_iou_batch_matches,
+    box_iou_batch_sparse,
     calculate_masks_centroids,
     clip_boxes,
     filter_polygons_by_area,
+    mask_non_max_suppression,
+    mask_to_xyxy,
     move_boxes,
     non_max_suppression,
     process_roboflow_result,
@@ -123,6 +130,203 @@ def test_non_max_suppression(
         assert np.array_equal(result, expected_result)
 
 
+def _generate_boxes(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    top_left = rng.uniform(0, 300, (n, 2))
+    return np.c_[top_left, top_left + rng.uniform(5, 60, (n, 2))]
+
+
+@pytest.mark.parametrize(
+    "boxes_true, boxes_detection, iou_threshold",
+    [
+        (np.empty((0, 4)), _generate_boxes(n=10, seed=0), 0.0),  # no true boxes
+        (_generate_boxes(n=10, seed=0), np.empty((0, 4)), 0.0),  # no detections
+        (
+            _generate_boxes(n=200, seed=1),
+            _generate_boxes(n=100, seed=2),
+            0.0,
+        ),  # all overlapping pairs
+        (
+            _generate_boxes(n=200, seed=3),
+            _generate_boxes(n=300, seed=4),
+            0.3,
+        ),  # pairs above threshold
+        (
+            np.array([[0, 0, 10, 10], [20, 20, 30, 30]]),
+            np.array([[5, 5, 15, 15], [30, 30, 40, 40], [0, 0, 10, 10]]),
+            0.0,
+        ),  # integer boxes, touching boxes are not stored
+    ],
+)
+@pytest.mark.parametrize("max_pairs", [7, 1 << 20])
+def test_box_iou_batch_sparse(
+    boxes_true: np.ndarray,
+    boxes_detection: np.ndarray,
+    iou_threshold: float,
+    max_pairs: int,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(utils, "_MAX_PAIRS", max_pairs)
+    result = box_iou_batch_sparse(
+        boxes_true=boxes_true,
+        boxes_detection=boxes_detection,
+        iou_threshold=iou_threshold,
+    )
+    expected_result = box_iou_batch(boxes_true, boxes_detection)
+    expected_result[expected_result <= iou_threshold] = 0
+
+    assert result.shape == expected_result.shape
+    assert np.array_equal(result.toarray(), expected_result)
+
+
+@pytest.mark.parametrize("iou_threshold", [0.0, 0.3])
+@pytest.mark.parametrize("sparse_min_pairs", [0, 1 << 20])
+def test_box_iou_batch_matches(
+    iou_threshold: float, sparse_min_pairs: int, monkeypatch
+) -> None:
+    boxes_true = _generate_boxes(n=120, seed=7)
+    boxes_detection = _generate_boxes(n=90, seed=8)
+    expected_result = box_iou_batch_sparse(
+        boxes_true, boxes_detection, iou_threshold=iou_threshold
+    ).tocoo()
+
+    monkeypatch.setattr(utils, "SPARSE_IOU_MIN_PAIRS", sparse_min_pairs)
+    result = box_iou_batch_matches(
+        boxes_true, boxes_detection, iou_threshold=iou_threshold
+    )
+
+    assert result.shape == expected_result.shape
+    assert np.array_equal(result.row, expected_result.row)
+    assert np.array_equal(result.col, expected_result.col)
+    assert np.array_equal(result.data, expected_result.data)
+
+
+def test_box_iou_batch_chunked(monkeypatch) -> None:
+    boxes_true = _generate_boxes(n=50, seed=5)
+    boxes_detection = _generate_boxes(n=30, seed=6)
+    expected_result = box_iou_batch(boxes_true, boxes_detection)
+
+    monkeypatch.setattr(utils, "_MAX_PAIRS", 64)
+    assert np.array_equal(box_iou_batch(boxes_true, boxes_detection), expected_result)
+
+
+def _greedy_non_max_suppression(
+    predictions: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    sort_index = np.flip(predictions[:, 4].argsort())
+    ious = box_iou_batch(predictions[:, :4], predictions[:, :4])
+    keep = np.zeros(len(predictions), dtype=bool)
+    for index in sort_index:
+        same_category = predictions[keep, 5] == predictions[index, 5]
+        keep[index] = not np.any(ious[index, keep][same_category] > iou_threshold)
+    return keep
+
+
+def _generate_predictions(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 300, (5, 2))[rng.integers(0, 5, n)]
+    top_left = centers + rng.normal(0, 5, (n, 2))
+    bottom_right = top_left + rng.uniform(20, 60, (n, 2))
+    return np.c_[top_left, bottom_right, rng.uniform(size=n), rng.integers(0, 3, n)]
+
+
+@pytest.mark.parametrize(
+    "predictions, iou_threshold, tile_size",
+    [
+        (_generate_predictions(n=500, seed=0), 0.5, 1024),  # single tile
+        (_generate_predictions(n=500, seed=1), 0.5, 64),  # many tiles
+        (_generate_predictions(n=500, seed=2), 0.2, 1),  # one prediction per tile
+        (_generate_predictions(n=500, seed=3), 0.8, 33),  # last tile partial
+    ],
+)
+def test_non_max_suppression_matches_greedy(
+    predictions: np.ndarray, iou_threshold: float, tile_size: int
+) -> None:
+    result = non_max_suppression(
+        predictions=predictions, iou_threshold=iou_threshold, tile_size=tile_size
+    )
+    expected_result = _greedy_non_max_suppression(
+        predictions=predictions, iou_threshold=iou_threshold
+    )
+    assert np.array_equal(result, expected_result)
+
+
+@pytest.mark.parametrize("max_detections", [0, 1, 10, 10_000])
+def test_non_max_suppression_max_detections(max_detections: int) -> None:
+    predictions = _generate_predictions(n=500, seed=4)
+    keep = non_max_suppression(predictions=predictions, tile_size=50)
+    result = non_max_suppression(
+        predictions=predictions, max_detections=max_detections, tile_size=50
+    )
+
+    scores = np.sort(predictions[keep, 4])[::-1]
+    assert result.sum() == min(max_detections, keep.sum())
+    assert np.array_equal(
+        result, keep & np.isin(predictions[:, 4], scores[:max_detections])
+    )
+
+
+def _generate_disk_masks(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[:60, :80]
+    centers = rng.uniform((0, 0), (80, 60), (n, 2))
+    radii = rng.uniform(3, 15, n)
+    return (x - centers[:, 0, None, None]) ** 2 + (
+        y - centers[:, 1, None, None]
+    ) ** 2 < radii[:, None, None] ** 2
+
+
+def _greedy_mask_non_max_suppression(
+    predictions: np.ndarray, masks: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    flat = masks.reshape(len(masks), -1).astype(float)
+    area_inter = flat @ flat.T
+    area = flat.sum(axis=1)
+    ious = area_inter / (area[:, None] + area - area_inter)
+    keep = np.zeros(len(predictions), dtype=bool)
+    for index in np.flip(predictions[:, 4].argsort()):
+        same_category = predictions[keep, 5] == predictions[index, 5]
+        keep[index] = not np.any(ious[index, keep][same_category] > iou_threshold)
+    return keep
+
+
+@pytest.mark.parametrize(
+    "masks, iou_threshold, tile_size",
+    [
+        (_generate_disk_masks(n=40, seed=0), 0.5, 1024),  # single tile
+        (_generate_disk_masks(n=40, seed=1), 0.3, 7),  # many tiles
+        (_generate_disk_masks(n=40, seed=2), 0.1, 1),  # one prediction per tile
+    ],
+)
+def test_mask_non_max_suppression(
+    masks: np.ndarray, iou_threshold: float, tile_size: int
+) -> None:
+    rng = np.random.default_rng(0)
+    predictions = np.c_[
+        mask_to_xyxy(masks), rng.uniform(size=len(masks)), rng.integers(0, 2, 40)
+    ]
+    result = mask_non_max_suppression(
+        predictions=predictions,
+        masks=masks,
+        iou_threshold=iou_threshold,
+        tile_size=tile_size,
+    )
+    expected_result = _greedy_mask_non_max_suppression(
+        predictions=predictions, masks=masks, iou_threshold=iou_threshold
+    )
+    assert np.array_equal(result, expected_result)
+    for mask_store in [CompressedMask, CroppedMask]:
+        assert np.array_equal(
+            mask_non_max_suppression(
+                predictions=predictions,
+                masks=mask_store.from_dense(masks),
+                iou_threshold=iou_threshold,
+                tile_size=tile_size,
+            ),
+            expected_result,
+        )
+
+
 @pytest.mark.parametrize(
     "xyxy, resolution_wh, expected_result",
     [
@@ -0,0 +1,104 @@
+from contextlib import ExitStack as DoesNotRaise
+from test.test_utils import mock_detections
+from typing import List
+
+import numpy as np
+import pytest
+
+from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask
+from supervision.detection.tools.detections_builder import DetectionsBuilder
+
+
+def _mock_masked_detections(n: int, offset: int = 0) -> Detections:
+    mask = np.zeros((n, 8, 8), dtype=bool)
+    for i in range(n):
+        mask[i, i + offset, i] = True
+    return Detections(
+        xyxy=np.full((n, 4), offset, dtype=np.float32),
+        mask=mask,
+        confidence=np.full(n, 0.5, dtype=np.float32),
+    )
+
+
+@pytest.mark.parametrize(
+    "detections_list, exception",
+    [
+        ([], DoesNotRaise()),  # nothing appended
+        ([Detections.empty()], DoesNotRaise()),  # single empty detections
+        (
+            [mock_detections(xyxy=[[10, 10, 20, 20]]), Detections.empty()],
+            DoesNotRaise(),
+        ),  # detections with xyxy field + empty detections
+        (
+            [
+                mock_detections(xyxy=[[10, 10, 20, 20]], class_id=[0]),
+                mock_detections(xyxy=[[20, 20, 30, 30]]),
+            ],
+            DoesNotRaise(),
+        ),  # class_id present only in some detections
+        (
+            [
+                mock_detections(xyxy=[[10, 10, 20, 20]], class_id=[0], tracker_id=[1]),
+                mock_detections(
+                    xyxy=[[20, 20, 30, 30], [0, 0, 5, 5]],
+                    class_id=[1, 2],
+                    tracker_id=[2, 3],
+                ),
+            ],
+            DoesNotRaise(),
+        ),  # detections with all fields
+        (
+            [_mock_masked_detections(n=3), _mock_masked_detections(n=2, offset=3)],
+            DoesNotRaise(),
+        ),  # detections with masks
+        (
+            [_mock_masked_detections(n=3), mock_detections(xyxy=[[0, 0, 5, 5]])],
+            DoesNotRaise(),
+        ),  # mask present only in some detections
+        (
+            [
+                Detections(xyxy=np.zeros((1, 4)), mask=np.zeros((1, 8, 8), dtype=bool)),
+                Detections(xyxy=np.zeros((1, 4)), mask=np.zeros((1, 4, 4), dtype=bool)),
+            ],
+            pytest.raises(ValueError),
+        ),  # masks with different resolution
+    ],
+)
+def test_build_matches_merge(
+    detections_list: List[Detections], exception: Exception
+) -> None:
+    with exception:
+        builder = DetectionsBuilder(capacity=1)
+        for detections in detections_list:
+            builder.append(detections)
+        result = builder.build()
+        assert len(builder) == len(result)
+        assert result == Detections.merge(detections_list)
+
+
+def test_builder_reuse_after_clear() -> None:
+    builder = DetectionsBuilder(capacity=4)
+    builder.append(_mock_masked_detections(n=3))
+    builder.build()
+    builder.clear()
+
+    builder.append(mock_detections(xyxy=[[1, 1, 2, 2]], class_id=[7]))
+    builder.append(mock_detections(xyxy=[[3, 3, 4, 4]], class_id=[8]))
+    assert builder.build() == mock_detections(
+        xyxy=[[1, 1, 2, 2], [3, 3, 4, 4]], class_id=[7, 8]
+    )
+
+
+def test_builder_keeps_mask_stores_compressed() -> None:
+    first = _mock_masked_detections(n=3)
+    second = _mock_masked_detections(n=2, offset=3)
+    first.mask = CompressedMask.from_dense(first.mask)
+    second.mask = CompressedMask.from_dense(second.mask)
+
+    builder = DetectionsBuilder()
+    builder.append(first)
+    builder.append(second)
+    result = builder.build()
+    assert isinstance(result.mask, CompressedMask)
+    assert result == Detections.merge([first, second])
@@ -0,0 +1,71 @@
+from test.test_utils import mock_detections
+
+import numpy as np
+import pytest
+
+from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask
+from supervision.detection.tools.detections_file import (
+    DetectionsReader,
+    DetectionsSink,
+)
+
+FRAMES = [
+    mock_detections(xyxy=[[10, 10, 20, 20]], confidence=[0.5], class_id=[0]),
+    Detections.empty(),
+    mock_detections(
+        xyxy=[[0, 0, 5, 5], [1, 1, 6, 6]], confidence=[0.1, 0.9], class_id=[1, 2]
+    ),
+    Detections(
+        xyxy=np.zeros((1, 4)),
+        mask=CompressedMask.from_dense(np.ones((1, 4, 9), dtype=bool)),
+    ),
+]
+
+
+def test_detections_sink_and_reader(tmp_path) -> None:
+    target_path = str(tmp_path / "detections.bin")
+    with DetectionsSink(target_path=target_path) as sink:
+        for detections in FRAMES[:2]:
+            sink.write(detections)
+    with DetectionsSink(target_path=target_path, append=True) as sink:
+        for detections in FRAMES[2:]:
+            sink.write(detections)
+
+    reader = DetectionsReader(source_path=target_path)
+
+    assert len(reader) == len(FRAMES)
+    assert all(result == expected for result, expected in zip(reader, FRAMES))
+    assert reader[2] == FRAMES[2]
+    assert isinstance(reader[0].xyxy, np.memmap)
+    assert not reader[0].xyxy.flags.writeable
+
+
+def _corrupt_size(record: bytes, size: int) -> bytes:
+    # the record size is stored in bytes 36 to 44 of the header
+    return record[:36] + size.to_bytes(8, "little") + record[44:]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        FRAMES[0].to_bytes() + FRAMES[2].to_bytes()[:-16],  # truncated record
+        FRAMES[0].to_bytes() + FRAMES[2].to_bytes()[:20],  # truncated header
+        _corrupt_size(FRAMES[1].to_bytes(), 0),  # size smaller than the header
+        _corrupt_size(FRAMES[1].to_bytes(), 1 << 40),  # size beyond the file
+        FRAMES[0].to_bytes() + b"\0" * 64,  # garbage after the last record
+    ],
+)
+def test_detections_reader_corrupt_file(tmp_path, data: bytes) -> None:
+    target_path = tmp_path / "detections.bin"
+    target_path.write_bytes(data)
+
+    with pytest.raises(ValueError):
+        DetectionsReader(source_path=str(target_path))
+
+
+def test_detections_reader_empty_file(tmp_path) -> None:
+    target_path = tmp_path / "detections.bin"
+    target_path.touch()
+
+    assert len(DetectionsReader(source_path=str(target_path))) == 0
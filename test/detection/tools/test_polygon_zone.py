@@ -0,0 +1,35 @@
+from test.test_utils import mock_detections
+
+import numpy as np
+
+from supervision.detection.tools import polygon_zone
+from supervision.detection.tools.polygon_zone import PolygonZone
+
+
+def test_polygon_zones_share_anchors(monkeypatch) -> None:
+    calls = []
+    original_clip_boxes = polygon_zone.clip_boxes
+
+    def clip_boxes(*args, **kwargs):
+        calls.append(1)
+        return original_clip_boxes(*args, **kwargs)
+
+    monkeypatch.setattr(polygon_zone, "clip_boxes", clip_boxes)
+
+    detections = mock_detections(xyxy=[[10, 10, 20, 20], [60, 60, 70, 70]])
+    zones = [
+        PolygonZone(
+            polygon=np.array([[x, 0], [x + 50, 0], [x + 50, 100], [x, 100]]),
+            frame_resolution_wh=(100, 100),
+        )
+        for x in [0, 25, 50]
+    ]
+
+    results = [zone.trigger(detections) for zone in zones]
+
+    assert len(calls) == 1
+    assert [result.tolist() for result in results] == [
+        [True, False],
+        [False, True],
+        [False, True],
+    ]
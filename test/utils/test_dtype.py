@@ -0,0 +1,95 @@
+import threading
+from test.test_utils import mock_detections
+
+import numpy as np
+import pytest
+
+from supervision.detection.core import Detections
+from supervision.detection.tools.polygon_zone import PolygonZone
+from supervision.detection.utils import (
+    box_iou_batch,
+    box_iou_batch_sparse,
+    polygon_to_mask,
+)
+from supervision.geometry.core import Position
+from supervision.metrics.detection import detections_to_tensor
+from supervision.utils.dtype import dtype_policy, get_dtype_policy, set_dtype_policy
+
+POLYGON = np.array([[2, 2], [8, 2], [8, 8], [2, 8]])
+
+
+def test_default_dtype_policy_keeps_dtypes() -> None:
+    detections = Detections(
+        xyxy=np.array([[0, 0, 10, 10]], dtype=np.float64),
+        class_id=np.array([1], dtype=np.int64),
+    )
+
+    assert detections.xyxy.dtype == np.float64
+    assert detections.class_id.dtype == np.int64
+    assert polygon_to_mask(POLYGON, resolution_wh=(10, 10)).dtype == np.float64
+
+
+def test_dtype_policy_context_manager() -> None:
+    with dtype_policy(float_dtype=np.float32, int_dtype=np.int32):
+        detections = mock_detections(
+            xyxy=[[0, 0, 10, 10], [5, 5, 15, 15]], class_id=[0, 1], tracker_id=[1, 2]
+        )
+        detections.confidence = np.array([0.5, 0.7])
+
+        assert detections.xyxy.dtype == np.float32
+        assert detections.confidence.dtype == np.float32
+        assert detections.class_id.dtype == np.int32
+        assert detections.tracker_id.dtype == np.int32
+        anchors = detections.get_anchors_coordinates(anchor=Position.BOTTOM_CENTER)
+        assert anchors.dtype == np.float32
+        assert box_iou_batch(detections.xyxy, detections.xyxy).dtype == np.float32
+        assert box_iou_batch_sparse(detections.xyxy, detections.xyxy).dtype == (
+            np.float32
+        )
+        assert detections_to_tensor(detections).dtype == np.float32
+
+    assert get_dtype_policy().float_dtype is None
+    assert Detections(xyxy=np.zeros((1, 4))).xyxy.dtype == np.float64
+
+
+@pytest.mark.parametrize("mask_dtype", [np.uint8, bool])
+def test_dtype_policy_mask_dtype(mask_dtype) -> None:
+    expected_result = polygon_to_mask(POLYGON, resolution_wh=(10, 10))
+    previous = set_dtype_policy(mask_dtype=mask_dtype)
+    try:
+        mask = polygon_to_mask(POLYGON, resolution_wh=(10, 10))
+        zone = PolygonZone(polygon=POLYGON, frame_resolution_wh=(10, 10))
+    finally:
+        set_dtype_policy(
+            float_dtype=previous.float_dtype,
+            int_dtype=previous.int_dtype,
+            mask_dtype=previous.mask_dtype,
+        )
+
+    assert mask.dtype == mask_dtype
+    assert np.array_equal(mask, expected_result)
+    assert zone.mask.dtype == mask_dtype
+    assert zone.trigger(mock_detections(xyxy=[[3, 3, 5, 5]])).tolist() == [True]
+
+
+def test_dtype_policy_is_local_to_thread() -> None:
+    inside, entered = threading.Event(), threading.Event()
+    result = {}
+
+    def run() -> None:
+        with dtype_policy(float_dtype=np.float16):
+            entered.set()
+            inside.wait(timeout=5)
+            result["thread"] = get_dtype_policy().float_dtype
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    entered.wait(timeout=5)
+    with dtype_policy(float_dtype=np.float32):
+        # the thread block exits while this block is still active
+        inside.set()
+        thread.join(timeout=5)
+        assert get_dtype_policy().float_dtype == np.float32
+
+    assert result["thread"] == np.float16
+    assert get_dtype_policy().float_dtype is None
@@ -0,0 +1,106 @@
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from supervision.utils.image import ImageSink
+from supervision.utils.profiler import Profiler
+
+IMAGE_COUNT = 10
+
+
+def _images():
+    rng = np.random.default_rng(0)
+    for index in range(IMAGE_COUNT):
+        image = np.full((32, 48, 3), index * 20, dtype=np.uint8)
+        image[8:24, 8:24] = rng.integers(0, 255, (16, 16, 3))
+        yield image
+
+
+@pytest.mark.parametrize(
+    "max_workers, extension",
+    [
+        (0, "png"),
+        (2, "png"),
+        (4, "jpg"),
+        (2, "webp"),
+    ],
+)
+def test_image_sink(tmp_path, max_workers: int, extension: str) -> None:
+    target_dir_path = str(tmp_path / "images")
+    images = list(_images())
+    with ImageSink(
+        target_dir_path=target_dir_path,
+        image_name_pattern="image_{:05d}." + extension,
+        max_workers=max_workers,
+    ) as sink:
+        for image in images:
+            sink.save_image(image=image)
+            image[:] = 0
+
+    file_names = sorted(os.listdir(target_dir_path))
+    assert file_names == [f"image_{i:05d}.{extension}" for i in range(IMAGE_COUNT)]
+    if extension == "png":
+        for file_name, expected_image in zip(file_names, _images()):
+            image = cv2.imread(os.path.join(target_dir_path, file_name))
+            assert np.array_equal(image, expected_image)
+
+
+@pytest.mark.parametrize(
+    "extension, low, high",
+    [
+        ("jpg", dict(jpeg_quality=10), dict(jpeg_quality=95)),
+        ("png", dict(png_compression=9), dict(png_compression=0)),
+        ("webp", dict(webp_quality=10), dict(webp_quality=95)),
+    ],
+)
+def test_image_sink_encoder_params(
+    tmp_path, extension: str, low: dict, high: dict
+) -> None:
+    sizes = []
+    for name, params in [("low", low), ("high", high)]:
+        target_dir_path = str(tmp_path / name)
+        with ImageSink(
+            target_dir_path=target_dir_path,
+            image_name_pattern="image_{:05d}." + extension,
+            max_workers=2,
+            **params,
+        ) as sink:
+            for image in _images():
+                sink.save_image(image=image)
+        sizes.append(
+            sum(
+                os.path.getsize(os.path.join(target_dir_path, file_name))
+                for file_name in os.listdir(target_dir_path)
+            )
+        )
+
+    assert sizes[0] < sizes[1]
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_image_sink_write_error(tmp_path, max_workers: int) -> None:
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    with pytest.raises(OSError):
+        with ImageSink(target_dir_path=str(tmp_path), max_workers=max_workers) as sink:
+            # OpenCV does not create missing directories
+            sink.save_image(image=image, image_name="missing/image.png")
+
+
+@pytest.mark.parametrize(
+    "max_workers, expected_stages",
+    [(0, {"encode"}), (2, {"encode", "encode_wait"})],
+)
+def test_image_sink_profiler(tmp_path, max_workers: int, expected_stages: set) -> None:
+    profiler = Profiler()
+    with ImageSink(
+        target_dir_path=str(tmp_path), max_workers=max_workers, profiler=profiler
+    ) as sink:
+        for image in _images():
+            sink.save_image(image=image)
+
+    stages = profiler.report().stages
+    assert set(stages) == expected_stages
+    assert stages["encode"].count == IMAGE_COUNT
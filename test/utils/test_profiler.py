@@ -0,0 +1,82 @@
+import csv
+import json
+from contextlib import ExitStack as DoesNotRaise
+
+import numpy as np
+import pytest
+
+from supervision.utils.profiler import Profiler, StageStats
+
+
+def test_profiler_report() -> None:
+    profiler = Profiler()
+    for seconds in np.arange(1, 101) / 1000:
+        profiler.record("decode", seconds)
+    profiler.increment("dropped_frames")
+    profiler.increment("dropped_frames", 2)
+    with profiler.measure("callback"):
+        pass
+
+    report = profiler.report()
+
+    decode = report.stages["decode"]
+    assert decode.count == 100
+    assert decode.total_s == pytest.approx(5.05)
+    assert decode.mean_ms == pytest.approx(50.5)
+    assert decode.p50_ms == pytest.approx(50.5, rel=0.01)
+    assert decode.p95_ms == pytest.approx(95.05, rel=0.01)
+    assert decode.p99_ms == pytest.approx(99.01, rel=0.01)
+    assert decode.max_ms == pytest.approx(100)
+    assert report.stages["callback"].count == 1
+    assert report.counters == {"dropped_frames": 3}
+
+    profiler.reset()
+    assert profiler.report().stages == {}
+
+
+def test_profiler_memory_is_bounded() -> None:
+    profiler = Profiler()
+    samples = np.random.default_rng(0).lognormal(mean=-5, sigma=1, size=100_000)
+    for seconds in samples:
+        profiler.record("callback", seconds)
+
+    histogram = profiler._histograms["callback"]
+    stats = profiler.report().stages["callback"]
+    expected = StageStats.from_samples(list(samples))
+
+    assert histogram.counts.size == histogram.BUCKET_COUNT
+    assert stats.count == expected.count
+    assert stats.mean_ms == pytest.approx(expected.mean_ms)
+    assert stats.max_ms == pytest.approx(expected.max_ms)
+    assert stats.p50_ms == pytest.approx(expected.p50_ms, rel=0.01)
+    assert stats.p99_ms == pytest.approx(expected.p99_ms, rel=0.01)
+
+
+@pytest.mark.parametrize(
+    "file_name, exception",
+    [
+        ("report.json", DoesNotRaise()),
+        ("report.csv", DoesNotRaise()),
+        ("report.txt", pytest.raises(ValueError)),
+    ],
+)
+def test_profile_report_save(tmp_path, file_name: str, exception: Exception) -> None:
+    profiler = Profiler()
+    profiler.record("encode", 0.002)
+    profiler.increment("dropped_frames")
+    file_path = str(tmp_path / file_name)
+
+    with exception:
+        profiler.report().save(file_path)
+
+        if file_name.endswith(".json"):
+            with open(file_path) as file:
+                data = json.load(file)
+            assert StageStats(**data["stages"]["encode"]).count == 1
+            assert data["counters"] == {"dropped_frames": 1}
+        else:
+            with open(file_path) as file:
+                rows = list(csv.reader(file))
+            assert rows[0][:2] == ["name", "count"]
+            assert rows[1][:2] == ["encode", "1"]
+            assert rows[2][:2] == ["dropped_frames", "1"]
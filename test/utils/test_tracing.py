@@ -0,0 +1,84 @@
+import json
+import threading
+
+import numpy as np
+
+from supervision.annotators.core import BoundingBoxAnnotator
+from supervision.detection.core import Detections
+from supervision.utils.tracing import (
+    disable_tracing,
+    enable_tracing,
+    traced,
+    tracing,
+)
+
+DETECTIONS = Detections(
+    xyxy=np.array([[0, 0, 10, 10], [5, 5, 20, 20]], dtype=float),
+    confidence=np.array([0.9, 0.8]),
+    class_id=np.array([0, 0]),
+)
+
+
+@traced
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+def test_tracing_records_hot_path_calls(tmp_path) -> None:
+    scene = np.zeros((32, 32, 3), dtype=np.uint8)
+    with tracing() as tracer:
+        for _ in range(3):
+            BoundingBoxAnnotator().annotate(scene=scene, detections=DETECTIONS)
+        Detections.merge([DETECTIONS, DETECTIONS])
+        DETECTIONS.with_nms(threshold=0.5)
+    BoundingBoxAnnotator().annotate(scene=scene, detections=DETECTIONS)
+
+    stages = tracer.report().stages
+    assert stages["BoundingBoxAnnotator.annotate"].count == 3
+    assert stages["Detections.merge"].count == 1
+    assert stages["Detections.with_nms"].count == 1
+
+    file_path = str(tmp_path / "trace.json")
+    tracer.save_chrome_trace(file_path)
+    with open(file_path) as file:
+        events = json.load(file)["traceEvents"]
+    assert len(events) == 5
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+
+def test_enable_disable_tracing() -> None:
+    assert _add(1, 2) == 3
+    tracer = enable_tracing()
+    assert _add(1, 2) == 3
+    assert disable_tracing() is tracer
+    assert _add(1, 2) == 3
+    assert disable_tracing() is None
+
+    assert tracer.report().stages["_add"].count == 1
+
+
+def test_tracing_blocks_are_local_to_thread() -> None:
+    entered, leave = threading.Event(), threading.Event()
+    thread_tracers = []
+
+    def run() -> None:
+        with tracing() as tracer:
+            thread_tracers.append(tracer)
+            entered.set()
+            leave.wait(timeout=5)
+            _add(1, 2)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    entered.wait(timeout=5)
+    with tracing() as tracer:
+        _add(1, 2)
+        # the thread block exits while this block is still active
+        leave.set()
+        thread.join(timeout=5)
+        _add(1, 2)
+    _add(1, 2)
+
+    assert tracer.report().stages["_add"].count == 2
+    assert thread_tracers[0].report().stages["_add"].count == 1
+    assert disable_tracing() is None
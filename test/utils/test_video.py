@@ -0,0 +1,746 @@
+import json
+import shutil
+import sys
+import threading
+import time
+from contextlib import ExitStack as DoesNotRaise
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+import pytest
+
+from supervision.detection.core import Detections
+from supervision.detection.mask import CompressedMask, CroppedMask
+from supervision.utils.profiler import Profiler
+from supervision.utils.video import (
+    FFmpegVideoSink,
+    LatestFrameReader,
+    MultiSourceVideoReader,
+    ScaleTransform,
+    VideoInfo,
+    VideoKeyframeIndex,
+    VideoSink,
+    _FFmpegWriter,
+    _prefetch,
+    get_video_frames_at,
+    get_video_frames_batch_generator,
+    get_video_frames_generator,
+    get_video_scaled_frames_generator,
+    process_video,
+    process_video_in_segments,
+)
+
+FRAME_COUNT = 12
+
+
+@pytest.fixture(scope="module")
+def video_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("video") / "video.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for index in range(FRAME_COUNT):
+        writer.write(np.full((24, 32, 3), index * 20, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture(scope="module")
+def mp4_video_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("video") / "video.mp4")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 10, (64, 48))
+    rng = np.random.default_rng(0)
+    for index in range(FRAME_COUNT * 3):
+        frame = np.full((48, 64, 3), index * 5, dtype=np.uint8)
+        frame[:8, :8] = rng.integers(0, 255, (8, 8, 3))
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+@pytest.mark.parametrize(
+    "stride, start, end",
+    [
+        (1, 0, None),
+        (2, 0, None),
+        (3, 2, 10),
+        (1, 5, 6),
+    ],
+)
+def test_get_video_frames_generator_prefetch(
+    video_path: str, stride: int, start: int, end: Optional[int]
+) -> None:
+    expected = list(
+        get_video_frames_generator(video_path, stride=stride, start=start, end=end)
+    )
+    result = list(
+        get_video_frames_generator(
+            video_path, stride=stride, start=start, end=end, prefetch=2
+        )
+    )
+
+    assert len(expected) > 0
+    assert len(result) == len(expected)
+    for result_frame, expected_frame in zip(result, expected):
+        assert np.array_equal(result_frame, expected_frame)
+
+
+def test_get_video_frames_generator_prefetch_early_exit(video_path: str) -> None:
+    thread_count = threading.active_count()
+    frames = get_video_frames_generator(video_path, prefetch=1)
+    next(frames)
+    frames.close()
+
+    assert threading.active_count() == thread_count
+
+
+def _failing_iterator():
+    yield 1
+    raise RuntimeError("decode failed")
+
+
+@pytest.mark.parametrize(
+    "iterable, depth, expected_result, exception",
+    [
+        ([], 1, [], DoesNotRaise()),
+        (range(10), 1, list(range(10)), DoesNotRaise()),
+        (range(10), 4, list(range(10)), DoesNotRaise()),
+        (_failing_iterator(), 2, None, pytest.raises(RuntimeError)),
+    ],
+)
+def test_prefetch(iterable, depth: int, expected_result, exception: Exception) -> None:
+    with exception:
+        result = list(_prefetch(iter(iterable), depth=depth))
+        assert result == expected_result
+
+
+def _count_frames(path: str) -> int:
+    return sum(1 for _ in get_video_frames_generator(path))
+
+
+@pytest.mark.parametrize(
+    "queue_size, drop_frames",
+    [
+        (0, False),
+        (1, False),
+        (4, False),
+        (1, True),
+    ],
+)
+def test_video_sink(tmp_path, video_path: str, queue_size: int, drop_frames: bool):
+    target_path = str(tmp_path / "target.avi")
+    video_info = VideoInfo.from_video_path(video_path)
+    with VideoSink(
+        target_path=target_path,
+        video_info=video_info,
+        codec="MJPG",
+        queue_size=queue_size,
+        drop_frames=drop_frames,
+    ) as sink:
+        for frame in get_video_frames_generator(video_path):
+            sink.write_frame(frame=frame)
+            frame[:] = 0
+
+    assert sink.queue_depth == 0
+    assert sink.peak_queue_depth <= queue_size
+    assert _count_frames(target_path) + sink.dropped_frames == FRAME_COUNT
+    if not drop_frames:
+        assert sink.dropped_frames == 0
+        first_frame = next(get_video_frames_generator(target_path))
+        assert first_frame.max() == 0
+        assert next(get_video_frames_generator(target_path, start=1)).min() > 0
+
+
+def test_video_sink_flushes_on_exception(tmp_path, video_path: str) -> None:
+    target_path = str(tmp_path / "target.avi")
+    video_info = VideoInfo.from_video_path(video_path)
+    with pytest.raises(RuntimeError):
+        with VideoSink(
+            target_path=target_path,
+            video_info=video_info,
+            codec="MJPG",
+            queue_size=FRAME_COUNT,
+        ) as sink:
+            for frame in get_video_frames_generator(video_path):
+                sink.write_frame(frame=frame)
+            raise RuntimeError
+
+    assert _count_frames(target_path) == FRAME_COUNT
+
+
+def _invert(frame: np.ndarray, index: int) -> np.ndarray:
+    return 255 - frame if index % 2 else frame
+
+
+@pytest.mark.parametrize(
+    "max_workers, use_processes",
+    [
+        (2, False),
+        (4, False),
+        (2, True),
+    ],
+)
+def test_process_video_parallel(
+    tmp_path, video_path: str, max_workers: int, use_processes: bool
+) -> None:
+    expected_path = str(tmp_path / "expected.mp4")
+    result_path = str(tmp_path / "result.mp4")
+    process_video(source_path=video_path, target_path=expected_path, callback=_invert)
+    process_video(
+        source_path=video_path,
+        target_path=result_path,
+        callback=_invert,
+        max_workers=max_workers,
+        use_processes=use_processes,
+    )
+
+    expected = list(get_video_frames_generator(expected_path))
+    result = list(get_video_frames_generator(result_path))
+    assert len(result) == len(expected) == FRAME_COUNT
+    for result_frame, expected_frame in zip(result, expected):
+        assert np.array_equal(result_frame, expected_frame)
+
+
+class _Delay:
+    """Stateful callback returning the previous frame."""
+
+    def __init__(self):
+        self.previous = None
+
+    def __call__(self, frame: np.ndarray, index: int) -> np.ndarray:
+        result = frame if self.previous is None else self.previous
+        self.previous = frame
+        return result
+
+
+@pytest.mark.parametrize(
+    "segments, warmup, expected_equal",
+    [
+        (1, 0, True),
+        (3, 1, True),
+        (3, 0, False),
+        (FRAME_COUNT + 5, 1, True),
+    ],
+)
+def test_process_video_in_segments(
+    tmp_path, video_path: str, segments: int, warmup: int, expected_equal: bool
+) -> None:
+    expected_path = str(tmp_path / "expected.mp4")
+    result_path = str(tmp_path / "result.mp4")
+    process_video(source_path=video_path, target_path=expected_path, callback=_Delay())
+    process_video_in_segments(
+        source_path=video_path,
+        target_path=result_path,
+        callback_factory=_Delay,
+        segments=segments,
+        warmup=warmup,
+    )
+
+    expected = list(get_video_frames_generator(expected_path))
+    result = list(get_video_frames_generator(result_path))
+    assert len(result) == len(expected) == FRAME_COUNT
+    # segments are encoded twice, so frames only match up to compression noise
+    assert expected_equal == all(
+        np.abs(result_frame.astype(int) - expected_frame).mean() < 5
+        for result_frame, expected_frame in zip(result, expected)
+    )
+
+
+@pytest.mark.parametrize(
+    "batch_size, stride, start, end",
+    [
+        (4, 1, 0, None),
+        (5, 1, 0, None),
+        (5, 2, 1, 11),
+        (FRAME_COUNT + 1, 1, 0, None),
+    ],
+)
+def test_get_video_frames_batch_generator(
+    video_path: str, batch_size: int, stride: int, start: int, end: Optional[int]
+) -> None:
+    expected = list(
+        get_video_frames_generator(video_path, stride=stride, start=start, end=end)
+    )
+    expected_indices = list(range(start, end or FRAME_COUNT, stride))
+
+    result, result_indices, buffers = [], [], set()
+    for frames, indices in get_video_frames_batch_generator(
+        video_path, batch_size=batch_size, stride=stride, start=start, end=end
+    ):
+        assert frames.flags.c_contiguous
+        assert len(frames) == len(indices) <= batch_size
+        buffers.add(frames.__array_interface__["data"][0])
+        result.extend(frame.copy() for frame in frames)
+        result_indices.extend(indices.tolist())
+
+    assert len(buffers) == 1
+    assert result_indices == expected_indices
+    assert len(result) == len(expected)
+    for result_frame, expected_frame in zip(result, expected):
+        assert np.array_equal(result_frame, expected_frame)
+
+
+@pytest.mark.parametrize(
+    "keyframes",
+    [None, np.array([0]), np.array([0, 5, 11, 20, 30])],
+)
+@pytest.mark.parametrize(
+    "stride, start, end",
+    [
+        (1, 0, None),
+        (4, 0, None),
+        (7, 3, 30),
+    ],
+)
+def test_get_video_frames_generator_keyframe_index(
+    mp4_video_path: str,
+    keyframes: Optional[np.ndarray],
+    stride: int,
+    start: int,
+    end: Optional[int],
+) -> None:
+    keyframe_index = (
+        VideoKeyframeIndex.build(mp4_video_path)
+        if keyframes is None
+        else VideoKeyframeIndex(keyframes=keyframes)
+    )
+    all_frames = list(get_video_frames_generator(mp4_video_path))
+    expected = all_frames[start:end:stride]
+    result = list(
+        get_video_frames_generator(
+            mp4_video_path,
+            stride=stride,
+            start=start,
+            end=end,
+            keyframe_index=keyframe_index,
+        )
+    )
+
+    assert len(result) == len(expected)
+    for result_frame, expected_frame in zip(result, expected):
+        assert np.array_equal(result_frame, expected_frame)
+
+
+def test_get_video_frames_at(tmp_path, mp4_video_path: str) -> None:
+    index_path = str(tmp_path / "index.npy")
+    keyframe_index = VideoKeyframeIndex.from_video_path(
+        mp4_video_path, index_path=index_path
+    )
+    assert keyframe_index.keyframes[0] == 0
+    assert np.array_equal(
+        VideoKeyframeIndex.from_video_path(
+            mp4_video_path, index_path=index_path
+        ).keyframes,
+        keyframe_index.keyframes,
+    )
+
+    all_frames = list(get_video_frames_generator(mp4_video_path))
+    frame_indices = [30, 2, 17, 17, 35, 0]
+    result = list(
+        get_video_frames_at(
+            mp4_video_path, frame_indices=frame_indices, keyframe_index=keyframe_index
+        )
+    )
+
+    assert len(result) == len(frame_indices)
+    for result_frame, frame_index in zip(result, frame_indices):
+        assert np.array_equal(result_frame, all_frames[frame_index])
+
+
+@pytest.mark.parametrize(
+    "keyframes, frame_index, expected_result",
+    [
+        (np.array([0]), 10, 0),
+        (np.array([0, 5, 10]), 4, 0),
+        (np.array([0, 5, 10]), 5, 5),
+        (np.array([0, 5, 10]), 12, 10),
+    ],
+)
+def test_video_keyframe_index_nearest_keyframe(
+    keyframes: np.ndarray, frame_index: int, expected_result: int
+) -> None:
+    keyframe_index = VideoKeyframeIndex(keyframes=keyframes)
+    assert keyframe_index.nearest_keyframe(frame_index) == expected_result
+
+
+@pytest.mark.parametrize(
+    "ring_size, prefetch, exception",
+    [
+        (1, 0, DoesNotRaise()),
+        (3, 0, DoesNotRaise()),
+        (4, 2, DoesNotRaise()),
+        (3, 2, pytest.raises(ValueError)),
+    ],
+)
+def test_get_video_frames_generator_ring(
+    video_path: str, ring_size: int, prefetch: int, exception: Exception
+) -> None:
+    expected = list(get_video_frames_generator(video_path))
+    with exception:
+        valid_count = ring_size - prefetch - 1 if prefetch else ring_size
+        frames = get_video_frames_generator(
+            video_path, ring_size=ring_size, prefetch=prefetch
+        )
+        result, buffers = [], set()
+        for index, frame in enumerate(frames):
+            result.append(frame)
+            buffers.add(frame.__array_interface__["data"][0])
+            for held_index in range(max(index - valid_count + 1, 0), index + 1):
+                assert np.array_equal(result[held_index], expected[held_index])
+
+        assert len(result) == len(expected)
+        assert len(buffers) == ring_size
+
+
+@pytest.mark.parametrize("ordering", ["round_robin", "timestamp"])
+def test_multi_source_video_reader(
+    video_path: str, mp4_video_path: str, ordering: str
+) -> None:
+    reader = MultiSourceVideoReader(
+        sources={"a": video_path, "b": mp4_video_path}, ordering=ordering
+    )
+    expected = {
+        "a": list(get_video_frames_generator(video_path)),
+        "b": list(get_video_frames_generator(mp4_video_path)),
+    }
+
+    result = list(reader)
+    for source_id, frames in expected.items():
+        source_result = [item for item in result if item[0] == source_id]
+        assert [item[1] for item in source_result] == list(range(len(frames)))
+        for (_, _, result_frame), expected_frame in zip(source_result, frames):
+            assert np.array_equal(result_frame, expected_frame)
+        assert reader.stats[source_id].frames_read == len(frames)
+        assert reader.stats[source_id].frames_dropped == 0
+
+    source_ids = [item[0] for item in result]
+    frame_indices = [item[1] for item in result]
+    if ordering == "round_robin":
+        common = 2 * FRAME_COUNT
+        assert source_ids[:common] == ["a", "b"] * FRAME_COUNT
+    else:
+        # both videos have the same fps, so timestamps follow frame indices
+        assert frame_indices == sorted(frame_indices)
+
+
+def test_multi_source_video_reader_early_exit(video_path: str) -> None:
+    thread_count = threading.active_count()
+    reader = MultiSourceVideoReader(sources=[video_path] * 3, queue_size=1)
+    for source_id, frame_index, _ in reader:
+        if frame_index == 2:
+            break
+
+    assert threading.active_count() == thread_count
+
+
+@pytest.mark.parametrize(
+    "sources, ordering, exception",
+    [
+        (["missing.mp4"], "round_robin", pytest.raises(Exception)),
+        ([], "round_robin", DoesNotRaise()),
+        ([], "random", pytest.raises(ValueError)),
+    ],
+)
+def test_multi_source_video_reader_errors(
+    sources, ordering: str, exception: Exception
+) -> None:
+    with exception:
+        assert list(MultiSourceVideoReader(sources=sources, ordering=ordering)) == []
+
+
+@pytest.mark.parametrize(
+    "max_workers, exception",
+    [
+        (None, DoesNotRaise()),
+        (1, DoesNotRaise()),
+        (2, DoesNotRaise()),
+        (3, DoesNotRaise()),
+        (4, DoesNotRaise()),
+        (0, pytest.raises(ValueError)),
+    ],
+)
+@pytest.mark.parametrize("ordering", ["round_robin", "timestamp"])
+def test_multi_source_video_reader_max_workers(
+    video_path: str, ordering: str, max_workers: Optional[int], exception: Exception
+) -> None:
+    with exception:
+        reader = MultiSourceVideoReader(
+            sources=[video_path] * 3,
+            ordering=ordering,
+            queue_size=2,
+            max_workers=max_workers,
+        )
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.extend(item[:2] for item in reader), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        expected = [(s, i) for i in range(FRAME_COUNT) for s in range(3)]
+        if ordering == "round_robin":
+            assert result == expected
+        else:
+            assert sorted(result) == sorted(expected)
+
+
+@pytest.mark.parametrize("queue_size", [1, 3])
+def test_multi_source_video_reader_more_sources_than_workers(
+    video_path: str, mp4_video_path: str, queue_size: int
+) -> None:
+    sources = [video_path, mp4_video_path] * 4
+    reader = MultiSourceVideoReader(
+        sources=sources, queue_size=queue_size, max_workers=2
+    )
+    counts = {}
+
+    def consume() -> None:
+        for source_id, _, _ in reader:
+            counts[source_id] = counts.get(source_id, 0) + 1
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert counts == {
+        source_id: FRAME_COUNT * (1 if source_id % 2 == 0 else 3)
+        for source_id in range(len(sources))
+    }
+    assert all(stats.frames_dropped == 0 for stats in reader.stats.values())
+
+
+def test_multi_source_video_reader_drop_frames(mp4_video_path: str) -> None:
+    reader = MultiSourceVideoReader(
+        sources=[mp4_video_path], queue_size=1, drop_frames=True
+    )
+    yielded = 0
+    for _ in reader:
+        time.sleep(0.01)
+        yielded += 1
+
+    stats = reader.stats[0]
+    assert stats.frames_read == FRAME_COUNT * 3
+    assert yielded + stats.frames_dropped == stats.frames_read
+
+
+@pytest.mark.parametrize(
+    "max_size, lazy, expected_wh",
+    [
+        (16, True, (16, 12)),
+        (16, False, (16, 12)),
+        (100, True, (32, 24)),
+    ],
+)
+def test_get_video_scaled_frames_generator(
+    video_path: str, max_size: int, lazy: bool, expected_wh: Tuple[int, int]
+) -> None:
+    expected = list(get_video_frames_generator(video_path))
+    result = list(
+        get_video_scaled_frames_generator(
+            video_path, max_size=max_size, lazy=lazy, prefetch=2
+        )
+    )
+
+    assert len(result) == len(expected)
+    for scaled_frame, expected_frame in zip(result, expected):
+        assert np.array_equal(scaled_frame.frame, expected_frame)
+        assert scaled_frame.transform.source_wh == (32, 24)
+        assert scaled_frame.transform.target_wh == expected_wh
+        assert scaled_frame.inference_frame.shape == (*expected_wh[::-1], 3)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_scale_transform_detections_to_source(compressed: bool) -> None:
+    transform = ScaleTransform(source_wh=(40, 20), target_wh=(20, 10))
+    mask = np.zeros((1, 10, 20), dtype=bool)
+    mask[0, 2:5, 4:8] = True
+    detections = Detections(
+        xyxy=np.array([[4, 2, 8, 5]], dtype=float),
+        mask=CompressedMask.from_dense(mask) if compressed else mask,
+        class_id=np.array([3]),
+    )
+
+    result = transform.detections_to_source(detections)
+
+    expected_mask = np.zeros((1, 20, 40), dtype=bool)
+    expected_mask[0, 4:10, 8:16] = True
+    assert np.array_equal(result.xyxy, [[8, 4, 16, 10]])
+    assert np.array_equal(np.asarray(result.mask), expected_mask)
+    assert isinstance(result.mask, CompressedMask) == compressed
+    assert np.array_equal(result.class_id, detections.class_id)
+
+
+@pytest.mark.parametrize(
+    "source_wh, target_wh",
+    [
+        ((40, 20), (20, 10)),  # upscaling by 2
+        ((1920, 1080), (640, 360)),  # upscaling by 3
+        ((101, 77), (64, 48)),  # non-integer factors
+        ((30, 20), (64, 48)),  # downscaling
+    ],
+)
+def test_scale_transform_cropped_mask_to_source(
+    source_wh: Tuple[int, int], target_wh: Tuple[int, int]
+) -> None:
+    transform = ScaleTransform(source_wh=source_wh, target_wh=target_wh)
+    width, height = target_wh
+    xyxy = np.array(
+        [
+            [2, 3, width // 2, height // 2],
+            [width // 3, 1, width, height],
+            [0, 0, 1, 1],
+            [5, 5, 5, 9],  # empty box
+        ],
+        dtype=float,
+    )
+    dense = np.random.default_rng(0).random((len(xyxy), height, width)) > 0.5
+    mask = CroppedMask.from_dense(dense, xyxy=xyxy)
+    expected = np.array(
+        [
+            cv2.resize(m.astype(np.uint8), source_wh, interpolation=cv2.INTER_NEAREST)
+            for m in mask.to_dense()
+        ],
+        dtype=bool,
+    )
+
+    result = transform.detections_to_source(Detections(xyxy=xyxy, mask=mask)).mask
+
+    assert isinstance(result, CroppedMask)
+    assert result.resolution_wh == source_wh
+    assert np.array_equal(result.to_dense(), expected)
+
+
+@pytest.mark.parametrize(
+    "max_workers, expected_stages",
+    [
+        (1, {"decode", "callback", "encode"}),
+        (
+            2,
+            {"decode", "decode_wait", "callback", "callback_wait", "encode"},
+        ),
+    ],
+)
+def test_process_video_profiler(
+    tmp_path, video_path: str, max_workers: int, expected_stages: set
+) -> None:
+    report_path = str(tmp_path / "report.json")
+    profiler = Profiler(report_path=report_path)
+    process_video(
+        source_path=video_path,
+        target_path=str(tmp_path / "result.mp4"),
+        callback=_invert,
+        max_workers=max_workers,
+        profiler=profiler,
+    )
+
+    report = profiler.report()
+    assert expected_stages <= set(report.stages)
+    for stage in expected_stages:
+        assert report.stages[stage].count == FRAME_COUNT
+    with open(report_path) as file:
+        assert set(json.load(file)["stages"]) == set(report.stages)
+
+
+@pytest.fixture(scope="module")
+def fast_video_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("video") / "fast.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 200, (32, 24))
+    for index in range(40):
+        writer.write(np.full((24, 32, 3), index * 5, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_latest_frame_reader_drops_stale_frames(fast_video_path: str) -> None:
+    reader = LatestFrameReader(source=fast_video_path, pace=True)
+    frame_indices = []
+    for frame_index, frame in reader:
+        assert frame.shape == (24, 32, 3)
+        frame_indices.append(frame_index)
+        time.sleep(0.02)
+
+    assert frame_indices == sorted(set(frame_indices))
+    assert frame_indices[-1] == 39
+    assert reader.stats.frames_read == 40
+    assert reader.stats.frames_dropped > 0
+    assert len(frame_indices) + reader.stats.frames_dropped == 40
+
+
+def test_latest_frame_reader_target_fps(fast_video_path: str) -> None:
+    reader = LatestFrameReader(source=fast_video_path, target_fps=50, pace=True)
+    timestamps = [time.monotonic() for _ in reader]
+
+    assert np.all(np.diff(timestamps) >= 0.02 * 0.9)
+    assert len(timestamps) + reader.stats.frames_dropped == 40
+
+
+def test_latest_frame_reader_early_exit(fast_video_path: str) -> None:
+    thread_count = threading.active_count()
+    for _ in LatestFrameReader(source=fast_video_path, pace=True):
+        break
+
+    assert threading.active_count() == thread_count
+
+
+def test_latest_frame_reader_missing_source() -> None:
+    with pytest.raises(Exception):
+        list(LatestFrameReader(source="missing.mp4"))
+
+
+def test_ffmpeg_writer_pipes_raw_frames(tmp_path) -> None:
+    target_path = str(tmp_path / "frames.raw")
+    command = [
+        sys.executable,
+        "-c",
+        f"import sys; open({target_path!r}, 'wb').write(sys.stdin.buffer.read())",
+    ]
+    frames = [np.full((24, 32, 3), i, dtype=np.uint8) for i in range(3)]
+    writer = _FFmpegWriter(command=command, resolution_wh=(32, 24))
+    for frame in frames:
+        writer.write(frame)
+    with pytest.raises(ValueError):
+        writer.write(np.zeros((10, 10, 3), dtype=np.uint8))
+    writer.release()
+
+    with open(target_path, "rb") as file:
+        assert file.read() == b"".join(frame.tobytes() for frame in frames)
+
+
+def test_ffmpeg_writer_failure() -> None:
+    command = [sys.executable, "-c", "import sys; sys.exit(1)"]
+    writer = _FFmpegWriter(command=command, resolution_wh=(32, 24))
+    with pytest.raises(Exception):
+        writer.release()
+
+
+def test_ffmpeg_video_sink_falls_back_to_opencv(tmp_path, video_path: str) -> None:
+    target_path = str(tmp_path / "target.mp4")
+    video_info = VideoInfo.from_video_path(video_path)
+    with pytest.warns(UserWarning):
+        with FFmpegVideoSink(
+            target_path=target_path,
+            video_info=video_info,
+            ffmpeg_path="missing-ffmpeg-executable",
+        ) as sink:
+            for frame in get_video_frames_generator(video_path):
+                sink.write_frame(frame=frame)
+
+    assert _count_frames(target_path) == FRAME_COUNT
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+@pytest.mark.parametrize("queue_size", [0, 4])
+def test_ffmpeg_video_sink(tmp_path, video_path: str, queue_size: int) -> None:
+    target_path = str(tmp_path / "target.mp4")
+    video_info = VideoInfo.from_video_path(video_path)
+    with FFmpegVideoSink(
+        target_path=target_path,
+        video_info=video_info,
+        preset="ultrafast",
+        queue_size=queue_size,
+    ) as sink:
+        for frame in get_video_frames_generator(video_path):
+            sink.write_frame(frame=frame)
+
+    assert _count_frames(target_path) == FRAME_COUNT